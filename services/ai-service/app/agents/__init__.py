@@ -1,6 +1,6 @@
 """AI agents package."""
 
 from app.agents.base_agent import BaseAgent
-from app.agents.moderator import ModeratorAgent, moderator_agent
+from app.agents.moderator import ModeratorAgent, get_moderator_agent
 
-__all__ = ["BaseAgent", "ModeratorAgent", "moderator_agent"]
+__all__ = ["BaseAgent", "ModeratorAgent", "get_moderator_agent"]
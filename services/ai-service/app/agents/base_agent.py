@@ -1,12 +1,13 @@
 """Base agent class for AI agents."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from anthropic import Anthropic
-from openai import OpenAI
+from typing import Any, AsyncIterator, Dict, Optional
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
 from loguru import logger
 
 from app.core.config import settings
+from app.core.http import get_http_client
 from app.models.article import AIProvider
 
 
@@ -34,9 +35,17 @@ class BaseAgent(ABC):
         self.temperature = temperature
         self.max_tokens = max_tokens
 
-        # Initialize clients
-        self.anthropic_client = Anthropic(api_key=settings.anthropic_api_key) if settings.anthropic_api_key else None
-        self.openai_client = OpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else None
+        # Initialize clients on the shared connection pool
+        http_client = get_http_client()
+        self.anthropic_client = AsyncAnthropic(
+            api_key=settings.anthropic_api_key, http_client=http_client
+        ) if settings.anthropic_api_key else None
+        self.openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key, http_client=http_client
+        ) if settings.openai_api_key else None
+
+        # System prompts are static per agent, so build them once
+        self._system_prompt = self.get_system_prompt()
 
         logger.info(f"Initialized {self.name} agent with provider: {self.provider.value}")
 
@@ -50,6 +59,19 @@ class BaseAgent(ABC):
         """
         pass
 
+    def _build_user_message(
+        self,
+        user_message: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Append context data to the user message if provided."""
+        if not context:
+            return user_message
+
+        return "".join(
+            [user_message, "\n\nContext:", *(f"\n- {k}: {v}" for k, v in context.items())]
+        )
+
     async def execute_with_claude(
         self,
         user_message: str,
@@ -71,22 +93,15 @@ class BaseAgent(ABC):
         if not self.anthropic_client:
             raise ValueError("Anthropic API key not configured")
 
-        system_prompt = self.get_system_prompt()
-
-        # Add context to user message if provided
-        if context:
-            context_str = "\n\nContext:\n" + "\n".join(
-                f"- {k}: {v}" for k, v in context.items()
-            )
-            user_message = user_message + context_str
+        user_message = self._build_user_message(user_message, context)
 
         logger.debug(f"{self.name} executing with Claude: {user_message[:100]}...")
 
-        response = self.anthropic_client.messages.create(
+        response = await self.anthropic_client.messages.create(
             model=settings.claude_model,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
-            system=system_prompt,
+            system=self._system_prompt,
             messages=[{"role": "user", "content": user_message}],
         )
 
@@ -116,21 +131,14 @@ class BaseAgent(ABC):
         if not self.openai_client:
             raise ValueError("OpenAI API key not configured")
 
-        system_prompt = self.get_system_prompt()
-
-        # Add context to user message if provided
-        if context:
-            context_str = "\n\nContext:\n" + "\n".join(
-                f"- {k}: {v}" for k, v in context.items()
-            )
-            user_message = user_message + context_str
+        user_message = self._build_user_message(user_message, context)
 
         logger.debug(f"{self.name} executing with OpenAI: {user_message[:100]}...")
 
-        response = self.openai_client.chat.completions.create(
+        response = await self.openai_client.chat.completions.create(
             model=settings.openai_model,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": self._system_prompt},
                 {"role": "user", "content": user_message},
             ],
             max_tokens=self.max_tokens,
@@ -142,6 +150,69 @@ class BaseAgent(ABC):
 
         return result
 
+    async def execute_stream(
+        self,
+        user_message: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Execute agent task with configured provider, yielding text as it streams.
+
+        Closing the iterator early (e.g. via contextlib.aclosing) closes the
+        underlying HTTP stream, which stops further token generation.
+
+        Args:
+            user_message: User message/query
+            context: Additional context data
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            ValueError: If provider is not configured or unsupported
+        """
+        logger.info(f"{self.name} agent streaming task")
+
+        user_message = self._build_user_message(user_message, context)
+
+        if self.provider == AIProvider.CLAUDE:
+            if not self.anthropic_client:
+                raise ValueError("Anthropic API key not configured")
+
+            async with self.anthropic_client.messages.stream(
+                model=settings.claude_model,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                system=self._system_prompt,
+                messages=[{"role": "user", "content": user_message}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        elif self.provider == AIProvider.OPENAI:
+            if not self.openai_client:
+                raise ValueError("OpenAI API key not configured")
+
+            stream = await self.openai_client.chat.completions.create(
+                model=settings.openai_model,
+                messages=[
+                    {"role": "system", "content": self._system_prompt},
+                    {"role": "user", "content": user_message},
+                ],
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                stream=True,
+            )
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.close()
+
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+
     async def execute(
         self,
         user_message: str,
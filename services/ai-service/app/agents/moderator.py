@@ -1,11 +1,16 @@
 """Content moderation agent."""
 
-import json
+import re
 import time
+from contextlib import aclosing
 from typing import Dict, Any
+import orjson
 from loguru import logger
 
 from app.agents.base_agent import BaseAgent
+from app.core.config import settings
+from app.core.json_stream import JsonObjectScanner
+from app.services.semantic_cache import semantic_cache
 from app.models.article import (
     ModerationRequest,
     ModerationResponse,
@@ -15,21 +20,26 @@ from app.models.article import (
 )
 
 
-class ModeratorAgent(BaseAgent):
-    """Agent for content moderation and safety checks."""
+# Optional markdown code fence around the JSON payload
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
 
-    def __init__(self, provider: AIProvider = AIProvider.CLAUDE) -> None:
-        """Initialize moderator agent."""
-        super().__init__(
-            name="Moderator",
-            provider=provider,
-            temperature=0.3,  # Lower temperature for consistent moderation
-            max_tokens=2048,
-        )
+# Risk thresholds (block, review) per strict mode; scores below the block
+# threshold are considered safe
+_RISK_THRESHOLDS = {False: (0.5, 0.2), True: (0.3, 0.1)}
+_ACTIONS = ("block", "review", "allow")
 
-    def get_system_prompt(self) -> str:
-        """Get system prompt for content moderation."""
-        return """You are a content moderation expert. Your task is to analyze content for safety and appropriateness.
+# Parsed result used when the model response is not valid JSON (read-only)
+_FALLBACK_RESPONSE: Dict[str, Any] = {
+    "categories": {
+        cat.value: {"flagged": False, "confidence": 0.5, "explanation": ""}
+        for cat in ModerationCategory
+        if cat != ModerationCategory.SAFE
+    },
+    "overall_risk_score": 0.0,
+    "recommended_action": "review",
+}
+
+MODERATOR_SYSTEM_PROMPT = """You are a content moderation expert. Your task is to analyze content for safety and appropriateness.
 
 Analyze the provided content for the following categories:
 1. hate_speech: Hateful, discriminatory, or prejudiced content
@@ -62,64 +72,50 @@ Respond in JSON format:
 
 Be thorough but fair. Only flag content that clearly violates policies."""
 
+
+class ModeratorAgent(BaseAgent):
+    """Agent for content moderation and safety checks."""
+
+    def __init__(self, provider: AIProvider = AIProvider.CLAUDE) -> None:
+        """Initialize moderator agent."""
+        super().__init__(
+            name="Moderator",
+            provider=provider,
+            temperature=0.3,  # Lower temperature for consistent moderation
+            max_tokens=2048,
+        )
+
+    def get_system_prompt(self) -> str:
+        """Get system prompt for content moderation."""
+        return MODERATOR_SYSTEM_PROMPT
+
     def _parse_moderation_response(self, response: str, strict_mode: bool) -> Dict[str, Any]:
         """Parse moderation response from AI."""
         try:
-            # Try to parse JSON from response
-            # Clean up response if it has markdown code blocks
-            response = response.strip()
-            if response.startswith("```json"):
-                response = response[7:]
-            if response.startswith("```"):
-                response = response[3:]
-            if response.endswith("```"):
-                response = response[:-3]
-            response = response.strip()
-
-            data = json.loads(response)
+            # Strip markdown code fences if present
+            match = _FENCE_RE.match(response)
+            payload = match.group(1) if match else response.strip()
+
+            data = orjson.loads(payload)
             return data
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse moderation response as JSON, using fallback")
             # Fallback: assume safe if we can't parse
-            return {
-                "categories": {
-                    cat.value: {"flagged": False, "confidence": 0.5, "explanation": ""}
-                    for cat in ModerationCategory
-                    if cat != ModerationCategory.SAFE
-                },
-                "overall_risk_score": 0.0,
-                "recommended_action": "review",
-            }
+            return _FALLBACK_RESPONSE
 
     def _calculate_overall_risk(self, categories: Dict[str, Dict[str, Any]]) -> float:
         """Calculate overall risk score from category results."""
-        total_risk = 0.0
-        count = 0
-
-        for category_data in categories.values():
-            if category_data["flagged"]:
-                total_risk += category_data["confidence"]
-            count += 1
+        if not categories:
+            return 0.0
 
-        return total_risk / count if count > 0 else 0.0
+        total_risk = sum(c["confidence"] for c in categories.values() if c["flagged"])
+        return total_risk / len(categories)
 
     def _determine_action(self, risk_score: float, strict_mode: bool) -> str:
         """Determine recommended action based on risk score."""
-        if strict_mode:
-            if risk_score > 0.3:
-                return "block"
-            elif risk_score > 0.1:
-                return "review"
-            else:
-                return "allow"
-        else:
-            if risk_score > 0.5:
-                return "block"
-            elif risk_score > 0.2:
-                return "review"
-            else:
-                return "allow"
+        block, review = _RISK_THRESHOLDS[strict_mode]
+        return _ACTIONS[(risk_score <= block) + (risk_score <= review)]
 
     async def moderate(self, request: ModerationRequest) -> ModerationResponse:
         """
@@ -131,24 +127,55 @@ Be thorough but fair. Only flag content that clearly violates policies."""
         Returns:
             ModerationResponse with safety analysis
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        content_length = len(request.content)
 
-        logger.info(f"Moderating content (strict_mode={request.strict_mode})")
+        logger.info(f"Moderating content (content_length={content_length}, strict_mode={request.strict_mode})")
+
+        # Nothing to moderate in empty or near-empty content
+        if len(request.content.strip()) < settings.min_moderation_chars:
+            return ModerationResponse(
+                is_safe=True,
+                results=[
+                    ModerationResult(
+                        category=ModerationCategory.SAFE,
+                        flagged=False,
+                        confidence=1.0,
+                        explanation="Content too short to moderate",
+                    )
+                ],
+                overall_risk_score=0.0,
+                recommended_action="allow",
+                provider=self.provider,
+                processing_time=(time.perf_counter_ns() - start_ns) / 1e9,
+            )
+
+        # Exact repeats only: a one-word negation can still be a near-duplicate
+        cache_namespace = f"moderate:{self.provider.value}:{request.strict_mode}"
+        cached = await semantic_cache.get(cache_namespace, request.content, ModerationResponse, exact=True)
+        if cached is not None:
+            return semantic_cache.hit(cached, (time.perf_counter_ns() - start_ns) / 1e9)
 
         # Build context
         context = {
             "strict_mode": request.strict_mode,
-            "content_length": len(request.content),
+            "content_length": content_length,
         }
 
-        # Execute moderation
-        response_text = await self.execute(
-            user_message=f"Analyze this content:\n\n{request.content}",
-            context=context,
-        )
+        # Execute moderation, stopping as soon as the JSON verdict is complete
+        scanner = JsonObjectScanner()
+        async with aclosing(
+            self.execute_stream(
+                user_message=f"Analyze this content:\n\n{request.content}",
+                context=context,
+            )
+        ) as chunks:
+            async for chunk in chunks:
+                if scanner.feed(chunk):
+                    break
 
         # Parse response
-        parsed_data = self._parse_moderation_response(response_text, request.strict_mode)
+        parsed_data = self._parse_moderation_response(scanner.text, request.strict_mode)
 
         # Build results
         results = []
@@ -168,17 +195,17 @@ Be thorough but fair. Only flag content that clearly violates policies."""
 
         # Calculate metrics
         overall_risk = self._calculate_overall_risk(parsed_data.get("categories", {}))
-        is_safe = overall_risk < (0.3 if request.strict_mode else 0.5)
+        is_safe = overall_risk < _RISK_THRESHOLDS[request.strict_mode][0]
         recommended_action = self._determine_action(overall_risk, request.strict_mode)
 
-        processing_time = time.time() - start_time
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         logger.info(
             f"Moderation complete: risk_score={overall_risk:.2f}, "
             f"action={recommended_action}, time={processing_time:.2f}s"
         )
 
-        return ModerationResponse(
+        response = ModerationResponse(
             is_safe=is_safe,
             results=results,
             overall_risk_score=overall_risk,
@@ -186,7 +213,20 @@ Be thorough but fair. Only flag content that clearly violates policies."""
             provider=self.provider,
             processing_time=processing_time,
         )
+        # A fallback verdict is not a real one; moderate the content again next time
+        if parsed_data is not _FALLBACK_RESPONSE:
+            await semantic_cache.set(cache_namespace, request.content, response, exact=True)
+
+        return response
+
+
+# Singleton instance
+_moderator = None
 
 
-# Global moderator instance
-moderator_agent = ModeratorAgent()
+def get_moderator_agent() -> ModeratorAgent:
+    """Get or create the moderator agent instance"""
+    global _moderator
+    if _moderator is None:
+        _moderator = ModeratorAgent()
+    return _moderator
@@ -2,11 +2,13 @@
 Credibility Scoring API Endpoints
 """
 
+import hashlib
 from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from app.core.config import settings
 from app.services.credibility_scorer import (
     CredibilityScorer,
     ArticleMetadata,
@@ -97,53 +99,13 @@ async def calculate_credibility(request: CalculateCredibilityRequest):
         scorer = get_credibility_scorer()
 
         # Convert to internal format
-        article = ArticleMetadata(
-            id=request.article.id,
-            title=request.article.title,
-            content=request.article.content,
-            source_name=request.article.source_name,
-            source_type=request.article.source_type,
-            source_bias=request.article.source_bias,
-            source_credibility=request.article.source_credibility,
-            published_at=request.article.published_at,
-            category=request.article.category,
-        )
-
-        related = [
-            ArticleMetadata(
-                id=a.id,
-                title=a.title,
-                content=a.content,
-                source_name=a.source_name,
-                source_type=a.source_type,
-                source_bias=a.source_bias,
-                source_credibility=a.source_credibility,
-                published_at=a.published_at,
-                category=a.category,
-            )
-            for a in request.related_articles
-        ]
+        article = _to_metadata(request.article)
+        related = [_to_metadata(a) for a in request.related_articles]
 
         # Calculate score
         result = await scorer.calculate_credibility(article, related)
 
-        # Determine badge
-        badge = _get_badge(result.score)
-
-        return CredibilityScoreResponse(
-            article_id=request.article.id,
-            score=result.score,
-            confidence=result.confidence,
-            factors=result.factors,
-            similar_articles=result.similar_articles,
-            source_count=result.source_count,
-            source_diversity=result.source_diversity,
-            fact_consistency=result.fact_consistency,
-            verification_status=result.verification_status,
-            explanation=result.explanation,
-            badge_color=badge["color"],
-            badge_text=badge["text"],
-        )
+        return _build_response(request.article.id, result)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -164,54 +126,36 @@ async def batch_calculate_credibility(
         scorer = get_credibility_scorer()
 
         # Convert all articles
-        articles = [
-            ArticleMetadata(
-                id=a.id,
-                title=a.title,
-                content=a.content,
-                source_name=a.source_name,
-                source_type=a.source_type,
-                source_bias=a.source_bias,
-                source_credibility=a.source_credibility,
-                published_at=a.published_at,
-                category=a.category,
-            )
+        articles = [_to_metadata(a) for a in request.articles]
+
+        # Identical articles (e.g. re-ingested feed items) are scored once
+        keys = [
+            hashlib.blake2b(a.model_dump_json().encode(), digest_size=16).digest()
             for a in request.articles
         ]
+        first_index: Dict[bytes, int] = {}
+        for i, key in enumerate(keys):
+            first_index.setdefault(key, i)
+
+        # Embeddings, similarities and time windows are computed once for the
+        # whole batch; fact checks for several articles share one Claude call
+        unique_results = await scorer.score_batch(
+            [articles[i] for i in first_index.values()],
+            concurrency=settings.max_concurrent_llm,
+        )
+        results_by_key = dict(zip(first_index, unique_results))
 
         scores = []
         failed = 0
 
-        for article in articles:
-            try:
-                # Compare against all other articles
-                other_articles = [a for a in articles if a.id != article.id]
-
-                result = await scorer.calculate_credibility(article, other_articles)
-
-                badge = _get_badge(result.score)
-
-                scores.append(
-                    CredibilityScoreResponse(
-                        article_id=article.id,
-                        score=result.score,
-                        confidence=result.confidence,
-                        factors=result.factors,
-                        similar_articles=result.similar_articles,
-                        source_count=result.source_count,
-                        source_diversity=result.source_diversity,
-                        fact_consistency=result.fact_consistency,
-                        verification_status=result.verification_status,
-                        explanation=result.explanation,
-                        badge_color=badge["color"],
-                        badge_text=badge["text"],
-                    )
-                )
-
-            except Exception as e:
+        for article, key in zip(articles, keys):
+            result = results_by_key[key]
+            if isinstance(result, Exception):
                 failed += 1
                 continue
 
+            scores.append(_build_response(article.id, result))
+
         return BatchScoreResponse(
             scores=scores, processed=len(scores), failed=failed
         )
@@ -231,34 +175,57 @@ async def get_badge(score: float):
     return _get_badge(score)
 
 
-def _get_badge(score: float) -> dict:
-    """Determine badge color and text based on score"""
-
-    if score >= 90:
-        return {
-            "color": "green",
-            "text": "Verified",
-            "icon": "✓",
-            "description": "Highly credible - verified by multiple sources",
-        }
-    elif score >= 70:
-        return {
-            "color": "blue",
-            "text": "Credible",
-            "icon": "✓",
-            "description": "Credible - covered by reputable sources",
-        }
-    elif score >= 50:
-        return {
-            "color": "yellow",
-            "text": "Unverified",
-            "icon": "!",
-            "description": "Unverified - limited cross-verification",
-        }
-    else:
-        return {
-            "color": "red",
-            "text": "Questionable",
-            "icon": "⚠",
-            "description": "Questionable - verify before sharing",
+def _to_metadata(article: ArticleInput) -> ArticleMetadata:
+    """Convert a validated API article into scorer metadata"""
+
+    return ArticleMetadata(**vars(article))
+
+
+def _build_response(article_id: str, result: CredibilityScore) -> CredibilityScoreResponse:
+    """Build API response from a credibility score result"""
+
+    badge = _get_badge(result.score)
+
+    return CredibilityScoreResponse.model_validate(
+        {
+            **vars(result),
+            "article_id": article_id,
+            "badge_color": badge["color"],
+            "badge_text": badge["text"],
         }
+    )
+
+
+# Badges ordered by the number of score thresholds (50, 70, 90) reached
+_BADGES = (
+    {
+        "color": "red",
+        "text": "Questionable",
+        "icon": "⚠",
+        "description": "Questionable - verify before sharing",
+    },
+    {
+        "color": "yellow",
+        "text": "Unverified",
+        "icon": "!",
+        "description": "Unverified - limited cross-verification",
+    },
+    {
+        "color": "blue",
+        "text": "Credible",
+        "icon": "✓",
+        "description": "Credible - covered by reputable sources",
+    },
+    {
+        "color": "green",
+        "text": "Verified",
+        "icon": "✓",
+        "description": "Highly credible - verified by multiple sources",
+    },
+)
+
+
+def _get_badge(score: float) -> dict:
+    """Determine badge color and text based on score (shared dict, do not mutate)"""
+
+    return _BADGES[(score >= 50) + (score >= 70) + (score >= 90)]
@@ -3,12 +3,13 @@
 from fastapi import APIRouter, HTTPException, status
 from loguru import logger
 
+from app.core.config import settings
 from app.models.article import (
     ModerationRequest,
     ModerationResponse,
     ErrorResponse,
 )
-from app.agents.moderator import moderator_agent
+from app.agents.moderator import get_moderator_agent
 
 router = APIRouter(prefix="/moderate", tags=["moderation"])
 
@@ -20,6 +21,7 @@ router = APIRouter(prefix="/moderate", tags=["moderation"])
     responses={
         400: {"model": ErrorResponse, "description": "Bad request"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
+        503: {"model": ErrorResponse, "description": "Provider not configured"},
     },
     summary="Moderate content",
     description="Analyze content for safety and appropriateness using AI moderation",
@@ -44,15 +46,20 @@ async def moderate_content(request: ModerationRequest) -> ModerationResponse:
         ModerationResponse with safety analysis and recommendations
 
     Raises:
-        HTTPException: If moderation fails
+        HTTPException: If the provider is not configured or moderation fails
     """
-    try:
-        logger.info(
-            f"Moderation request: content_length={len(request.content)}, "
-            f"strict_mode={request.strict_mode}"
+    agent = get_moderator_agent()
+    # Near-empty content is answered without a provider call
+    needs_provider = len(request.content.strip()) >= settings.min_moderation_chars
+    if needs_provider and not settings.provider_configured(agent.provider.value):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Provider not configured: {agent.provider.value}",
         )
 
-        response = await moderator_agent.moderate(request)
+    try:
+        # The agent logs the request, with the content length it computes
+        response = await agent.moderate(request)
 
         logger.info(
             f"Moderation complete: is_safe={response.is_safe}, "
@@ -1,22 +1,37 @@
 """Summarization API endpoints."""
 
-from typing import Dict, Any
+import hashlib
+from typing import Any, AsyncIterator, Dict
+import orjson
 from fastapi import APIRouter, HTTPException, BackgroundTasks, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
+from app.core.config import settings
 from app.models.article import (
     SummarizeRequest,
     SummarizeResponse,
     TaskResponse,
     TaskStatus,
     ErrorResponse,
+    AIProvider,
 )
 from app.services.summarizer import summarizer_service
+from app.services.llm_batch import llm_batch_service
 from app.tasks.summarize_task import process_summarization_task
 
 router = APIRouter(prefix="/summarize", tags=["summarization"])
 
 
+def _require_provider(request: SummarizeRequest) -> None:
+    """Fail fast with 503 when the requested provider has no API key."""
+    if not settings.provider_configured(request.provider.value):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Provider not configured: {request.provider.value}",
+        )
+
+
 @router.post(
     "",
     response_model=SummarizeResponse,
@@ -24,6 +39,7 @@ router = APIRouter(prefix="/summarize", tags=["summarization"])
     responses={
         400: {"model": ErrorResponse, "description": "Bad request"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
+        503: {"model": ErrorResponse, "description": "Provider not configured"},
     },
     summary="Summarize article",
     description="Synchronously summarize an article using AI (Claude or OpenAI)",
@@ -42,8 +58,11 @@ async def summarize_article(request: SummarizeRequest) -> SummarizeResponse:
         SummarizeResponse with summary, key points, and metadata
 
     Raises:
-        HTTPException: If summarization fails
+        HTTPException: If the provider is not configured or summarization fails
     """
+    # Races use whichever providers are configured
+    if not request.race:
+        _require_provider(request)
     try:
         logger.info(
             f"Summarization request: provider={request.provider.value}, "
@@ -69,6 +88,61 @@ async def summarize_article(request: SummarizeRequest) -> SummarizeResponse:
         )
 
 
+@router.post(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Summarize article with streaming",
+    description="Summarize an article and stream the summary as NDJSON while it is generated",
+)
+async def summarize_article_stream(request: SummarizeRequest) -> StreamingResponse:
+    """
+    Summarize an article, streaming the summary as it is generated.
+
+    The response is NDJSON. ``{"event": "summary", "text": ...}`` lines carry
+    new summary text as soon as the model produces it; a final
+    ``{"event": "done", ...}`` line carries the full SummarizeResponse
+    fields, including key points and category. If summarization fails
+    after the stream has started, the last line is
+    ``{"event": "error", "error": ...}``.
+
+    Args:
+        request: Summarization request with article content and parameters
+
+    Returns:
+        NDJSON stream of summary events
+
+    Raises:
+        HTTPException: If race is requested or the provider is not configured
+    """
+    if request.race:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="race is not supported for streaming summaries",
+        )
+    _require_provider(request)
+    logger.info(
+        f"Streaming summarization request: provider={request.provider.value}, "
+        f"length={request.length.value}, content_length={len(request.article.content)}"
+    )
+
+    # Identity encoding keeps GZipMiddleware from buffering lines
+    return StreamingResponse(
+        _stream_summary(request),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "identity"},
+    )
+
+
+async def _stream_summary(request: SummarizeRequest) -> AsyncIterator[bytes]:
+    """Yield NDJSON lines for a streamed summary."""
+    try:
+        async for event in summarizer_service.summarize_stream(request):
+            yield orjson.dumps(event) + b"\n"
+    except Exception as e:
+        logger.error(f"Streaming summarization error: {e}")
+        yield orjson.dumps({"event": "error", "error": str(e)}) + b"\n"
+
+
 @router.post(
     "/async",
     response_model=TaskResponse,
@@ -107,7 +181,7 @@ async def summarize_article_async(
         )
 
         # Queue the task using Celery
-        task = process_summarization_task.delay(request.dict())
+        task = process_summarization_task.delay(request.model_dump(mode="json"))
 
         logger.info(f"Summarization task queued: {task.id}")
 
@@ -187,37 +261,115 @@ async def get_task_status(task_id: str) -> Dict[str, Any]:
     summary="Batch summarize articles",
     description="Submit multiple articles for batch summarization",
 )
-async def batch_summarize(requests: list[SummarizeRequest]) -> Dict[str, Any]:
+async def batch_summarize(
+    requests: list[SummarizeRequest],
+    use_batch_api: bool = False,
+) -> Dict[str, Any]:
     """
     Submit multiple articles for batch summarization.
 
+    By default each article is queued as a Celery task. With ``use_batch_api``
+    the whole batch is submitted to the provider's Batch API instead, which
+    is cheaper but may take up to 24 hours; poll ``/batch/{batch_id}`` for
+    results. All requests must then share the same provider.
+
     Args:
         requests: List of summarization requests
+        use_batch_api: Submit through the provider Batch API
+
+    Identical requests are queued or submitted once. In the Celery path they
+    share a task ID; Batch API results are returned once per request, in
+    request order.
 
     Returns:
-        Dict with batch task IDs
+        Dict with batch task IDs or provider batch ID
 
     Raises:
         HTTPException: If batch submission fails
     """
     try:
-        logger.info(f"Batch summarization: {len(requests)} articles")
+        logger.info(f"Batch summarization: {len(requests)} articles (batch_api={use_batch_api})")
+
+        if use_batch_api:
+            providers = {req.provider for req in requests}
+            if len(providers) != 1:
+                raise ValueError("Batch API submissions require a single provider")
+            provider = providers.pop()
+
+            batch_id = await llm_batch_service.submit_summaries(requests, provider)
+
+            return {
+                "batch_id": batch_id,
+                "provider": provider.value,
+                "total": len(requests),
+                "status": "pending",
+            }
 
+        # Identical requests share a single task
         task_ids = []
+        task_ids_by_key: Dict[bytes, str] = {}
         for req in requests:
-            task = process_summarization_task.delay(req.dict())
-            task_ids.append(task.id)
+            key = hashlib.blake2b(req.model_dump_json().encode(), digest_size=16).digest()
+            if key not in task_ids_by_key:
+                task = process_summarization_task.delay(req.model_dump(mode="json"))
+                task_ids_by_key[key] = task.id
+            task_ids.append(task_ids_by_key[key])
 
         return {
             "batch_id": f"batch_{task_ids[0][:8]}",
             "task_ids": task_ids,
             "total": len(task_ids),
+            "unique": len(task_ids_by_key),
             "status": "pending",
         }
 
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         logger.error(f"Batch submission error: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to submit batch: {str(e)}",
         )
+
+
+@router.get(
+    "/batch/{batch_id}",
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"model": ErrorResponse, "description": "Batch not found"},
+    },
+    summary="Check batch status",
+    description="Check the status of a provider Batch API summarization job",
+)
+async def get_batch_status(
+    batch_id: str,
+    provider: AIProvider = AIProvider.CLAUDE,
+) -> Dict[str, Any]:
+    """
+    Check the status of a provider Batch API summarization job.
+
+    Args:
+        batch_id: Provider batch ID returned from the batch endpoint
+        provider: AI provider the batch was submitted to
+
+    Returns:
+        Dict with batch status and parsed results (if ended)
+
+    Raises:
+        HTTPException: If batch not found
+    """
+    try:
+        return await llm_batch_service.retrieve(batch_id, provider)
+
+    except Exception as e:
+        logger.error(f"Error checking batch status: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch not found: {batch_id}",
+        )
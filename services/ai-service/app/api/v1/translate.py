@@ -1,19 +1,66 @@
 """Translation API endpoints."""
 
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+import hashlib
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Union
+import orjson
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 from loguru import logger
 
+from app.core.config import settings
 from app.models.article import (
     TranslateRequest,
     TranslateResponse,
+    TaskResponse,
+    TaskStatus,
     ErrorResponse,
-    LanguageCode,
 )
 from app.services.translator import translator_service
+from app.services.language_detector import language_detector
+from app.tasks.translate_task import batch_translation_task
 
 router = APIRouter(prefix="/translate", tags=["translation"])
 
+# Supported language catalog, built once at import
+_LANGUAGES = {
+    "en": "English",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "ja": "Japanese",
+    "zh": "Chinese",
+    "ko": "Korean",
+    "ru": "Russian",
+}
+_LANGUAGE_CODES = tuple(_LANGUAGES)
+_LANGUAGES_RESPONSE: Dict[str, Any] = {
+    "languages": _LANGUAGES,
+    "total": len(_LANGUAGES),
+    "codes": list(_LANGUAGE_CODES),
+}
+# The catalog never changes at runtime, so its body and validator are fixed
+_LANGUAGES_BYTES = orjson.dumps(_LANGUAGES_RESPONSE)
+_LANGUAGES_ETAG = f'W/"{hashlib.blake2s(_LANGUAGES_BYTES).hexdigest()[:16]}"'
+
+# Validator for batch bodies, built once
+_BATCH_ADAPTER = TypeAdapter(list[TranslateRequest])
+
+
+def _require_provider(request: TranslateRequest) -> None:
+    """Fail fast with 503 when a translation needs a provider with no API key."""
+    if request.source_language == request.target_language:
+        return
+    if not settings.provider_configured(request.provider.value):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Provider not configured: {request.provider.value}",
+        )
+
 
 @router.post(
     "",
@@ -22,6 +69,7 @@ router = APIRouter(prefix="/translate", tags=["translation"])
     responses={
         400: {"model": ErrorResponse, "description": "Bad request"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
+        503: {"model": ErrorResponse, "description": "Provider not configured"},
     },
     summary="Translate text",
     description="Translate text from one language to another using AI (Claude or OpenAI)",
@@ -40,36 +88,84 @@ async def translate_text(request: TranslateRequest) -> TranslateResponse:
         TranslateResponse with translated content and metadata
 
     Raises:
-        HTTPException: If translation fails
+        HTTPException: If the provider is not configured or translation fails
     """
+    _require_provider(request)
+    target = request.target_language.value
     try:
         logger.info(
-            f"Translation request: target={request.target_language.value}, "
-            f"provider={request.provider.value}, content_length={len(request.content)}"
+            "Translation request: target={}, provider={}, content_length={}",
+            target, request.provider.value, len(request.content),
         )
 
         response = await translator_service.translate(request)
 
-        logger.info(
-            f"Translation successful: {response.source_language.value} -> "
-            f"{response.target_language.value}"
-        )
+        logger.info("Translation successful: {} -> {}", response.source_language.value, target)
         return response
 
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: {}", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
     except Exception as e:
-        logger.error(f"Translation error: {e}")
+        logger.error("Translation error: {}", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to translate text: {str(e)}",
         )
 
 
+@router.post(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Translate text with streaming",
+    description="Translate text and stream the translation as NDJSON while it is generated",
+)
+async def translate_text_stream(request: TranslateRequest) -> StreamingResponse:
+    """
+    Translate text, streaming the translation as it is generated.
+
+    The response is NDJSON. ``{"event": "translation", "text": ...}`` lines
+    carry new translated text as soon as the model produces it; a final
+    ``{"event": "done", ...}`` line carries the full TranslateResponse
+    fields. If translation fails after the stream has started, the last
+    line is ``{"event": "error", "error": ...}``.
+
+    Args:
+        request: Translation request with content and language parameters
+
+    Returns:
+        NDJSON stream of translation events
+
+    Raises:
+        HTTPException: If the provider is not configured
+    """
+    _require_provider(request)
+    logger.info(
+        "Streaming translation request: target={}, provider={}, content_length={}",
+        request.target_language.value, request.provider.value, len(request.content),
+    )
+
+    # Identity encoding keeps GZipMiddleware from buffering lines
+    return StreamingResponse(
+        _stream_translation(request),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "identity"},
+    )
+
+
+async def _stream_translation(request: TranslateRequest) -> AsyncIterator[bytes]:
+    """Yield NDJSON lines for a streamed translation."""
+    try:
+        async for event in translator_service.translate_stream(request):
+            yield orjson.dumps(event) + b"\n"
+    except Exception as e:
+        logger.error("Streaming translation error: {}", e)
+        yield orjson.dumps({"event": "error", "error": str(e)}) + b"\n"
+
+
 @router.get(
     "/languages",
     response_model=Dict[str, Any],
@@ -77,31 +173,26 @@ async def translate_text(request: TranslateRequest) -> TranslateResponse:
     summary="List supported languages",
     description="Get list of supported languages for translation",
 )
-async def list_languages() -> Dict[str, Any]:
+async def list_languages(request: Request) -> Response:
     """
     Get list of supported languages.
 
+    The body is serialized once at import and carries a weak ETag; a
+    matching If-None-Match gets an empty 304.
+
+    Args:
+        request: Incoming request, for its If-None-Match header
+
     Returns:
-        Dict with supported language codes and names
+        JSON body with supported language codes and names, or 304
     """
-    languages = {
-        "en": "English",
-        "es": "Spanish",
-        "fr": "French",
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-        "ja": "Japanese",
-        "zh": "Chinese",
-        "ko": "Korean",
-        "ru": "Russian",
-    }
-
-    return {
-        "languages": languages,
-        "total": len(languages),
-        "codes": list(languages.keys()),
-    }
+    if request.headers.get("if-none-match") == _LANGUAGES_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": _LANGUAGES_ETAG})
+    return Response(
+        content=_LANGUAGES_BYTES,
+        media_type="application/json",
+        headers={"ETag": _LANGUAGES_ETAG},
+    )
 
 
 @router.post(
@@ -115,8 +206,8 @@ async def detect_language(content: str) -> Dict[str, Any]:
     """
     Detect the language of provided text.
 
-    Note: This is a simple implementation. In production, use a dedicated
-    language detection library like langdetect or fasttext.
+    Uses the in-process fastText model; defaults to English with zero
+    confidence when the model is not available.
 
     Args:
         content: Text to analyze
@@ -125,21 +216,18 @@ async def detect_language(content: str) -> Dict[str, Any]:
         Dict with detected language code and confidence
     """
     try:
-        # Simple heuristic - in production use proper language detection
-        # For now, default to English
-        detected_language = LanguageCode.EN
-        confidence = 0.8
+        detected_language, confidence = await language_detector.detect(content)
 
-        logger.info(f"Language detection: {detected_language.value} (confidence: {confidence})")
+        logger.info("Language detection: {} (confidence: {:.2f})", detected_language, confidence)
 
         return {
-            "language": detected_language.value,
+            "language": detected_language,
             "confidence": confidence,
             "text_length": len(content),
         }
 
     except Exception as e:
-        logger.error(f"Language detection error: {e}")
+        logger.error("Language detection error: {}", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to detect language: {str(e)}",
@@ -151,35 +239,195 @@ async def detect_language(content: str) -> Dict[str, Any]:
     response_model=list[TranslateResponse],
     status_code=status.HTTP_200_OK,
     summary="Batch translate",
-    description="Translate multiple texts in a single request",
+    description="Translate multiple texts in a single request (stream=true for NDJSON results)",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": {"$ref": "#/components/schemas/TranslateRequest"}}
+                }
+            },
+        }
+    },
 )
-async def batch_translate(requests: list[TranslateRequest]) -> list[TranslateResponse]:
+async def batch_translate(
+    http_request: Request,
+    stream: bool = False,
+) -> Union[list[TranslateResponse], StreamingResponse]:
     """
     Translate multiple texts in a single request.
 
+    The body is validated straight from JSON bytes in one pass, and
+    translations run concurrently, bounded by MAX_CONCURRENT_LLM.
+
+    With ``stream=true`` the response is NDJSON: one line per item, written
+    as soon as that item finishes, in completion order. Each line carries
+    the item's ``index`` in the request plus either the TranslateResponse
+    fields or an ``error`` message.
+
     Args:
-        requests: List of translation requests
+        http_request: Request whose body is a JSON list of translation requests
+        stream: Stream results as NDJSON instead of returning a list
 
     Returns:
-        List of translation responses
+        List of translation responses, or an NDJSON stream
 
     Raises:
+        RequestValidationError: If the body is not a valid request list
         HTTPException: If batch translation fails
     """
     try:
-        logger.info(f"Batch translation: {len(requests)} texts")
+        requests = _BATCH_ADAPTER.validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+    logger.info("Batch translation: {} texts (stream={})", len(requests), stream)
+
+    if stream:
+        semaphore = asyncio.Semaphore(settings.max_concurrent_llm)
+
+        async def translate_one(req: TranslateRequest) -> TranslateResponse:
+            async with semaphore:
+                return await translator_service.translate(req)
 
-        responses = []
-        for req in requests:
-            response = await translator_service.translate(req)
-            responses.append(response)
+        # Identity encoding keeps GZipMiddleware from buffering lines
+        return StreamingResponse(
+            _stream_translations(requests, translate_one),
+            media_type="application/x-ndjson",
+            headers={"Content-Encoding": "identity"},
+        )
 
-        logger.info(f"Batch translation complete: {len(responses)} translations")
+    try:
+        # Let every translation settle before failing the batch so no call is
+        # left running unobserved
+        responses = await translator_service.translate_batch(requests)
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+
+        logger.info("Batch translation complete: {} translations", len(responses))
         return responses
 
     except Exception as e:
-        logger.error(f"Batch translation error: {e}")
+        logger.error("Batch translation error: {}", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process batch translation: {str(e)}",
         )
+
+
+async def _stream_translations(
+    requests: list[TranslateRequest],
+    translate_one: Callable[[TranslateRequest], Awaitable[TranslateResponse]],
+) -> AsyncIterator[bytes]:
+    """Yield NDJSON lines for batch items in completion order."""
+
+    async def run(index: int, req: TranslateRequest) -> Dict[str, Any]:
+        try:
+            response = await translate_one(req)
+            return {"index": index, **response.model_dump(mode="json")}
+        except Exception as e:
+            logger.error("Batch translation item {} failed: {}", index, e)
+            return {"index": index, "error": str(e)}
+
+    tasks = [asyncio.create_task(run(i, req)) for i, req in enumerate(requests)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield orjson.dumps(await next_done) + b"\n"
+    finally:
+        # Client disconnected early; stop outstanding provider calls
+        for task in tasks:
+            task.cancel()
+
+
+@router.post(
+    "/batch/async",
+    response_model=TaskResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Batch translate asynchronously",
+    description="Queue a batch translation on a Celery worker and return a task ID",
+)
+async def batch_translate_async(requests: list[TranslateRequest]) -> TaskResponse:
+    """
+    Queue a batch translation as a background task.
+
+    The HTTP worker returns immediately; a Celery worker translates the
+    batch, combining short texts with the same options into shared provider
+    calls. Poll ``GET /translate/batch/{task_id}`` for the result.
+
+    Args:
+        requests: List of translation requests
+
+    Returns:
+        TaskResponse with task ID and status
+
+    Raises:
+        HTTPException: If task submission fails
+    """
+    try:
+        task = batch_translation_task.delay([req.model_dump(mode="json") for req in requests])
+
+        logger.info("Batch translation task queued: {} ({} texts)", task.id, len(requests))
+
+        return TaskResponse(
+            task_id=task.id,
+            status=TaskStatus.PENDING,
+        )
+
+    except Exception as e:
+        logger.error("Task submission error: {}", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to submit batch translation task: {str(e)}",
+        )
+
+
+@router.get(
+    "/batch/{task_id}",
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"model": ErrorResponse, "description": "Task not found"},
+    },
+    summary="Check batch translation status",
+    description="Check the status of an asynchronous batch translation",
+)
+async def get_batch_translate_status(task_id: str) -> Dict[str, Any]:
+    """
+    Check the status of an asynchronous batch translation.
+
+    Args:
+        task_id: Task ID returned from the async batch endpoint
+
+    Returns:
+        Dict with task status and result (if completed)
+
+    Raises:
+        HTTPException: If task not found
+    """
+    try:
+        result = batch_translation_task.AsyncResult(task_id)
+
+        response = {
+            "task_id": task_id,
+            "status": result.status.lower(),
+            "ready": result.ready(),
+        }
+
+        if result.ready():
+            if result.successful():
+                response["result"] = result.result
+            else:
+                response["error"] = str(result.result)
+
+        return response
+
+    except Exception as e:
+        logger.error("Error checking task status: {}", e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task not found: {task_id}",
+        )
@@ -1,5 +1,7 @@
 """Application configuration settings."""
 
+import os
+from functools import cached_property
 from typing import List
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,7 +14,8 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True,
     )
 
     # API Configuration
@@ -24,6 +27,11 @@ class Settings(BaseSettings):
     # Server Configuration
     host: str = Field(default="0.0.0.0", alias="HOST")
     port: int = Field(default=8000, alias="PORT")
+    workers: int = Field(default_factory=lambda: os.cpu_count() or 1, alias="WORKERS")
+    limit_concurrency: int = Field(default=1000, alias="LIMIT_CONCURRENCY")
+    timeout_keep_alive: int = Field(default=30, alias="TIMEOUT_KEEP_ALIVE")
+    gzip_minimum_size: int = Field(default=4096, alias="GZIP_MINIMUM_SIZE")
+    gzip_compresslevel: int = Field(default=6, alias="GZIP_COMPRESSLEVEL")
 
     # AI API Keys
     anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
@@ -36,6 +44,7 @@ class Settings(BaseSettings):
     gemini_model: str = Field(default="gemini-2.0-flash", alias="GEMINI_MODEL")
     max_tokens: int = Field(default=4096, alias="MAX_TOKENS")
     temperature: float = Field(default=0.7, alias="TEMPERATURE")
+    summary_max_input_tokens: int = Field(default=8000, alias="SUMMARY_MAX_INPUT_TOKENS")
 
     # Celery Configuration
     celery_broker_url: str = Field(default="redis://localhost:6379/0", alias="CELERY_BROKER_URL")
@@ -61,9 +70,51 @@ class Settings(BaseSettings):
     retry_min_wait: int = Field(default=1, alias="RETRY_MIN_WAIT")
     retry_max_wait: int = Field(default=10, alias="RETRY_MAX_WAIT")
 
-    @property
+    # Moderation Configuration
+    min_moderation_chars: int = Field(default=3, alias="MIN_MODERATION_CHARS")
+
+    # Semantic Cache Configuration
+    semantic_cache_enabled: bool = Field(default=False, alias="SEMANTIC_CACHE_ENABLED")
+    semantic_cache_threshold: float = Field(default=0.95, alias="SEMANTIC_CACHE_THRESHOLD")
+    semantic_cache_dimensions: int = Field(default=512, alias="SEMANTIC_CACHE_DIMENSIONS")
+    semantic_cache_ttl: int = Field(default=86400, alias="SEMANTIC_CACHE_TTL")
+    embedding_model: str = Field(default="text-embedding-3-small", alias="EMBEDDING_MODEL")
+
+    # Language Detection Configuration
+    language_model_path: str = Field(default="models/lid.176.ftz", alias="LANGUAGE_MODEL_PATH")
+
+    # Translation Cache Configuration
+    translation_cache_enabled: bool = Field(default=True, alias="TRANSLATION_CACHE_ENABLED")
+    translation_cache_ttl: int = Field(default=604800, alias="TRANSLATION_CACHE_TTL")
+    translation_cache_size: int = Field(default=2048, alias="TRANSLATION_CACHE_SIZE")
+
+    # Summary Cache Configuration
+    summary_cache_enabled: bool = Field(default=True, alias="SUMMARY_CACHE_ENABLED")
+    summary_cache_ttl: int = Field(default=86400, alias="SUMMARY_CACHE_TTL")
+    summary_cache_size: int = Field(default=1024, alias="SUMMARY_CACHE_SIZE")
+
+    # Concurrency Configuration
+    max_concurrent_llm: int = Field(default=32, alias="MAX_CONCURRENT_LLM")
+    claude_max_concurrent: int = Field(default=20, alias="CLAUDE_MAX_CONCURRENT")
+    openai_max_concurrent: int = Field(default=20, alias="OPENAI_MAX_CONCURRENT")
+    gemini_max_concurrent: int = Field(default=20, alias="GEMINI_MAX_CONCURRENT")
+    claude_tokens_per_minute: int = Field(default=0, alias="CLAUDE_TOKENS_PER_MINUTE")
+    openai_tokens_per_minute: int = Field(default=0, alias="OPENAI_TOKENS_PER_MINUTE")
+    gemini_tokens_per_minute: int = Field(default=0, alias="GEMINI_TOKENS_PER_MINUTE")
+    http_max_connections: int = Field(default=256, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=64, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+
+    def provider_configured(self, provider: str) -> bool:
+        """Whether an API key is set for a provider ("claude", "openai" or "gemini")."""
+        return bool({
+            "claude": self.anthropic_api_key,
+            "openai": self.openai_api_key,
+            "gemini": self.gemini_api_key,
+        }.get(provider))
+
+    @cached_property
     def redis_url(self) -> str:
-        """Get Redis URL."""
+        """Get Redis URL (computed once; settings are immutable)."""
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
 
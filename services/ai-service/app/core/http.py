@@ -0,0 +1,42 @@
+"""Shared HTTP client for AI provider SDKs."""
+
+from typing import Optional
+import httpx
+
+from app.core.config import settings
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client.
+
+    Provider SDK clients are built on top of this single connection pool so
+    that TLS sessions and HTTP/2 connections are reused across agents and
+    services instead of each SDK instance holding its own pool.
+
+    Returns:
+        Pooled async HTTP client
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+            ),
+            # Waiting for a free pooled connection fails fast instead of
+            # silently queueing behind the read timeout
+            timeout=httpx.Timeout(60.0, connect=5.0, write=10.0, pool=5.0),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
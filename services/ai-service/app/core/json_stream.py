@@ -0,0 +1,76 @@
+"""Incremental JSON detection for streamed LLM output."""
+
+from typing import List
+
+
+class JsonObjectScanner:
+    """
+    Track streamed text until the first top-level JSON object is complete.
+
+    Models often wrap JSON in markdown fences or follow it with commentary.
+    Feeding chunks as they arrive lets callers stop consuming the stream as
+    soon as the closing brace is seen instead of waiting for the final token.
+    """
+
+    def __init__(self) -> None:
+        """Initialize scanner state."""
+        self._chunks: List[str] = []
+        self._length = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start = -1
+        self._end = -1
+
+    @property
+    def complete(self) -> bool:
+        """Whether a full top-level object has been seen."""
+        return self._end >= 0
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of model output
+
+        Returns:
+            True once the first top-level JSON object is complete
+        """
+        if self.complete:
+            return True
+
+        offset = self._length
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+
+        for i, char in enumerate(chunk):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._depth > 0:
+                    self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._start = offset + i
+                self._depth += 1
+            elif char == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end = offset + i + 1
+                    return True
+
+        return False
+
+    @property
+    def text(self) -> str:
+        """The JSON object if complete, otherwise all text received so far."""
+        text = "".join(self._chunks)
+        if self.complete:
+            return text[self._start:self._end]
+        return text
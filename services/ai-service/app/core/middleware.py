@@ -0,0 +1,69 @@
+"""ASGI middleware and endpoints for the AI service."""
+
+import time
+from typing import FrozenSet
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ProcessTimeMiddleware:
+    """
+    Add an X-Process-Time header with the request duration in seconds.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware, which runs
+    every request through an extra task group and response wrapper. Probe
+    and root paths are passed straight through without timing.
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: FrozenSet[str] = frozenset()) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Downstream ASGI application
+            skip_paths: Request paths that are not timed
+        """
+        self.app = app
+        self.skip_paths = skip_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+
+        async def send_with_header(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{elapsed:.6f}".encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_header)
+
+
+class StaticJSONEndpoint:
+    """
+    Serve a fixed, pre-serialized JSON body.
+
+    Mounted with a plain Starlette Route, so requests skip FastAPI's
+    dependency resolution, validation and response encoding entirely.
+    """
+
+    def __init__(self, body: bytes) -> None:
+        """
+        Initialize the endpoint.
+
+        Args:
+            body: JSON response body
+        """
+        self.body = body
+        self.headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        await send({"type": "http.response.body", "body": self.body})
@@ -0,0 +1,93 @@
+"""Proactive token-bucket rate limiting for AI provider calls."""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.models.article import AIProvider
+
+# Rough characters per token used to estimate prompt size
+CHARS_PER_TOKEN = 4
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket refilled continuously at a fixed rate.
+
+    Callers wait for capacity before sending a request instead of sending it
+    and backing off after a 429. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute
+            capacity: Maximum tokens held (default: one minute's worth)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Wait until the bucket holds enough tokens, then take them.
+
+        Requests larger than the capacity wait for a full bucket.
+
+        Args:
+            amount: Tokens to take
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+
+
+_provider_buckets: Optional[Dict[AIProvider, AsyncTokenBucket]] = None
+
+
+def get_provider_bucket(provider: AIProvider) -> Optional[AsyncTokenBucket]:
+    """
+    Get the input-token bucket shared by all calls to a provider.
+
+    Args:
+        provider: AI provider
+
+    Returns:
+        Token bucket, or None when the provider has no configured limit
+    """
+    global _provider_buckets
+    if _provider_buckets is None:
+        limits = {
+            AIProvider.CLAUDE: settings.claude_tokens_per_minute,
+            AIProvider.OPENAI: settings.openai_tokens_per_minute,
+            AIProvider.GEMINI: settings.gemini_tokens_per_minute,
+        }
+        _provider_buckets = {
+            p: AsyncTokenBucket(limit) for p, limit in limits.items() if limit > 0
+        }
+    return _provider_buckets.get(provider)
+
+
+async def throttle(provider: AIProvider, *prompts: str) -> None:
+    """
+    Wait until a provider's token budget allows a request with these prompts.
+
+    Args:
+        provider: AI provider about to be called
+        prompts: Prompt texts sent with the request
+    """
+    bucket = get_provider_bucket(provider)
+    if bucket is not None:
+        await bucket.acquire(sum(len(p) for p in prompts) / CHARS_PER_TOKEN)
@@ -1,18 +1,28 @@
 """FastAPI AI Service main application."""
 
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any
+from typing import AsyncIterator
+import asyncio
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from starlette.routing import Route
 from loguru import logger
+from datetime import datetime
+import orjson
 import sys
-import time
 
 from app.core.config import settings
+from app.core.http import get_http_client, close_http_client
+from app.core.middleware import ProcessTimeMiddleware, StaticJSONEndpoint
+from app.services.translation_cache import translation_cache
+from app.services.summary_cache import summary_cache
+from app.services.llm_batch import llm_batch_service
+from app.services.semantic_cache import semantic_cache
+from app.services.language_detector import language_detector
+from app.services.summarizer import load_tokenizer
 from app.api.v1 import summarize, translate, moderate, credibility
-from app.models.article import ErrorResponse
 
 
 # Configure logging
@@ -21,6 +31,10 @@ logger.add(
     sys.stderr,
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     level="INFO" if not settings.debug else "DEBUG",
+    # Format and write on a background thread instead of the event loop
+    enqueue=True,
+    backtrace=False,
+    diagnose=False,
 )
 
 
@@ -43,10 +57,25 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if not settings.openai_api_key:
         logger.warning("OpenAI API key not configured")
 
+    # Load the language identification model once per worker
+    language_detector.load()
+
+    # tiktoken reads (or downloads) its BPE file on first use; keep that off the loop
+    await asyncio.to_thread(load_tokenizer)
+
+    # Open the shared provider connection pool before the first request
+    app.state.http = get_http_client()
+    logger.info(f"HTTP pool: max_connections={settings.http_max_connections}")
+
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.project_name}")
+    await close_http_client()
+    await translation_cache.close()
+    await summary_cache.close()
+    await llm_batch_service.close()
+    await semantic_cache.close()
 
 
 # Create FastAPI application
@@ -57,6 +86,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url=f"{settings.api_v1_prefix}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -69,133 +99,103 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add GZip middleware for response compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add GZip middleware for response compression (small bodies are sent as-is)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compresslevel,
+)
 
 
-# Request timing middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add processing time header to responses."""
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+# Request timing middleware (skipped for probes)
+app.add_middleware(ProcessTimeMiddleware, skip_paths=frozenset({"/", "/health", "/ready"}))
 
 
 # Exception handlers
+# Error bodies share a fixed prefix per error type; only the detail and
+# timestamp are serialized per response
+_VALIDATION_ERROR_PREFIX = b'{"error":"Validation Error","code":"VALIDATION_ERROR","detail":'
+_INTERNAL_ERROR_PREFIX = b'{"error":"Internal Server Error","code":"INTERNAL_ERROR","detail":'
+_INTERNAL_ERROR_DETAIL = orjson.dumps("An unexpected error occurred")
+
+
+def _error_response(prefix: bytes, detail: bytes, status_code: int) -> Response:
+    """Build an ErrorResponse-shaped JSON response from pre-serialized parts."""
+    body = b"".join((prefix, detail, b',"timestamp":', orjson.dumps(datetime.utcnow()), b"}"))
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
 @app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+async def value_error_handler(request: Request, exc: ValueError) -> Response:
     """Handle ValueError exceptions."""
     logger.error(f"ValueError: {exc}")
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=ErrorResponse(
-            error="Validation Error",
-            detail=str(exc),
-            code="VALIDATION_ERROR",
-        ).dict(),
+    return _error_response(
+        _VALIDATION_ERROR_PREFIX,
+        orjson.dumps(str(exc)),
+        status.HTTP_400_BAD_REQUEST,
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle general exceptions."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ErrorResponse(
-            error="Internal Server Error",
-            detail=str(exc) if settings.debug else "An unexpected error occurred",
-            code="INTERNAL_ERROR",
-        ).dict(),
+    return _error_response(
+        _INTERNAL_ERROR_PREFIX,
+        orjson.dumps(str(exc)) if settings.debug else _INTERNAL_ERROR_DETAIL,
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
     )
 
 
-# Health check endpoint
-@app.get(
-    "/health",
-    tags=["health"],
-    summary="Health check",
-    description="Check service health and status",
-)
-async def health_check() -> Dict[str, Any]:
-    """
-    Health check endpoint.
-
-    Returns service status, version, and configuration info.
-    """
-    return {
-        "status": "healthy",
-        "service": settings.project_name,
-        "version": settings.version,
-        "debug": settings.debug,
-        "providers": {
-            "anthropic": bool(settings.anthropic_api_key),
-            "openai": bool(settings.openai_api_key),
-        },
-        "models": {
-            "claude": settings.claude_model,
-            "openai": settings.openai_model,
-        },
-    }
-
-
-# Readiness check endpoint
-@app.get(
-    "/ready",
-    tags=["health"],
-    summary="Readiness check",
-    description="Check if service is ready to accept requests",
-)
-async def readiness_check() -> Dict[str, Any]:
-    """
-    Readiness check endpoint.
-
-    Verifies that the service has required dependencies and can process requests.
-    """
-    ready = True
-    checks = {}
-
-    # Check API keys
-    checks["anthropic_configured"] = bool(settings.anthropic_api_key)
-    checks["openai_configured"] = bool(settings.openai_api_key)
-
-    # Service is ready if at least one provider is configured
-    ready = checks["anthropic_configured"] or checks["openai_configured"]
-
-    return {
-        "ready": ready,
-        "checks": checks,
-    }
-
-
-# Root endpoint
-@app.get(
-    "/",
-    tags=["root"],
-    summary="Root endpoint",
-    description="Get API information",
-)
-async def root() -> Dict[str, Any]:
-    """
-    Root endpoint with API information.
-    """
-    return {
-        "service": settings.project_name,
-        "version": settings.version,
-        "docs": "/docs",
-        "health": "/health",
-        "api": {
-            "v1": {
-                "summarize": f"{settings.api_v1_prefix}/summarize",
-                "translate": f"{settings.api_v1_prefix}/translate",
-                "moderate": f"{settings.api_v1_prefix}/moderate",
-                "credibility": f"{settings.api_v1_prefix}/credibility",
-            }
-        },
-    }
+# Probe and root bodies only depend on frozen settings, so they are
+# serialized once at import instead of on every request
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": settings.project_name,
+    "version": settings.version,
+    "debug": settings.debug,
+    "providers": {
+        "anthropic": bool(settings.anthropic_api_key),
+        "openai": bool(settings.openai_api_key),
+    },
+    "models": {
+        "claude": settings.claude_model,
+        "openai": settings.openai_model,
+    },
+})
+
+# Service is ready if at least one provider is configured
+_READY_CHECKS = {
+    "anthropic_configured": bool(settings.anthropic_api_key),
+    "openai_configured": bool(settings.openai_api_key),
+}
+_READY_BYTES = orjson.dumps({
+    "ready": any(_READY_CHECKS.values()),
+    "checks": _READY_CHECKS,
+})
+
+_ROOT_BYTES = orjson.dumps({
+    "service": settings.project_name,
+    "version": settings.version,
+    "docs": "/docs",
+    "health": "/health",
+    "api": {
+        "v1": {
+            "summarize": f"{settings.api_v1_prefix}/summarize",
+            "translate": f"{settings.api_v1_prefix}/translate",
+            "moderate": f"{settings.api_v1_prefix}/moderate",
+            "credibility": f"{settings.api_v1_prefix}/credibility",
+        }
+    },
+})
+
+# Health, readiness and root endpoints are raw ASGI routes placed ahead of
+# the API routes, bypassing FastAPI's request handling
+app.router.routes[0:0] = [
+    Route("/health", StaticJSONEndpoint(_HEALTH_BYTES), methods=["GET"], name="health_check"),
+    Route("/ready", StaticJSONEndpoint(_READY_BYTES), methods=["GET"], name="readiness_check"),
+    Route("/", StaticJSONEndpoint(_ROOT_BYTES), methods=["GET"], name="root"),
+]
 
 
 # Include API routers
@@ -225,5 +225,11 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # Reload mode runs a single process
+        workers=1 if settings.debug else settings.workers,
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=settings.limit_concurrency,
+        timeout_keep_alive=settings.timeout_keep_alive,
         log_level="info" if not settings.debug else "debug",
     )
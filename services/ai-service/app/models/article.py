@@ -51,6 +51,10 @@ class SummarizeRequest(BaseModel):
     provider: AIProvider = Field(default=AIProvider.CLAUDE, description="AI provider to use")
     key_points: bool = Field(default=True, description="Include key points extraction")
     language: LanguageCode = Field(default=LanguageCode.EN, description="Output language")
+    race: bool = Field(
+        default=False,
+        description="Call every configured provider concurrently and use the first successful summary",
+    )
 
     @field_validator("article")
     @classmethod
@@ -2,10 +2,22 @@
 
 from app.services.summarizer import SummarizerService, summarizer_service
 from app.services.translator import TranslatorService, translator_service
+from app.services.llm_batch import LLMBatchService, llm_batch_service
+from app.services.translation_cache import TranslationCache, translation_cache
+from app.services.summary_cache import SummaryCache, summary_cache
+from app.services.language_detector import LanguageDetector, language_detector
 
 __all__ = [
     "SummarizerService",
     "summarizer_service",
     "TranslatorService",
     "translator_service",
+    "LLMBatchService",
+    "llm_batch_service",
+    "TranslationCache",
+    "translation_cache",
+    "SummaryCache",
+    "summary_cache",
+    "LanguageDetector",
+    "language_detector",
 ]
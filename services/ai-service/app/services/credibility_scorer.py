@@ -16,14 +16,46 @@ Score Range: 0-100
 - 0-29: Unreliable (single unverified source, high bias detected)
 """
 
-from typing import List, Dict, Optional, Tuple
+import asyncio
+import base64
+import hashlib
+from collections import OrderedDict
+from typing import Any, List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import numpy as np
-from anthropic import Anthropic
-import openai
-import os
-import json
+from anthropic import AsyncAnthropic
+from loguru import logger
+from openai import AsyncOpenAI
+import re
+import orjson
+
+from app.core.config import settings
+from app.core.http import get_http_client
+
+# Maximum inputs per embeddings request
+EMBEDDING_BATCH_SIZE = 256
+# Maximum embeddings requests in flight
+EMBEDDING_CONCURRENCY = 8
+# Seconds to wait for more texts before sending a partial embeddings request
+EMBEDDING_COALESCE_WINDOW = 0.02
+# Maximum embeddings memoized by content hash
+EMBEDDING_CACHE_SIZE = 10_000
+# Articles further apart than this are never treated as the same story
+SIMILARITY_TIME_WINDOW = timedelta(days=3)
+# Maximum articles whose facts are checked in a single Claude call
+FACT_CHECK_BATCH_SIZE = 8
+# Maximum parsed fact-check / verification results memoized by prompt hash
+LLM_CACHE_SIZE = 5000
+# Score field of a fact-check answer, for responses that are not clean JSON
+_CONSISTENCY_SCORE_RE = re.compile(r'"consistency_score"\s*:\s*(\d+(?:\.\d+)?)')
+# Optional markdown code fence around a JSON answer
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```)?\s*$", re.DOTALL)
+# Cross-coverage score by number of sources, up to four
+_CROSS_COVERAGE_SCORES = (0.0, 40.0, 60.0, 75.0, 85.0)
+# Weights of cross coverage (how many sources), source diversity, source
+# reputation, fact consistency across sources and AI verification
+_FACTOR_WEIGHTS = np.array([0.30, 0.20, 0.20, 0.15, 0.15], dtype=np.float64)
 
 
 @dataclass
@@ -39,7 +71,67 @@ class ArticleMetadata:
     source_credibility: float  # Base credibility of the source (0-100)
     published_at: datetime
     category: str
-    embedding: Optional[List[float]] = None
+    embedding: Optional[np.ndarray] = None  # L2-normalized float32 vector
+
+
+@dataclass
+class ArticleCorpus:
+    """
+    Column-wise view of the article fields used by the source sub-scores
+
+    Source types and biases are stored as small integer codes (-1 for a
+    missing bias), so diversity and reputation over any subset of articles
+    are numpy reductions over an index array. Timestamps are kept sorted
+    for binary-searched time windows.
+    """
+
+    ids: List[str]
+    index: Dict[str, int]  # First position of each article ID
+    source_type_ids: np.ndarray  # int16
+    source_bias_ids: np.ndarray  # int16
+    source_credibility: np.ndarray  # float64
+    published_at_ns: np.ndarray  # int64, input order
+    order: np.ndarray  # Positions sorted by publication time
+    sorted_published_at_ns: np.ndarray  # int64, ascending
+
+    @classmethod
+    def from_articles(cls, articles: List[ArticleMetadata]) -> "ArticleCorpus":
+        """Build the columns once from a list of articles"""
+
+        ids = [a.id for a in articles]
+        index: Dict[str, int] = {}
+        for i, article_id in enumerate(ids):
+            index.setdefault(article_id, i)
+
+        type_codes: Dict[str, int] = {}
+        bias_codes: Dict[Optional[str], int] = {None: -1, "": -1}
+        published_at_ns = np.array(
+            [int(a.published_at.timestamp() * 1e9) for a in articles], dtype=np.int64
+        )
+        order = np.argsort(published_at_ns, kind="stable")
+
+        return cls(
+            ids=ids,
+            index=index,
+            source_type_ids=np.array(
+                [type_codes.setdefault(a.source_type, len(type_codes)) for a in articles],
+                dtype=np.int16,
+            ),
+            source_bias_ids=np.array(
+                [bias_codes.setdefault(a.source_bias, len(bias_codes) - 2) for a in articles],
+                dtype=np.int16,
+            ),
+            source_credibility=np.array(
+                [a.source_credibility for a in articles], dtype=np.float64
+            ),
+            published_at_ns=published_at_ns,
+            order=order,
+            sorted_published_at_ns=published_at_ns[order],
+        )
+
+    def positions(self, articles: List[ArticleMetadata]) -> np.ndarray:
+        """Corpus positions of the given articles"""
+        return np.array([self.index[a.id] for a in articles], dtype=np.intp)
 
 
 @dataclass
@@ -60,38 +152,186 @@ class CredibilityScore:
 class CredibilityScorer:
     """Calculate credibility scores for news articles"""
 
-    def __init__(self):
-        self.anthropic = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-        openai.api_key = os.getenv("OPENAI_API_KEY")
+    def __init__(
+        self,
+        anthropic: Optional[AsyncAnthropic] = None,
+        openai: Optional[AsyncOpenAI] = None,
+    ):
+        # Clients can be injected; by default async clients are built on the
+        # shared connection pool, so provider calls never block the event loop
+        http_client = get_http_client()
+        self.anthropic = anthropic or (AsyncAnthropic(
+            api_key=settings.anthropic_api_key, http_client=http_client
+        ) if settings.anthropic_api_key else None)
+        self.openai = openai or (AsyncOpenAI(
+            api_key=settings.openai_api_key, http_client=http_client
+        ) if settings.openai_api_key else None)
+        # Embeddings by content hash; syndicated copies are embedded once
+        self._emb_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        # Pending embedding requests, coalesced across callers
+        self._embed_queue: List[Tuple[bytes, str, asyncio.Future]] = []
+        self._embed_pending: Dict[bytes, asyncio.Future] = {}
+        self._embed_flush: Optional[asyncio.TimerHandle] = None
+        self._embed_tasks: set = set()
+        self._embed_sem = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+        # Parsed Claude results by prompt hash, so re-scoring an unchanged
+        # article set skips the LLM calls
+        self._llm_cache: OrderedDict[bytes, Any] = OrderedDict()
 
     async def calculate_credibility(
-        self, article: ArticleMetadata, all_articles: List[ArticleMetadata]
+        self,
+        article: ArticleMetadata,
+        all_articles: List[ArticleMetadata],
+        similarities: Optional[np.ndarray] = None,
     ) -> CredibilityScore:
-        """Calculate comprehensive credibility score for an article"""
+        """
+        Calculate comprehensive credibility score for an article
+
+        `similarities` optionally holds precomputed cosine similarities between
+        the article and each entry of `all_articles` (see similarity_matrix).
+        """
 
         # 1. Find similar articles (cross-coverage detection)
-        similar_articles = await self._find_similar_articles(article, all_articles)
+        similar_articles = await self._find_similar_articles(
+            article, all_articles, similarities
+        )
 
-        # 2. Calculate sub-scores
-        cross_coverage_score = self._calculate_cross_coverage_score(similar_articles)
-        source_diversity_score = self._calculate_source_diversity(
-            article, similar_articles
+        # 2. Extract and compare facts (if multiple sources) and
+        # 3. AI-powered verification, run concurrently
+        verification = self._ai_verification(article, similar_articles)
+        if len(similar_articles) > 0:
+            fact_consistency_score, verification_result = await asyncio.gather(
+                self._check_fact_consistency(article, similar_articles), verification
+            )
+        else:
+            fact_consistency_score = 0.0
+            verification_result = await verification
+
+        return self._build_score(
+            article, similar_articles, fact_consistency_score, verification_result
         )
-        source_reputation_score = self._calculate_source_reputation(
-            article, similar_articles
+
+    async def score_batch(
+        self, articles: List[ArticleMetadata], concurrency: int = 10
+    ) -> List[Union[CredibilityScore, Exception]]:
+        """
+        Score every article against the others in the same batch
+
+        Missing embeddings are fetched in batched requests, all pairwise
+        similarities come from one matrix product, and each article is only
+        compared with the articles inside its time window. LLM calls are
+        then made through calculate_credibility_batch.
+        """
+
+        await self.embed_articles(articles)
+        similarities = self.similarity_matrix(articles)
+        corpus = ArticleCorpus.from_articles(articles)
+        ids = np.array(corpus.ids)
+        windows = self.window_candidates(corpus)
+
+        items = []
+        for i, article in enumerate(articles):
+            others = windows[i][ids[windows[i]] != article.id]
+            items.append(
+                (article, [articles[j] for j in others], similarities[i][others])
+            )
+
+        return await self.calculate_credibility_batch(items, concurrency, corpus)
+
+    async def calculate_credibility_batch(
+        self,
+        items: List[Tuple[ArticleMetadata, List[ArticleMetadata], Optional[np.ndarray]]],
+        concurrency: int = 10,
+        corpus: Optional[ArticleCorpus] = None,
+    ) -> List[Union[CredibilityScore, Exception]]:
+        """
+        Calculate credibility scores for many articles
+
+        Each item is (article, articles to compare against, optional
+        precomputed similarities), as for calculate_credibility. Fact
+        consistency for up to FACT_CHECK_BATCH_SIZE articles is checked in a
+        single Claude call; AI verification still runs per article. At most
+        `concurrency` provider calls are in flight. Failed items hold their
+        exception. `corpus`, when given, must cover every article in the
+        items and is reused for the source sub-scores.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        similar_lists = await asyncio.gather(
+            *(
+                self._find_similar_articles(article, others, similarities)
+                for article, others, similarities in items
+            ),
+            return_exceptions=True,
         )
+        found = [i for i, similar in enumerate(similar_lists) if not isinstance(similar, Exception)]
+        to_check = [i for i in found if similar_lists[i]]
+        groups = [
+            to_check[start : start + FACT_CHECK_BATCH_SIZE]
+            for start in range(0, len(to_check), FACT_CHECK_BATCH_SIZE)
+        ]
+
+        fact_results, verifications = await asyncio.gather(
+            asyncio.gather(
+                *(
+                    bounded(
+                        self._check_fact_consistency_batch(
+                            [(items[i][0], similar_lists[i]) for i in group]
+                        )
+                    )
+                    for group in groups
+                )
+            ),
+            asyncio.gather(
+                *(bounded(self._ai_verification(items[i][0], similar_lists[i])) for i in found)
+            ),
+        )
+        fact_scores = {
+            i: score for group, scores in zip(groups, fact_results) for i, score in zip(group, scores)
+        }
+        verification_results = dict(zip(found, verifications))
 
-        # 3. Extract and compare facts (if multiple sources)
-        fact_consistency_score = 0.0
-        if len(similar_articles) > 0:
-            fact_consistency_score = await self._check_fact_consistency(
-                article, similar_articles
+        results: List[Union[CredibilityScore, Exception]] = []
+        for i, (item, similar) in enumerate(zip(items, similar_lists)):
+            if isinstance(similar, Exception):
+                results.append(similar)
+                continue
+            results.append(
+                self._build_score(
+                    item[0],
+                    similar,
+                    fact_scores.get(i, 0.0),
+                    verification_results[i],
+                    corpus,
+                )
             )
+        return results
+
+    def _build_score(
+        self,
+        article: ArticleMetadata,
+        similar_articles: List[ArticleMetadata],
+        fact_consistency_score: float,
+        verification_result: Dict,
+        corpus: Optional[ArticleCorpus] = None,
+    ) -> CredibilityScore:
+        """Combine sub-scores and LLM results into the final credibility score"""
 
-        # 4. AI-powered verification
-        verification_result = await self._ai_verification(article, similar_articles)
+        group = [article, *similar_articles]
+        if corpus is None:
+            corpus = ArticleCorpus.from_articles(group)
+        indices = corpus.positions(group)
+
+        cross_coverage_score = self._calculate_cross_coverage_score(similar_articles)
+        source_diversity_score = self._calculate_source_diversity(corpus, indices)
+        source_reputation_score = self._calculate_source_reputation(corpus, indices)
 
-        # 5. Calculate weighted final score
+        # Calculate weighted final score
         factors = {
             "cross_coverage": cross_coverage_score,
             "source_diversity": source_diversity_score,
@@ -100,16 +340,19 @@ class CredibilityScorer:
             "ai_verification": verification_result["score"],
         }
 
-        # Weights for each factor
-        weights = {
-            "cross_coverage": 0.30,  # 30% - How many sources
-            "source_diversity": 0.20,  # 20% - Diversity of sources
-            "source_reputation": 0.20,  # 20% - Source quality
-            "fact_consistency": 0.15,  # 15% - Facts match across sources
-            "ai_verification": 0.15,  # 15% - AI fact check
-        }
-
-        final_score = sum(factors[key] * weights[key] for key in factors)
+        final_score = float(
+            _FACTOR_WEIGHTS
+            @ np.array(
+                [
+                    cross_coverage_score,
+                    source_diversity_score,
+                    source_reputation_score,
+                    fact_consistency_score,
+                    verification_result["score"],
+                ],
+                dtype=np.float64,
+            )
+        )
 
         # Determine verification status
         if final_score >= 90:
@@ -139,65 +382,233 @@ class CredibilityScorer:
         )
 
     async def _find_similar_articles(
-        self, article: ArticleMetadata, all_articles: List[ArticleMetadata]
+        self,
+        article: ArticleMetadata,
+        all_articles: List[ArticleMetadata],
+        similarities: Optional[np.ndarray] = None,
     ) -> List[ArticleMetadata]:
         """Find articles covering the same story using semantic similarity"""
 
-        # Get embedding for the article if not already computed
-        if article.embedding is None:
-            article.embedding = await self._get_embedding(article.title + " " + article.content[:500])
-
-        similar = []
         similarity_threshold = 0.75  # Cosine similarity threshold
 
-        # Time window: articles within 3 days
-        time_window = timedelta(days=3)
+        candidates = [
+            i
+            for i, other in enumerate(all_articles)
+            if other.id != article.id
+            and abs(article.published_at - other.published_at) <= SIMILARITY_TIME_WINDOW
+        ]
+        if not candidates:
+            return []
+
+        if similarities is not None:
+            scores = np.asarray(similarities)[candidates]
+        else:
+            # Embed whatever is missing in one pass, then score every
+            # candidate with a single matrix-vector product
+            others = [all_articles[i] for i in candidates]
+            await self.embed_articles([article, *others])
+            # One matrix keeps the query and candidates the same width even
+            # when some embeddings failed
+            vectors = self._build_embedding_matrix([article, *others])
+            scores = vectors[1:] @ vectors[0]
 
-        for other in all_articles:
-            if other.id == article.id:
-                continue
+        return [all_articles[candidates[i]] for i in np.nonzero(scores >= similarity_threshold)[0]]
 
-            # Check time window
-            time_diff = abs(article.published_at - other.published_at)
-            if time_diff > time_window:
-                continue
+    def window_candidates(self, corpus: ArticleCorpus) -> List[np.ndarray]:
+        """
+        Indices of the articles published within the time window of each article
 
-            # Get embedding
-            if other.embedding is None:
-                other.embedding = await self._get_embedding(other.title + " " + other.content[:500])
+        Each window is found by binary search on the corpus' sorted
+        timestamps, so callers scoring many articles only look at
+        window-local candidates. Indices are returned in input order and
+        include the article itself.
+        """
 
-            # Calculate cosine similarity
-            similarity = self._cosine_similarity(article.embedding, other.embedding)
+        times = corpus.published_at_ns
+        window = SIMILARITY_TIME_WINDOW // timedelta(microseconds=1) * 1000
 
-            if similarity >= similarity_threshold:
-                similar.append(other)
+        lo = np.searchsorted(corpus.sorted_published_at_ns, times - window, side="left")
+        hi = np.searchsorted(corpus.sorted_published_at_ns, times + window, side="right")
 
-        return similar
+        return [np.sort(corpus.order[start:end]) for start, end in zip(lo, hi)]
 
-    async def _get_embedding(self, text: str) -> List[float]:
-        """Get embedding vector using OpenAI"""
-        try:
-            response = openai.embeddings.create(
-                model="text-embedding-3-small", input=text[:8000]  # Limit text length
-            )
-            return response.data[0].embedding
-        except Exception as e:
-            # Return zero vector on error
-            return [0.0] * 1536
+    def _embedding_text(self, article: ArticleMetadata) -> str:
+        """Text used to embed an article"""
+        return article.title + " " + article.content[:500]
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors"""
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
+    async def embed_articles(self, articles: List[ArticleMetadata]) -> None:
+        """Compute missing embeddings for many articles with batched requests"""
 
-        dot_product = np.dot(v1, v2)
-        norm1 = np.linalg.norm(v1)
-        norm2 = np.linalg.norm(v2)
+        missing = [a for a in articles if a.embedding is None]
+        if not missing:
+            return
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
+        vectors = await self._get_embeddings_batch(
+            [self._embedding_text(a) for a in missing]
+        )
+        for a, vector in zip(missing, vectors):
+            # Failed embeddings come back as zero vectors; leave the article
+            # unembedded so a later call can retry it
+            if vector.any():
+                a.embedding = vector
+
+    def similarity_matrix(self, articles: List[ArticleMetadata]) -> np.ndarray:
+        """Pairwise cosine similarities for articles with computed embeddings"""
+
+        if not articles:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        vectors = self._build_embedding_matrix(articles)
+        return vectors @ vectors.T
+
+    def _build_embedding_matrix(self, articles: List[ArticleMetadata]) -> np.ndarray:
+        """Stack article embeddings into a row-normalized float32 matrix"""
+
+        # Articles whose embedding failed get zero rows, similar to nothing
+        dims = next((len(a.embedding) for a in articles if a.embedding is not None), 0)
+        vectors = np.zeros((len(articles), dims), dtype=np.float32)
+        for row, a in zip(vectors, articles):
+            if a.embedding is not None:
+                row[:] = a.embedding
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+
+        return vectors
+
+    async def _get_embedding(self, text: str) -> np.ndarray:
+        """Get normalized embedding vector using OpenAI"""
+        return (await self._get_embeddings_batch([text]))[0]
+
+    async def _get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Embed many texts, sending up to EMBEDDING_BATCH_SIZE inputs per request
+
+        Vectors are returned L2-normalized as float32, so cosine similarity
+        between them is a plain dot product.
+
+        Previously embedded texts are served from the content-hash cache and
+        repeated texts are requested once.
+        """
+
+        keys = [
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            for text in texts
+        ]
+        vectors: Dict[bytes, np.ndarray] = {}
+        misses: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            cached = self._emb_cache.get(key)
+            if cached is not None:
+                self._emb_cache.move_to_end(key)
+                vectors[key] = cached
+            else:
+                misses.setdefault(key, text)
+
+        # Misses join the shared request queue; concurrent callers' texts
+        # are coalesced into the same embeddings requests
+        miss_keys = list(misses)
+        miss_vectors = await asyncio.gather(*self._queue_embeddings(misses))
+        for key, vector in zip(miss_keys, miss_vectors):
+            if vector is None:
+                vectors[key] = np.zeros(1536, dtype=np.float32)
+                continue
+            vectors[key] = vector
+            self._emb_cache[key] = vector
+            if len(self._emb_cache) > EMBEDDING_CACHE_SIZE:
+                self._emb_cache.popitem(last=False)
+
+        return [vectors[key] for key in keys]
+
+    def _queue_embeddings(self, texts: Dict[bytes, str]) -> List[asyncio.Future]:
+        """
+        Queue texts (by content hash) for embedding and return a future per text
+
+        The queue is sent as one request once it holds EMBEDDING_BATCH_SIZE
+        texts, or EMBEDDING_COALESCE_WINDOW seconds after the first text
+        arrived, whichever comes first. A text already queued or in flight
+        shares the existing future. Futures resolve to a normalized vector,
+        or None if the request failed.
+        """
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for key, text in texts.items():
+            future = self._embed_pending.get(key)
+            if future is not None:
+                futures.append(future)
+                continue
+            future = self._embed_pending[key] = loop.create_future()
+            self._embed_queue.append((key, text, future))
+            futures.append(future)
+            if len(self._embed_queue) >= EMBEDDING_BATCH_SIZE:
+                self._flush_embeddings()
+
+        if self._embed_queue and self._embed_flush is None:
+            self._embed_flush = loop.call_later(
+                EMBEDDING_COALESCE_WINDOW, self._flush_embeddings
+            )
+        return futures
+
+    def _flush_embeddings(self) -> None:
+        """Send the queued texts as one embeddings request"""
+
+        if self._embed_flush is not None:
+            self._embed_flush.cancel()
+            self._embed_flush = None
+
+        batch, self._embed_queue = self._embed_queue, []
+        if batch:
+            task = asyncio.ensure_future(self._request_embeddings(batch))
+            self._embed_tasks.add(task)
+            task.add_done_callback(self._embed_tasks.discard)
+
+    async def _request_embeddings(
+        self, batch: List[Tuple[bytes, str, asyncio.Future]]
+    ) -> None:
+        """Request embeddings for a queued batch and resolve its futures"""
+
+        # Failed inputs resolve to None, become zero vectors and are not cached
+        vectors: List[Optional[np.ndarray]] = [None] * len(batch)
+        if self.openai is None:
+            logger.warning(f"OpenAI not configured, skipping {len(batch)} embeddings")
+        else:
+            async with self._embed_sem:
+                try:
+                    # base64 payloads are several times smaller than JSON floats
+                    # and decode straight into float32 without a Python list
+                    response = await self.openai.embeddings.create(
+                        model="text-embedding-3-small",
+                        input=[text[:8000] for _, text, _ in batch],  # Limit text length
+                        encoding_format="base64",
+                    )
+                    if len(response.data) == len(batch):
+                        vectors = [
+                            self._normalize(np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32))
+                            for item in response.data
+                        ]
+                    else:
+                        logger.warning(
+                            f"Embeddings response has {len(response.data)} items for {len(batch)} inputs"
+                        )
+                except Exception as e:
+                    logger.warning(f"Embeddings request for {len(batch)} texts failed: {e}")
+
+        for (key, _, future), vector in zip(batch, vectors):
+            self._embed_pending.pop(key, None)
+            if not future.done():
+                future.set_result(vector)
+
+    @staticmethod
+    def _normalize(vec: List[float]) -> np.ndarray:
+        """Convert a vector to L2-normalized float32 (zero vectors stay zero)"""
+        v = np.asarray(vec, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        return v / norm if norm > 0 else v
+
+    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
+        """Cosine similarity between two vectors already normalized by _normalize"""
+        return float(vec1 @ vec2)
 
     def _calculate_cross_coverage_score(
         self, similar_articles: List[ArticleMetadata]
@@ -211,52 +622,52 @@ class CredibilityScorer:
         # 2 sources: 60
         # 3 sources: 75
         # 4 sources: 85
-        # 5+ sources: 95
-
-        if num_sources == 1:
-            return 40.0
-        elif num_sources == 2:
-            return 60.0
-        elif num_sources == 3:
-            return 75.0
-        elif num_sources == 4:
-            return 85.0
-        else:
-            return min(95.0, 85.0 + (num_sources - 4) * 2)
+        # 5+ sources: 85 + 2 per extra source, capped at 95
+
+        if num_sources <= 4:
+            return _CROSS_COVERAGE_SCORES[num_sources]
+        return min(95.0, 85.0 + (num_sources - 4) * 2)
 
     def _calculate_source_diversity(
-        self, article: ArticleMetadata, similar_articles: List[ArticleMetadata]
+        self, corpus: ArticleCorpus, indices: np.ndarray
     ) -> float:
         """Calculate diversity score based on source types and biases"""
 
-        all_sources = [article] + similar_articles
-
         # Count unique source types
-        source_types = set(s.source_type for s in all_sources)
-        type_diversity = (len(source_types) / 3) * 100  # Max 3 types
+        type_count = len(np.unique(corpus.source_type_ids[indices]))
+        type_diversity = (type_count / 3) * 100  # Max 3 types
 
-        # Count unique biases
-        biases = set(s.source_bias for s in all_sources if s.source_bias)
-        bias_diversity = (len(biases) / 4) * 100 if biases else 50  # Max 4 biases
+        # Count unique biases, ignoring missing ones
+        biases = np.unique(corpus.source_bias_ids[indices])
+        bias_count = int(np.count_nonzero(biases >= 0))
+        bias_diversity = (bias_count / 4) * 100 if bias_count else 50  # Max 4 biases
 
         # Weighted average
         return (type_diversity * 0.6 + bias_diversity * 0.4)
 
     def _calculate_source_reputation(
-        self, article: ArticleMetadata, similar_articles: List[ArticleMetadata]
+        self, corpus: ArticleCorpus, indices: np.ndarray
     ) -> float:
         """Calculate average source reputation score"""
 
-        all_sources = [article] + similar_articles
+        return float(corpus.source_credibility[indices].mean())
 
-        if not all_sources:
-            return 50.0
+    def _llm_cache_key(self, prompt: str) -> bytes:
+        """Fingerprint of a Claude prompt"""
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
 
-        avg_reputation = sum(s.source_credibility for s in all_sources) / len(
-            all_sources
-        )
+    def _llm_cache_get(self, key: bytes) -> Optional[Any]:
+        """Look up a parsed Claude result (shared object, do not mutate)"""
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self._llm_cache.move_to_end(key)
+        return cached
 
-        return avg_reputation
+    def _llm_cache_set(self, key: bytes, value: Any) -> None:
+        """Store a parsed Claude result, evicting the least recently used"""
+        self._llm_cache[key] = value
+        if len(self._llm_cache) > LLM_CACHE_SIZE:
+            self._llm_cache.popitem(last=False)
 
     async def _check_fact_consistency(
         self, article: ArticleMetadata, similar_articles: List[ArticleMetadata]
@@ -266,22 +677,117 @@ class CredibilityScorer:
         if len(similar_articles) == 0:
             return 50.0  # Neutral score if no similar articles
 
+        prompt = self._build_fact_checking_prompt(article, similar_articles[:3])
+        key = self._llm_cache_key(prompt)
+        cached = self._llm_cache_get(key)
+        if cached is not None:
+            return cached
+
         # Use Claude to extract and compare key facts
         try:
-            prompt = self._build_fact_checking_prompt(article, similar_articles[:3])
-
-            response = self.anthropic.messages.create(
+            response = await self.anthropic.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=1024,
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            result = json.loads(response.content[0].text)
-            return float(result.get("consistency_score", 50.0))
+            text = response.content[0].text
+            try:
+                score = float(orjson.loads(text).get("consistency_score", 50.0))
+            except orjson.JSONDecodeError:
+                # Salvage the score from fenced or otherwise malformed JSON
+                match = _CONSISTENCY_SCORE_RE.search(text)
+                if match is None:
+                    raise
+                score = float(match.group(1))
+            self._llm_cache_set(key, score)
+            return score
 
         except Exception as e:
             return 50.0  # Default to neutral on error
 
+    async def _check_fact_consistency_batch(
+        self, items: List[Tuple[ArticleMetadata, List[ArticleMetadata]]]
+    ) -> List[float]:
+        """Check fact consistency for several articles in one AI call"""
+
+        # Items are cached under the same keys as single fact checks
+        keys = [
+            self._llm_cache_key(self._build_fact_checking_prompt(article, similar[:3]))
+            for article, similar in items
+        ]
+        scores = [self._llm_cache_get(key) for key in keys]
+        pending = [i for i, score in enumerate(scores) if score is None]
+
+        if len(pending) == 1:
+            i = pending[0]
+            scores[i] = await self._check_fact_consistency(*items[i])
+        elif pending:
+            try:
+                prompt = self._build_fact_checking_batch_prompt([items[i] for i in pending])
+
+                response = await self.anthropic.messages.create(
+                    model="claude-3-5-sonnet-20241022",
+                    max_tokens=256 + 64 * len(pending),
+                    messages=[{"role": "user", "content": prompt}],
+                )
+
+                # Strip markdown code fences if present
+                text = response.content[0].text
+                match = _FENCE_RE.match(text)
+                for entry in orjson.loads(match.group(1) if match else text):
+                    n = int(entry["item"])
+                    if 0 <= n < len(pending):
+                        i = pending[n]
+                        scores[i] = float(entry.get("consistency_score", 50.0))
+                        self._llm_cache_set(keys[i], scores[i])
+
+            except Exception as e:
+                # Unscored items default to neutral below
+                logger.warning(f"Batched fact check for {len(pending)} items failed: {e}")
+
+        # Neutral score if not returned
+        return [50.0 if score is None else score for score in scores]
+
+    def _build_fact_checking_batch_prompt(
+        self, items: List[Tuple[ArticleMetadata, List[ArticleMetadata]]]
+    ) -> str:
+        """Build prompt for checking fact consistency of several stories at once"""
+
+        prompt = """Analyze the consistency of key facts across news articles covering the same story.
+Each item below is a main article followed by similar articles from other sources.
+"""
+
+        for n, (article, similar_articles) in enumerate(items):
+            prompt += f"""
+=== Item {n} ===
+Main Article:
+Title: {article.title}
+Source: {article.source_name}
+Content: {article.content[:1000]}
+"""
+            for i, similar in enumerate(similar_articles[:3], 1):
+                prompt += f"""
+Similar Article {i}:
+Title: {similar.title}
+Source: {similar.source_name}
+Content: {similar.content[:800]}
+"""
+
+        prompt += """
+
+For each item separately, extract key facts (names, dates, numbers, events) from its articles
+and check whether they are consistent or conflicting.
+
+Return a JSON array with one entry per item:
+[
+    {"item": 0, "consistency_score": 0-100},
+    ...
+]
+"""
+
+        return prompt
+
     def _build_fact_checking_prompt(
         self, article: ArticleMetadata, similar_articles: List[ArticleMetadata]
     ) -> str:
@@ -354,19 +860,26 @@ Return JSON:
 }}
 """
 
-            response = self.anthropic.messages.create(
+            key = self._llm_cache_key(prompt)
+            cached = self._llm_cache_get(key)
+            if cached is not None:
+                return cached
+
+            response = await self.anthropic.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=512,
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            result = json.loads(response.content[0].text)
-            return {
+            result = orjson.loads(response.content[0].text)
+            verification = {
                 "score": float(result.get("score", 50.0)),
                 "confidence": float(result.get("confidence", 0.5)),
                 "flags": result.get("flags", []),
                 "strengths": result.get("strengths", []),
             }
+            self._llm_cache_set(key, verification)
+            return verification
 
         except Exception as e:
             return {"score": 50.0, "confidence": 0.3, "flags": [], "strengths": []}
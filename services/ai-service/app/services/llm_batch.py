@@ -0,0 +1,303 @@
+"""Provider Batch API integration for offline summarization."""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+import httpx
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.http import get_http_client
+from app.models.article import SummarizeRequest, AIProvider
+from app.services.summarizer import STOP_SEQUENCES, summarizer_service
+
+
+class LLMBatchService:
+    """
+    Submit summarization jobs through the Anthropic Message Batches and
+    OpenAI Batch APIs.
+
+    Batch jobs complete within 24 hours at roughly half the per-token cost
+    of the real-time endpoints, which suits bulk, non-interactive work.
+    The pinned SDK versions predate the batch resources, so requests are
+    issued through the clients' generic HTTP methods.
+
+    Identical requests are submitted once. The position of every submitted
+    request is kept in Redis under the batch ID, so results are returned in
+    the caller's order with duplicates filled in.
+    """
+
+    KEY_PREFIX = "llm_batch:v1:"
+    # Mappings outlive the 24 hour completion window by a day
+    MAPPING_TTL = 2 * 24 * 3600
+
+    def __init__(self) -> None:
+        """Initialize the batch service with API clients."""
+        http_client = get_http_client()
+        self.anthropic_client = AsyncAnthropic(
+            api_key=settings.anthropic_api_key, http_client=http_client
+        ) if settings.anthropic_api_key else None
+        self.openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key, http_client=http_client
+        ) if settings.openai_api_key else None
+        self._redis: Optional[Redis] = None
+
+    def _get_redis(self) -> Redis:
+        """Get or create the Redis client."""
+        if self._redis is None:
+            self._redis = Redis.from_url(
+                settings.redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._redis
+
+    async def submit_summaries(self, requests: List[SummarizeRequest], provider: AIProvider) -> str:
+        """
+        Submit summarization requests as a single provider batch.
+
+        Args:
+            requests: Summarization requests; each unique request is submitted
+                once, with its index among the unique requests as custom ID
+            provider: AI provider whose Batch API should be used
+
+        Returns:
+            Provider batch ID
+
+        Raises:
+            ValueError: If provider is not configured or does not support batching
+        """
+        unique: List[SummarizeRequest] = []
+        positions: List[int] = []
+        index_by_key: Dict[bytes, int] = {}
+        for request in requests:
+            key = hashlib.blake2b(request.model_dump_json().encode(), digest_size=16).digest()
+            if key not in index_by_key:
+                index_by_key[key] = len(unique)
+                unique.append(request)
+            positions.append(index_by_key[key])
+
+        if provider == AIProvider.CLAUDE:
+            batch_id = await self._submit_claude(unique)
+        elif provider == AIProvider.OPENAI:
+            batch_id = await self._submit_openai(unique)
+        else:
+            raise ValueError(f"Batch API not supported for provider: {provider}")
+
+        mapping = {"positions": positions, "key_points": [r.key_points for r in unique]}
+        try:
+            await self._get_redis().setex(
+                self.KEY_PREFIX + batch_id, self.MAPPING_TTL, json.dumps(mapping)
+            )
+        except RedisError as e:
+            logger.warning(f"Could not store mapping for batch {batch_id}: {e}")
+
+        return batch_id
+
+    async def _submit_claude(self, requests: List[SummarizeRequest]) -> str:
+        """Create an Anthropic message batch."""
+        if not self.anthropic_client:
+            raise ValueError("Anthropic API key not configured")
+
+        batch_requests = [
+            {
+                "custom_id": str(idx),
+                "params": {
+                    "model": settings.claude_model,
+                    "max_tokens": summarizer_service._max_output_tokens(request),
+                    "temperature": settings.temperature,
+                    "stop_sequences": STOP_SEQUENCES,
+                    "system": summarizer_service._build_system_prompt(request),
+                    "messages": [
+                        {"role": "user", "content": summarizer_service._build_user_prompt(request)}
+                    ],
+                },
+            }
+            for idx, request in enumerate(requests)
+        ]
+
+        response = await self.anthropic_client.post(
+            "/v1/messages/batches",
+            body={"requests": batch_requests},
+            cast_to=httpx.Response,
+        )
+        batch = response.json()
+        logger.info(f"Anthropic batch submitted: {batch['id']} ({len(requests)} requests)")
+        return batch["id"]
+
+    async def _submit_openai(self, requests: List[SummarizeRequest]) -> str:
+        """Upload a JSONL input file and create an OpenAI batch."""
+        if not self.openai_client:
+            raise ValueError("OpenAI API key not configured")
+
+        lines = [
+            json.dumps({
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": settings.openai_model,
+                    "messages": [
+                        {"role": "system", "content": summarizer_service._build_system_prompt(request)},
+                        {"role": "user", "content": summarizer_service._build_user_prompt(request)},
+                    ],
+                    "max_tokens": summarizer_service._max_output_tokens(request),
+                    "temperature": settings.temperature,
+                    "stop": STOP_SEQUENCES,
+                },
+            })
+            for idx, request in enumerate(requests)
+        ]
+
+        input_file = await self.openai_client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        response = await self.openai_client.post(
+            "/batches",
+            body={
+                "input_file_id": input_file.id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+            cast_to=httpx.Response,
+        )
+        batch = response.json()
+        logger.info(f"OpenAI batch submitted: {batch['id']} ({len(requests)} requests)")
+        return batch["id"]
+
+    async def retrieve(self, batch_id: str, provider: AIProvider) -> Dict[str, Any]:
+        """
+        Poll a provider batch and collect parsed results once it has ended.
+
+        Args:
+            batch_id: Provider batch ID returned from submit_summaries
+            provider: AI provider the batch was submitted to
+
+        Returns:
+            Dict with batch status and, when finished, per-request results
+
+        Raises:
+            ValueError: If provider is not configured or does not support batching
+        """
+        if provider == AIProvider.CLAUDE:
+            result = await self._retrieve_claude(batch_id)
+        elif provider == AIProvider.OPENAI:
+            result = await self._retrieve_openai(batch_id)
+        else:
+            raise ValueError(f"Batch API not supported for provider: {provider}")
+
+        if "results" in result:
+            result["results"] = await self._expand_results(batch_id, result["results"])
+        return result
+
+    async def _expand_results(
+        self, batch_id: str, results: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Return results in submission order, one per original request.
+
+        Batches without a stored mapping (older batches, Redis unavailable)
+        are returned as delivered by the provider.
+        """
+        try:
+            payload = await self._get_redis().get(self.KEY_PREFIX + batch_id)
+        except RedisError as e:
+            logger.warning(f"Could not load mapping for batch {batch_id}: {e}")
+            return results
+        if payload is None:
+            return results
+
+        mapping = json.loads(payload)
+        by_id = {item["custom_id"]: item for item in results}
+        expanded = []
+        for index, position in enumerate(mapping["positions"]):
+            custom_id = str(position)
+            item = by_id.get(custom_id, {"custom_id": custom_id, "error": "missing"})
+            if not mapping["key_points"][position] and "key_points" in item:
+                item = {**item, "key_points": None}
+            expanded.append({"index": index, **item})
+        return expanded
+
+    async def _retrieve_claude(self, batch_id: str) -> Dict[str, Any]:
+        """Retrieve an Anthropic message batch."""
+        if not self.anthropic_client:
+            raise ValueError("Anthropic API key not configured")
+
+        response = await self.anthropic_client.get(
+            f"/v1/messages/batches/{batch_id}",
+            cast_to=httpx.Response,
+        )
+        batch = response.json()
+        status = batch["processing_status"]
+        result: Dict[str, Any] = {"batch_id": batch_id, "status": status, "ready": status == "ended"}
+
+        if status == "ended":
+            response = await self.anthropic_client.get(
+                f"/v1/messages/batches/{batch_id}/results",
+                cast_to=httpx.Response,
+            )
+            results = []
+            for line in response.text.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if item["result"]["type"] == "succeeded":
+                    text = item["result"]["message"]["content"][0]["text"]
+                    results.append(self._parse_result(item["custom_id"], text))
+                else:
+                    results.append({"custom_id": item["custom_id"], "error": item["result"]["type"]})
+            result["results"] = results
+
+        return result
+
+    async def _retrieve_openai(self, batch_id: str) -> Dict[str, Any]:
+        """Retrieve an OpenAI batch."""
+        if not self.openai_client:
+            raise ValueError("OpenAI API key not configured")
+
+        response = await self.openai_client.get(f"/batches/{batch_id}", cast_to=httpx.Response)
+        batch = response.json()
+        status = batch["status"]
+        result: Dict[str, Any] = {"batch_id": batch_id, "status": status, "ready": status == "completed"}
+
+        output_file_id: Optional[str] = batch.get("output_file_id")
+        if status == "completed" and output_file_id:
+            content = await self.openai_client.files.content(output_file_id)
+            results = []
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if item.get("error"):
+                    results.append({"custom_id": item["custom_id"], "error": str(item["error"])})
+                else:
+                    text = item["response"]["body"]["choices"][0]["message"]["content"]
+                    results.append(self._parse_result(item["custom_id"], text))
+            result["results"] = results
+
+        return result
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def _parse_result(self, custom_id: str, text: str) -> Dict[str, Any]:
+        """Parse a batch completion into summary fields."""
+        summary, key_points, category = summarizer_service._parse_response(text, True)
+        return {
+            "custom_id": custom_id,
+            "summary": summary,
+            "key_points": key_points,
+            "category": category,
+        }
+
+
+# Global service instance
+llm_batch_service = LLMBatchService()
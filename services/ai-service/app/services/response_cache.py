@@ -0,0 +1,138 @@
+"""Two-tier cache for provider responses."""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Generic, Optional, Type, TypeVar
+from loguru import logger
+from pydantic import BaseModel, ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+RequestT = TypeVar("RequestT", bound=BaseModel)
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+class ResponseCache(ABC, Generic[RequestT, ResponseT]):
+    """
+    Cache responses in process memory and in Redis, keyed by request.
+
+    Tier 1 is a small in-process LRU; tier 2 is Redis, shared by all
+    workers and kept for ``ttl`` seconds. Redis failures are logged and
+    treated as misses so an outage only costs the provider call it would
+    have saved. Subclasses define the key prefix, the response model and
+    which request fields make up the key.
+    """
+
+    KEY_PREFIX = ""
+    response_model: Type[ResponseT]
+
+    def __init__(self, capacity: int, ttl: int, enabled: bool = True) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            capacity: Maximum entries kept in process memory
+            ttl: Redis entry lifetime in seconds
+            enabled: Whether lookups and stores are performed
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self.enabled = enabled
+        self._local: OrderedDict[str, ResponseT] = OrderedDict()
+        self._redis: Optional[Redis] = None
+
+    @staticmethod
+    @abstractmethod
+    def _key(request: RequestT) -> str:
+        """Build the cache key for everything that affects the output."""
+        pass
+
+    def _get_redis(self) -> Redis:
+        """Get or create the Redis client."""
+        if self._redis is None:
+            self._redis = Redis.from_url(
+                settings.redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._redis
+
+    def _remember(self, key: str, response: ResponseT) -> None:
+        """Store a response in the in-process tier."""
+        self._local[key] = response
+        self._local.move_to_end(key)
+        if len(self._local) > self.capacity:
+            self._local.popitem(last=False)
+
+    async def get(self, request: RequestT) -> Optional[ResponseT]:
+        """
+        Look up a cached response.
+
+        Args:
+            request: Provider request
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        key = self._key(request)
+        cached = self._local.get(key)
+        if cached is not None:
+            self._local.move_to_end(key)
+            return cached
+
+        try:
+            payload = await self._get_redis().get(self.KEY_PREFIX + key)
+        except RedisError as e:
+            logger.warning(f"{type(self).__name__} read failed: {e}")
+            return None
+
+        if payload is None:
+            return None
+
+        try:
+            cached = self.response_model.model_validate_json(payload)
+        except ValidationError as e:
+            # Entry written by an older response schema; drop it and refetch
+            logger.warning(f"{type(self).__name__} discarded stale entry: {e}")
+            await self._delete(key)
+            return None
+
+        self._remember(key, cached)
+        return cached
+
+    async def _delete(self, key: str) -> None:
+        """Remove an entry from Redis."""
+        try:
+            await self._get_redis().delete(self.KEY_PREFIX + key)
+        except RedisError as e:
+            logger.warning(f"{type(self).__name__} delete failed: {e}")
+
+    async def set(self, request: RequestT, response: ResponseT) -> None:
+        """
+        Store a response in both tiers.
+
+        Args:
+            request: Provider request
+            response: Provider response to cache
+        """
+        if not self.enabled:
+            return
+
+        key = self._key(request)
+        self._remember(key, response)
+
+        try:
+            await self._get_redis().setex(self.KEY_PREFIX + key, self.ttl, response.model_dump_json())
+        except RedisError as e:
+            logger.warning(f"{type(self).__name__} write failed: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
@@ -0,0 +1,296 @@
+"""Semantic response cache for LLM-backed endpoints."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Type, TypeVar
+import numpy as np
+from openai import AsyncOpenAI
+from pydantic import BaseModel, ValidationError
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.http import get_http_client
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class _Namespace:
+    """Fixed-capacity store of normalized embeddings and cached responses."""
+
+    def __init__(self, capacity: int, dimensions: int) -> None:
+        self.vectors = np.zeros((capacity, dimensions), dtype=np.float32)
+        self.values: List[Optional[BaseModel]] = [None] * capacity
+        self.exact: Dict[bytes, int] = {}
+        self.keys: List[Optional[bytes]] = [None] * capacity
+        self.size = 0
+        self.cursor = 0
+
+    def add(self, key: bytes, vector: Optional[np.ndarray], value: BaseModel) -> None:
+        """Insert an entry, evicting the oldest one when full."""
+        slot = self.cursor
+        evicted = self.keys[slot]
+        if evicted is not None and self.exact.get(evicted) == slot:
+            del self.exact[evicted]
+
+        self.vectors[slot] = vector if vector is not None else 0.0
+        self.values[slot] = value
+        self.keys[slot] = key
+        self.exact[key] = slot
+
+        self.cursor = (slot + 1) % len(self.values)
+        self.size = min(self.size + 1, len(self.values))
+
+
+class SemanticCache:
+    """
+    Two-tier cache in front of LLM calls.
+
+    Exact repeats are matched on a content hash without any embedding call.
+    Near-duplicates (re-scraped articles, retried webhooks) are matched by
+    cosine similarity of their embeddings against recent entries. Entries
+    are partitioned by namespace so that responses are only reused for
+    requests with the same provider and options.
+
+    Entries are also written to Redis, one key per entry that expires after
+    SEMANTIC_CACHE_TTL seconds, so they are shared by all workers and
+    survive restarts. A per-namespace sorted set indexes entries by insert
+    time and is trimmed to the newest ``capacity``. Lookups that pass the
+    response model check Redis for exact repeats, and the first lookup of a
+    namespace in a process loads the newest indexed vectors for
+    near-duplicate matching. Redis failures are logged and treated as misses.
+    """
+
+    KEY_PREFIX = "semcache:v2:"
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        capacity: int = 1024,
+        dimensions: int = 512,
+        ttl: int = 86400,
+    ) -> None:
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a semantic hit
+            capacity: Maximum entries kept per namespace
+            dimensions: Embedding vector size requested from the model
+            ttl: Redis entry lifetime in seconds
+        """
+        self.threshold = threshold
+        self.capacity = capacity
+        self.dimensions = dimensions
+        self.ttl = ttl
+        self.enabled = settings.semantic_cache_enabled and bool(settings.openai_api_key)
+        self.openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key, http_client=get_http_client()
+        ) if self.enabled else None
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._embeddings: OrderedDict[bytes, Optional[np.ndarray]] = OrderedDict()
+        self._loaded: Set[str] = set()
+        self._redis: Optional[Redis] = None
+
+    def _get_redis(self) -> Redis:
+        """Get or create the Redis client."""
+        if self._redis is None:
+            self._redis = Redis.from_url(
+                settings.redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._redis
+
+    def _store(self, namespace: str) -> _Namespace:
+        """Get or create the in-process store for a namespace."""
+        store = self._namespaces.get(namespace)
+        if store is None:
+            store = self._namespaces[namespace] = _Namespace(self.capacity, self.dimensions)
+        return store
+
+    def _entry_key(self, namespace: str, key: bytes) -> str:
+        """Redis key of a single cache entry."""
+        return f"{self.KEY_PREFIX}{namespace}:entry:{key.hex()}"
+
+    async def _load(self, namespace: str, model: Type[ModelT]) -> None:
+        """Fill the in-process store of a namespace from Redis, once per process."""
+        self._loaded.add(namespace)
+        try:
+            redis = self._get_redis()
+            members = await redis.zrevrange(f"{self.KEY_PREFIX}{namespace}:index", 0, self.capacity - 1)
+            async with redis.pipeline(transaction=False) as pipe:
+                for member in members:
+                    pipe.hmget(self._entry_key(namespace, bytes.fromhex(member.decode())), "value", "vector")
+                entries = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Semantic cache load failed: {e}")
+            return
+
+        store = self._store(namespace)
+        # Oldest first, so the newest entries are the last to be evicted
+        for member, (payload, raw) in zip(reversed(members), reversed(entries)):
+            key = bytes.fromhex(member.decode())
+            if payload is None or key in store.exact:
+                continue
+            try:
+                value = model.model_validate_json(payload)
+            except ValidationError:
+                continue
+            raw = raw or b""
+            vector = np.frombuffer(raw, dtype=np.float32) if len(raw) == 4 * self.dimensions else None
+            store.add(key, vector, value)
+
+        if members:
+            logger.info(f"Semantic cache loaded {store.size} entries: {namespace}")
+
+    @staticmethod
+    def _hash(text: str) -> bytes:
+        """Hash content for exact matching."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    async def _embed(self, key: bytes, text: str) -> Optional[np.ndarray]:
+        """Get a normalized embedding, memoized by content hash."""
+        if key in self._embeddings:
+            self._embeddings.move_to_end(key)
+            return self._embeddings[key]
+
+        try:
+            response = await self.openai_client.embeddings.create(
+                model=settings.embedding_model,
+                input=text[:8000],
+                dimensions=self.dimensions,
+            )
+            vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vector = vector / norm if norm > 0 else None
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            vector = None
+
+        self._embeddings[key] = vector
+        if len(self._embeddings) > self.capacity:
+            self._embeddings.popitem(last=False)
+        return vector
+
+    async def get(
+        self,
+        namespace: str,
+        text: str,
+        model: Optional[Type[ModelT]] = None,
+        exact: bool = False,
+    ) -> Optional[BaseModel]:
+        """
+        Look up a cached response for content in a namespace.
+
+        Args:
+            namespace: Partition key describing the request options
+            text: Request content
+            model: Response model of the namespace; enables the Redis tier
+            exact: Only serve identical content, never near-duplicates
+
+        Returns:
+            Cached response model, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        if model is not None and not exact and namespace not in self._loaded:
+            await self._load(namespace, model)
+
+        key = self._hash(text)
+        store = self._namespaces.get(namespace)
+        slot = store.exact.get(key) if store is not None else None
+        if slot is not None:
+            logger.info(f"Semantic cache exact hit: {namespace}")
+            return store.values[slot]
+
+        if model is not None:
+            try:
+                payload = await self._get_redis().hget(self._entry_key(namespace, key), "value")
+            except RedisError as e:
+                logger.warning(f"Semantic cache read failed: {e}")
+                payload = None
+            value = None
+            if payload is not None:
+                try:
+                    value = model.model_validate_json(payload)
+                except ValidationError as e:
+                    logger.warning(f"Semantic cache entry is stale, ignoring it: {e}")
+            if value is not None:
+                logger.info(f"Semantic cache shared exact hit: {namespace}")
+                vector = None if exact else await self._embed(key, text)
+                self._store(namespace).add(key, vector, value)
+                return value
+
+        if exact or store is None or store.size == 0:
+            return None
+
+        vector = await self._embed(key, text)
+        if vector is None:
+            return None
+
+        similarities = store.vectors[: store.size] @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            logger.info(f"Semantic cache hit: {namespace} (similarity: {similarities[best]:.3f})")
+            return store.values[best]
+
+        return None
+
+    async def set(self, namespace: str, text: str, value: BaseModel, exact: bool = False) -> None:
+        """
+        Store a response for content in a namespace.
+
+        Args:
+            namespace: Partition key describing the request options
+            text: Request content
+            value: Response model to cache
+            exact: Skip the embedding; the entry only serves exact lookups
+        """
+        if not self.enabled:
+            return
+
+        key = self._hash(text)
+        vector = None if exact else await self._embed(key, text)
+        self._store(namespace).add(key, vector, value)
+
+        entry = self._entry_key(namespace, key)
+        index = f"{self.KEY_PREFIX}{namespace}:index"
+        now = time.time()
+        try:
+            async with self._get_redis().pipeline(transaction=False) as pipe:
+                pipe.hset(entry, mapping={
+                    "value": value.model_dump_json(),
+                    "vector": vector.tobytes() if vector is not None else b"",
+                })
+                pipe.expire(entry, self.ttl)
+                # Keep the index to live entries, newest ``capacity`` only
+                pipe.zadd(index, {key.hex(): now})
+                pipe.zremrangebyscore(index, "-inf", now - self.ttl)
+                pipe.zremrangebyrank(index, 0, -self.capacity - 1)
+                pipe.expire(index, self.ttl)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Semantic cache write failed: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    @staticmethod
+    def hit(value: ModelT, processing_time: float) -> ModelT:
+        """Return a cached response stamped with the lookup time."""
+        return value.model_copy(update={"processing_time": processing_time})
+
+
+# Global cache instance
+semantic_cache = SemanticCache(
+    threshold=settings.semantic_cache_threshold,
+    dimensions=settings.semantic_cache_dimensions,
+    ttl=settings.semantic_cache_ttl,
+)
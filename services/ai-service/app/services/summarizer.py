@@ -1,16 +1,27 @@
 """Summarization service with Claude, OpenAI, and Gemini integration."""
 
+import asyncio
+import hashlib
 import re
 import time
-from typing import List, Optional, Tuple
-from anthropic import Anthropic, APIError, APITimeoutError, RateLimitError
-from openai import OpenAI, APIError as OpenAIAPIError
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from anthropic import AsyncAnthropic, APIError, APITimeoutError, RateLimitError
+from openai import AsyncOpenAI, APIError as OpenAIAPIError
 try:
     import google.generativeai as genai
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
     genai = None
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional at import time
+    ahocorasick = None
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional at import time
+    tiktoken = None
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -21,12 +32,17 @@ from tenacity import (
 from loguru import logger
 
 from app.core.config import settings
+from app.core.http import get_http_client
+from app.core.rate_limiter import throttle
 from app.models.article import (
     SummarizeRequest,
     SummarizeResponse,
     SummaryLength,
+    LanguageCode,
     AIProvider,
 )
+from app.services.semantic_cache import semantic_cache
+from app.services.summary_cache import summary_cache
 
 # Keyword mappings for category detection (supports both English and Nepali)
 CATEGORY_KEYWORDS = {
@@ -78,18 +94,274 @@ CATEGORY_KEYWORDS = {
 }
 
 
+def _build_keyword_entries() -> List[Tuple[str, Tuple[str, ...]]]:
+    """Pair each lowercased keyword with the categories listing it."""
+    categories_by_keyword: Dict[str, List[str]] = {}
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            categories_by_keyword.setdefault(keyword.lower(), []).append(category)
+    return [(keyword, tuple(categories)) for keyword, categories in categories_by_keyword.items()]
+
+
+_KEYWORD_ENTRIES = _build_keyword_entries()
+
+
+def _build_keyword_automaton():
+    """
+    Build one Aho-Corasick automaton over every category keyword.
+
+    Each keyword maps to its entry in _KEYWORD_ENTRIES, so a single pass
+    over the text finds every keyword of every category. Returns None when
+    pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for entry in _KEYWORD_ENTRIES:
+        automaton.add_word(entry[0], entry)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Content is scanned for keywords in blocks of this many characters; blocks
+# overlap by the longest keyword so no occurrence is split between them
+_KEYWORD_BLOCK_CHARS = 4096
+_KEYWORD_BLOCK_OVERLAP = max(len(keyword) for keyword, _ in _KEYWORD_ENTRIES) - 1
+# Scanning stops once the leading category has at least this many distinct
+# keywords and at least twice as many as the runner-up
+_DOMINANT_MIN_HITS = 3
+
+VALID_CATEGORIES = frozenset({
+    'politics', 'sports', 'entertainment', 'business', 'technology',
+    'health', 'education', 'international', 'opinion', 'general',
+})
+
+# Category label, as a [CATEGORY] marker (group 1) or an inline label such as
+# "Category: Politics", "**Category**: Politics" or "category - Politics" (group 2)
+_CATEGORY_RE = re.compile(
+    r'\[CATEGORY\]\s*(\w+)|(?:\*\*)?category(?:\*\*)?\s*[:\-]\s*(\w+)', re.IGNORECASE
+)
+# Output format instructions closing every system prompt
+_OUTPUT_FORMAT = """
+
+OUTPUT FORMAT (you MUST follow this exactly):
+[SUMMARY]
+<your summary here>
+
+[KEY POINTS]
+- Point 1
+- Point 2
+- Point 3
+
+[CATEGORY]
+<single category name in English>
+[END]"""
+_USER_PROMPT_PREFIX = "Please summarize and classify the following article:\n\n"
+# Article tokens kept from the end when content is truncated
+_TAIL_TOKENS = 500
+_TRUNCATION_MARKER = "\n...[truncated]...\n"
+# Approximate characters per token when tiktoken is not installed
+_CHARS_PER_TOKEN = 4
+# Lets Anthropic cache the system prompt prefix across requests
+_PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Generation stops at the end marker instead of running on after the category
+_END_MARKER = "[END]"
+STOP_SEQUENCES = [_END_MARKER]
+# Output token allowance per English word, and words allowed for key points
+_TOKENS_PER_WORD = 2
+_KEY_POINTS_WORDS = 150
+
+# Section markers of a formatted response
+_SUMMARY_MARKER = "[SUMMARY]"
+_KEY_POINTS_MARKER = "[KEY POINTS]"
+_CATEGORY_MARKER = "[CATEGORY]"
+# Bullet lines ("- ", "• ", "* "), capturing the point text
+_BULLET_RE = re.compile(r"^[ \t]*[-•*]+[ \t]*(.*?)[^\S\n]*$", re.M)
+
+_WORD_RE = re.compile(r"\S+")
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words without building a list of them."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _elapsed(start_ns: int) -> float:
+    """Seconds since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+_encoding: Any = None
+
+
+def _get_encoding() -> Any:
+    """Get the tokenizer used for input budgets, or None if unavailable."""
+    global _encoding
+    if _encoding is None and tiktoken is not None:
+        try:
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:  # the BPE file is downloaded on first use
+            logger.warning(f"Tokenizer unavailable, estimating tokens from length: {e}")
+            _encoding = False
+    return _encoding or None
+
+
+def load_tokenizer() -> None:
+    """Load the tokenizer at startup so the first long article does not fetch it."""
+    if _get_encoding() is not None:
+        logger.info("Tokenizer loaded: cl100k_base")
+
+
+def _truncate_content(content: str, budget: int) -> str:
+    """
+    Keep the head and a short tail of content longer than a token budget.
+
+    Token counts come from tiktoken's cl100k_base encoding when available,
+    and are estimated from character length otherwise. A budget of 0
+    disables truncation.
+    """
+    # A character is at most 4 UTF-8 bytes, and a token at least one byte
+    if budget <= 0 or len(content) * 4 <= budget:
+        return content
+
+    tail = min(_TAIL_TOKENS, budget // 4)
+    encoding = _get_encoding()
+    if encoding is None:
+        if len(content) <= budget * _CHARS_PER_TOKEN:
+            return content
+        head_chars = (budget - tail) * _CHARS_PER_TOKEN
+        return content[:head_chars] + _TRUNCATION_MARKER + content[-tail * _CHARS_PER_TOKEN:]
+
+    tokens = encoding.encode(content, disallowed_special=())
+    if len(tokens) <= budget:
+        return content
+    return (
+        encoding.decode(tokens[:budget - tail])
+        + _TRUNCATION_MARKER
+        + encoding.decode(tokens[-tail:])
+    )
+
+
+def _localized_system_prompt(head: str, language: str) -> str:
+    """Complete a system prompt head for a non-English output language."""
+    return (
+        f"{head}\n- Write the summary and key points in {language.upper()} "
+        f"language, but keep the category in ENGLISH{_OUTPUT_FORMAT}"
+    )
+
+
+class _SummaryStream:
+    """Extract the [SUMMARY] section from a response as it streams in."""
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._start = -1  # Start of summary text not returned yet
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        """
+        Add a chunk of model output.
+
+        Returns the summary text that became final with this chunk. Text that
+        may still turn out to be a section marker or trailing whitespace is
+        held back, so the returned pieces join up to the stripped summary.
+        """
+        self.text += chunk
+        if self._done:
+            return ""
+
+        if self._start < 0:
+            at = self.text.find(_SUMMARY_MARKER)
+            if at < 0:
+                return ""
+            self._start = at + len(_SUMMARY_MARKER)
+
+        start = self._start
+        if not self._started:
+            # Skip whitespace between the marker and the summary
+            start = len(self.text) - len(self.text[start:].lstrip())
+
+        end = len(self.text)
+        for marker in (_KEY_POINTS_MARKER, _CATEGORY_MARKER):
+            at = self.text.find(marker, start)
+            if 0 <= at < end:
+                end = at
+                self._done = True
+        if not self._done:
+            bracket = self.text.rfind("[", start)
+            if bracket >= 0 and len(self.text) - bracket < len(_KEY_POINTS_MARKER):
+                end = bracket
+
+        end = start + len(self.text[start:end].rstrip())
+        if end <= start:
+            return ""
+        self._start = end
+        self._started = True
+        return self.text[start:end]
+
+
 class SummarizerService:
     """Service for article summarization using AI models."""
 
-    def __init__(self) -> None:
-        """Initialize the summarizer service with API clients."""
-        self.anthropic_client = Anthropic(api_key=settings.anthropic_api_key) if settings.anthropic_api_key else None
-        self.openai_client = OpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else None
+    def __init__(
+        self,
+        anthropic_client: Optional[AsyncAnthropic] = None,
+        openai_client: Optional[AsyncOpenAI] = None,
+    ) -> None:
+        """
+        Initialize the summarizer service with API clients.
+
+        Default clients are async and share the process-wide connection pool,
+        so a provider round trip never blocks the event loop.
+
+        Args:
+            anthropic_client: Client to use instead of one built from settings
+            openai_client: Client to use instead of one built from settings
+        """
+        http_client = get_http_client()
+        self.anthropic_client = anthropic_client or (
+            AsyncAnthropic(api_key=settings.anthropic_api_key, http_client=http_client)
+            if settings.anthropic_api_key else None
+        )
+        self.openai_client = openai_client or (
+            AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
+            if settings.openai_api_key else None
+        )
         self.gemini_client = None
         if GEMINI_AVAILABLE and settings.gemini_api_key:
             genai.configure(api_key=settings.gemini_api_key)
             self.gemini_client = genai.GenerativeModel(settings.gemini_model)
 
+        # Caps in-flight calls per provider so bursts queue here instead of
+        # being rejected with 429s and retried with backoff
+        self._provider_limits: Dict[AIProvider, asyncio.Semaphore] = {
+            AIProvider.CLAUDE: asyncio.Semaphore(settings.claude_max_concurrent),
+            AIProvider.OPENAI: asyncio.Semaphore(settings.openai_max_concurrent),
+            AIProvider.GEMINI: asyncio.Semaphore(settings.gemini_max_concurrent),
+        }
+
+        # Only length, key points and language vary, so every system prompt
+        # is rendered once up front and requests share the same string
+        self._system_prompts: Dict[Tuple[SummaryLength, bool, LanguageCode], str] = {}
+        for length in SummaryLength:
+            for key_points in (False, True):
+                head = self._render_system_prompt(length, key_points)
+                for language in LanguageCode:
+                    self._system_prompts[(length, key_points, language)] = (
+                        head + _OUTPUT_FORMAT
+                        if language == LanguageCode.EN
+                        else _localized_system_prompt(head, language.value)
+                    )
+
+        # Summaries being generated, by request key; identical concurrent
+        # requests await the same task instead of calling the provider again
+        self._inflight: Dict[bytes, "asyncio.Task[SummarizeResponse]"] = {}
+
     def _get_word_target(self, length: SummaryLength) -> int:
         """Get target word count based on summary length."""
         targets = {
@@ -99,15 +371,62 @@ class SummarizerService:
         }
         return targets[length]
 
+    def _max_output_tokens(self, request: SummarizeRequest) -> int:
+        """
+        Output token cap for a request.
+
+        English output is capped at about 1.5x the target length plus the
+        key points, so a model that keeps going is cut off early. Other
+        languages tokenize far less predictably and keep the configured limit.
+        """
+        if request.language != LanguageCode.EN:
+            return settings.max_tokens
+
+        words = self._get_word_target(request.length) * 3 // 2 + 20
+        if request.key_points:
+            words += _KEY_POINTS_WORDS
+        return min(settings.max_tokens, words * _TOKENS_PER_WORD)
+
+    def _gemini_config(self, request: SummarizeRequest) -> Dict[str, Any]:
+        """Gemini generation settings matching the other providers' limits."""
+        return {
+            "max_output_tokens": self._max_output_tokens(request),
+            "stop_sequences": STOP_SEQUENCES,
+        }
+
+    @staticmethod
+    def _keyword_blocks(title: str, content: str) -> Iterator[str]:
+        """Yield the lowercased title, then overlapping lowercased blocks of content."""
+        if title:
+            yield title.lower()
+        for start in range(0, len(content), _KEYWORD_BLOCK_CHARS):
+            yield content[start:start + _KEYWORD_BLOCK_CHARS + _KEYWORD_BLOCK_OVERLAP].lower()
+
     def _detect_category_from_keywords(self, title: str, content: str) -> str:
         """Detect category based on keyword matching in title and content."""
-        text = f"{title} {content}".lower()
+        # Each keyword counts once, however often it occurs
+        matched: Set[Tuple[str, Tuple[str, ...]]] = set()
+        counts: Counter = Counter()
 
-        category_scores = {}
-        for category, keywords in CATEGORY_KEYWORDS.items():
-            score = sum(1 for keyword in keywords if keyword.lower() in text)
-            if score > 0:
-                category_scores[category] = score
+        for text in self._keyword_blocks(title, content):
+            if _KEYWORD_AUTOMATON is not None:
+                found = {entry for _, entry in _KEYWORD_AUTOMATON.iter(text)}
+            else:
+                found = {entry for entry in _KEYWORD_ENTRIES if entry[0] in text}
+            for _, categories in found - matched:
+                counts.update(categories)
+            matched |= found
+
+            # Stop early once one category clearly leads
+            ranked = counts.most_common(2)
+            if ranked and ranked[0][1] >= _DOMINANT_MIN_HITS and (
+                len(ranked) == 1 or ranked[0][1] >= 2 * ranked[1][1]
+            ):
+                break
+
+        category_scores = {
+            category: counts[category] for category in CATEGORY_KEYWORDS if counts[category]
+        }
 
         if category_scores:
             # Return category with highest score
@@ -117,9 +436,9 @@ class SummarizerService:
 
         return "general"
 
-    def _build_system_prompt(self, request: SummarizeRequest) -> str:
-        """Build system prompt for summarization."""
-        word_target = self._get_word_target(request.length)
+    def _render_system_prompt(self, length: SummaryLength, key_points: bool) -> str:
+        """Render the language-independent part of the system prompt."""
+        word_target = self._get_word_target(length)
 
         prompt = f"""You are an expert content summarizer and classifier.
 Your task is to:
@@ -135,38 +454,22 @@ Guidelines:
 - Preserve important facts and figures
 - Keep the summary coherent and well-structured"""
 
-        if request.key_points:
+        if key_points:
             prompt += "\n- After the summary, provide 3-5 key points as a bulleted list"
 
-        if request.language.value != "en":
-            prompt += f"\n- Write the summary and key points in {request.language.value.upper()} language, but keep the category in ENGLISH"
-
-        prompt += """
-
-OUTPUT FORMAT (you MUST follow this exactly):
-[SUMMARY]
-<your summary here>
-
-[KEY POINTS]
-- Point 1
-- Point 2
-- Point 3
-
-[CATEGORY]
-<single category name in English>"""
-
         return prompt
 
-    def _build_user_prompt(self, request: SummarizeRequest) -> str:
-        """Build user prompt with article content."""
-        content = request.article.content
+    def _build_system_prompt(self, request: SummarizeRequest) -> str:
+        """Build system prompt for summarization."""
+        return self._system_prompts[(request.length, request.key_points, request.language)]
 
+    def _build_user_prompt(self, request: SummarizeRequest) -> str:
+        """Build user prompt with article content truncated to the input budget."""
+        content = _truncate_content(request.article.content, settings.summary_max_input_tokens)
         if request.article.title:
-            content = f"Title: {request.article.title}\n\n{content}"
-
-        prompt = f"Please summarize and classify the following article:\n\n{content}"
+            return f"{_USER_PROMPT_PREFIX}Title: {request.article.title}\n\n{content}"
 
-        return prompt
+        return _USER_PROMPT_PREFIX + content
 
     @retry(
         stop=stop_after_attempt(3),
@@ -185,18 +488,33 @@ OUTPUT FORMAT (you MUST follow this exactly):
         try:
             logger.info(f"Calling Claude API with model: {settings.claude_model}")
 
-            response = self.anthropic_client.messages.create(
-                model=settings.claude_model,
-                max_tokens=settings.max_tokens,
-                temperature=settings.temperature,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ],
-            )
+            # The system prompt is identical for every request with the same
+            # options, so it is marked as a cacheable prefix; the article
+            # follows in the user message
+            await throttle(AIProvider.CLAUDE, system_prompt, user_prompt)
+            async with self._provider_limits[AIProvider.CLAUDE]:
+                response = await self.anthropic_client.messages.create(
+                    model=settings.claude_model,
+                    max_tokens=self._max_output_tokens(request),
+                    temperature=settings.temperature,
+                    stop_sequences=STOP_SEQUENCES,
+                    system=[
+                        {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+                    ],
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    extra_headers=_PROMPT_CACHING_HEADERS,
+                )
 
             content = response.content[0].text
-            logger.info(f"Claude API response received. Tokens used: {response.usage.input_tokens + response.usage.output_tokens}")
+            usage = response.usage
+            # Only reported when prompt caching is active; older SDK models
+            # keep it as an extra field
+            logger.info(
+                f"Claude API response received. Tokens used: {usage.input_tokens + usage.output_tokens} "
+                f"(cached prompt tokens read: {getattr(usage, 'cache_read_input_tokens', None) or 0})"
+            )
 
             # Parse summary, key points, and category
             summary, key_points, category = self._parse_response(
@@ -238,15 +556,18 @@ OUTPUT FORMAT (you MUST follow this exactly):
         try:
             logger.info(f"Calling OpenAI API with model: {settings.openai_model}")
 
-            response = self.openai_client.chat.completions.create(
-                model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=settings.max_tokens,
-                temperature=settings.temperature,
-            )
+            await throttle(AIProvider.OPENAI, system_prompt, user_prompt)
+            async with self._provider_limits[AIProvider.OPENAI]:
+                response = await self.openai_client.chat.completions.create(
+                    model=settings.openai_model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    max_tokens=self._max_output_tokens(request),
+                    temperature=settings.temperature,
+                    stop=STOP_SEQUENCES,
+                )
 
             content = response.choices[0].message.content
             logger.info(f"OpenAI API response received. Tokens used: {response.usage.total_tokens}")
@@ -282,7 +603,11 @@ OUTPUT FORMAT (you MUST follow this exactly):
             # Combine prompts for Gemini (it handles system instruction differently)
             full_prompt = f"{system_prompt}\n\n{user_prompt}"
 
-            response = self.gemini_client.generate_content(full_prompt)
+            await throttle(AIProvider.GEMINI, full_prompt)
+            async with self._provider_limits[AIProvider.GEMINI]:
+                response = await self.gemini_client.generate_content_async(
+                    full_prompt, generation_config=self._gemini_config(request)
+                )
 
             content = response.text
             logger.info(f"Gemini API response received. Content length: {len(content)}")
@@ -301,6 +626,126 @@ OUTPUT FORMAT (you MUST follow this exactly):
             logger.error(f"Gemini API error: {e}")
             raise
 
+    async def _race_providers(
+        self, request: SummarizeRequest
+    ) -> Tuple[str, Optional[List[str]], Optional[str], AIProvider, str]:
+        """
+        Summarize with every configured provider at once and keep the first success.
+
+        Wall-clock time is that of the fastest healthy provider, and a
+        provider that fails or is rate limited is covered by the others.
+        Calls still running when one succeeds are cancelled.
+
+        Returns:
+            Summary, key points, category, winning provider and its model
+
+        Raises:
+            ValueError: If no provider is configured
+            Exception: The first failure, if every provider fails
+        """
+        calls = []
+        if self.anthropic_client:
+            calls.append((self._summarize_with_claude, AIProvider.CLAUDE, settings.claude_model))
+        if self.openai_client:
+            calls.append((self._summarize_with_openai, AIProvider.OPENAI, settings.openai_model))
+        if self.gemini_client:
+            calls.append((self._summarize_with_gemini, AIProvider.GEMINI, settings.gemini_model))
+        if not calls:
+            raise ValueError("No AI provider configured")
+
+        tasks = {
+            asyncio.ensure_future(call(request)): (provider, model)
+            for call, provider, model in calls
+        }
+        errors = []
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        provider, model = tasks[task]
+                        logger.info(f"Provider race won by {provider.value}")
+                        return (*task.result(), provider, model)
+                    errors.append(task.exception())
+            raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _stream_text(self, request: SummarizeRequest) -> AsyncIterator[str]:
+        """
+        Stream the raw model output for a summarization request.
+
+        Streams are not retried: text already passed on cannot be taken back.
+
+        Raises:
+            ValueError: If provider is not configured or unsupported
+        """
+        system_prompt = self._build_system_prompt(request)
+        user_prompt = self._build_user_prompt(request)
+
+        if request.provider == AIProvider.CLAUDE:
+            if not self.anthropic_client:
+                raise ValueError("Anthropic API key not configured")
+
+            await throttle(AIProvider.CLAUDE, system_prompt, user_prompt)
+            async with self._provider_limits[AIProvider.CLAUDE]:
+                async with self.anthropic_client.messages.stream(
+                    model=settings.claude_model,
+                    max_tokens=self._max_output_tokens(request),
+                    temperature=settings.temperature,
+                    stop_sequences=STOP_SEQUENCES,
+                    system=[
+                        {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+                    ],
+                    messages=[{"role": "user", "content": user_prompt}],
+                    extra_headers=_PROMPT_CACHING_HEADERS,
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+
+        elif request.provider == AIProvider.OPENAI:
+            if not self.openai_client:
+                raise ValueError("OpenAI API key not configured")
+
+            await throttle(AIProvider.OPENAI, system_prompt, user_prompt)
+            async with self._provider_limits[AIProvider.OPENAI]:
+                stream = await self.openai_client.chat.completions.create(
+                    model=settings.openai_model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    max_tokens=self._max_output_tokens(request),
+                    temperature=settings.temperature,
+                    stop=STOP_SEQUENCES,
+                    stream=True,
+                )
+                try:
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            yield chunk.choices[0].delta.content
+                finally:
+                    await stream.close()
+
+        elif request.provider == AIProvider.GEMINI:
+            if not self.gemini_client:
+                raise ValueError("Gemini API key not configured or google-generativeai not installed")
+
+            await throttle(AIProvider.GEMINI, system_prompt, user_prompt)
+            async with self._provider_limits[AIProvider.GEMINI]:
+                response = await self.gemini_client.generate_content_async(
+                    f"{system_prompt}\n\n{user_prompt}",
+                    generation_config=self._gemini_config(request),
+                    stream=True,
+                )
+                async for chunk in response:
+                    yield chunk.text
+
+        else:
+            raise ValueError(f"Unsupported provider: {request.provider}")
+
     def _parse_response(
         self,
         content: str,
@@ -313,57 +758,49 @@ OUTPUT FORMAT (you MUST follow this exactly):
         key_points = None
         category = None
 
-        valid_categories = ['politics', 'sports', 'entertainment', 'business', 'technology',
-                          'health', 'education', 'international', 'opinion', 'general']
-
         try:
-            # Extract Category - try multiple patterns
-            category_patterns = [
-                r'\[CATEGORY\]\s*\n?\s*(\w+)',  # [CATEGORY]\nPolitics
-                r'Category:\s*(\w+)',            # Category: Politics
-                r'\*\*Category\*\*:\s*(\w+)',    # **Category**: Politics
-                r'category\s*[:\-]\s*(\w+)',     # category: Politics or category - Politics
-            ]
-
-            for pattern in category_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
-                if match:
-                    extracted_category = match.group(1).strip().lower()
-                    if extracted_category in valid_categories:
-                        category = extracted_category
-                        logger.info(f"Extracted category from AI: {category}")
-                        break
-
-            # Extract Key Points
-            if "[KEY POINTS]" in content:
-                parts = content.split("[KEY POINTS]")
-                key_points_text = parts[1].split("[CATEGORY]")[0] if "[CATEGORY]" in parts[1] else parts[1]
-                summary_part = parts[0].replace("[SUMMARY]", "").strip()
+            # Extract Category in one scan; the [CATEGORY] marker wins over
+            # inline labels, otherwise the first valid label is used
+            labelled = None
+            for match in _CATEGORY_RE.finditer(content):
+                marker, label = match.groups()
+                if marker is not None and marker.lower() in VALID_CATEGORIES:
+                    category = marker.lower()
+                    break
+                if labelled is None and label is not None and label.lower() in VALID_CATEGORIES:
+                    labelled = label.lower()
+            category = category or labelled
+            if category:
+                logger.info(f"Extracted category from AI: {category}")
+
+            # Locate the sections once and slice them out
+            summary_at = content.find(_SUMMARY_MARKER)
+            key_points_at = content.find(_KEY_POINTS_MARKER)
+
+            if key_points_at >= 0:
+                if 0 <= summary_at < key_points_at:
+                    summary_part = content[summary_at + len(_SUMMARY_MARKER):key_points_at].strip()
+                else:
+                    # Key points without a summary marker
+                    summary_part = content[:key_points_at].strip()
 
                 if summary_part:
                     summary = summary_part
 
-                # Extract bullet points
-                key_points = []
-                for line in key_points_text.split("\n"):
-                    line = line.strip()
-                    if line.startswith("-") or line.startswith("•") or line.startswith("*"):
-                        point = line.lstrip("-•*").strip()
-                        if point and len(point) > 5:  # Filter out empty or very short points
-                            key_points.append(point)
-
-                if not key_points:
-                    key_points = None
-
-            elif "[SUMMARY]" in content:
-                # Extract just the summary part
-                parts = content.split("[SUMMARY]")
-                if len(parts) > 1:
-                    summary_text = parts[1]
-                    # Remove category section if present
-                    if "[CATEGORY]" in summary_text:
-                        summary_text = summary_text.split("[CATEGORY]")[0]
-                    summary = summary_text.strip()
+                key_points_start = key_points_at + len(_KEY_POINTS_MARKER)
+                category_at = content.find(_CATEGORY_MARKER, key_points_start)
+                key_points_text = content[key_points_start:category_at if category_at >= 0 else None]
+
+                # Extract bullet points, filtering out empty or very short ones
+                key_points = [
+                    point for point in _BULLET_RE.findall(key_points_text) if len(point) > 5
+                ] or None
+
+            elif summary_at >= 0:
+                # Extract just the summary part, up to the category section
+                summary_start = summary_at + len(_SUMMARY_MARKER)
+                category_at = content.find(_CATEGORY_MARKER, summary_start)
+                summary = content[summary_start:category_at if category_at >= 0 else None].strip()
 
         except Exception as e:
             logger.error(f"Error parsing AI response: {e}")
@@ -379,10 +816,25 @@ OUTPUT FORMAT (you MUST follow this exactly):
 
         return summary, key_points, category
 
+    @staticmethod
+    def _inflight_key(request: SummarizeRequest) -> bytes:
+        """Key identifying requests that produce the same summary."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{request.provider.value}|{request.race}|{request.length.value}|{request.key_points}|"
+            f"{request.language.value}|{request.article.title or ''}|".encode()
+        )
+        digest.update(request.article.content.encode())
+        return digest.digest()
+
     async def summarize(self, request: SummarizeRequest) -> SummarizeResponse:
         """
         Summarize an article using the specified AI provider.
 
+        Concurrent calls for the same article and options share a single
+        provider call. A caller that is cancelled does not cancel the shared
+        work for the others.
+
         Args:
             request: Summarization request with article and parameters
 
@@ -393,11 +845,37 @@ OUTPUT FORMAT (you MUST follow this exactly):
             ValueError: If provider is not configured
             APIError: If API call fails after retries
         """
-        start_time = time.time()
+        key = self._inflight_key(request)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._summarize(request))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("Joining in-flight summarization of the same article")
+
+        return await asyncio.shield(task)
+
+    async def _summarize(self, request: SummarizeRequest) -> SummarizeResponse:
+        """Summarize an article, checking the exact and semantic caches first."""
+        start_ns = time.perf_counter_ns()
+
+        cached = await summary_cache.get(request)
+        if cached is not None:
+            logger.info("Summary cache hit")
+            return cached.model_copy(update={"processing_time": _elapsed(start_ns)})
+
+        cache_namespace, cache_text = self._cache_key(request)
+        cached = await semantic_cache.get(cache_namespace, cache_text, SummarizeResponse)
+        if cached is not None:
+            return semantic_cache.hit(cached, _elapsed(start_ns))
 
         try:
             # Get summary and key points
-            if request.provider == AIProvider.CLAUDE:
+            provider = request.provider
+            if request.race:
+                summary, key_points, category, provider, model_used = await self._race_providers(request)
+            elif request.provider == AIProvider.CLAUDE:
                 summary, key_points, category = await self._summarize_with_claude(request)
                 model_used = settings.claude_model
             elif request.provider == AIProvider.OPENAI:
@@ -409,35 +887,124 @@ OUTPUT FORMAT (you MUST follow this exactly):
             else:
                 raise ValueError(f"Unsupported provider: {request.provider}")
 
-            # Calculate metrics
-            original_length = len(request.article.content)
-            summary_word_count = len(summary.split())
-            original_word_count = len(request.article.content.split())
-            reduction_ratio = 1 - (summary_word_count / original_word_count) if original_word_count > 0 else 0
-            processing_time = time.time() - start_time
-
-            logger.info(
-                f"Summarization complete: {original_word_count} -> {summary_word_count} words "
-                f"({reduction_ratio:.2%} reduction) in {processing_time:.2f}s, category: {category}"
+            response = self._build_response(
+                request, summary, key_points, category, model_used, start_ns, provider
             )
+            await summary_cache.set(request, response)
+            await semantic_cache.set(cache_namespace, cache_text, response)
 
-            return SummarizeResponse(
-                summary=summary,
-                key_points=key_points,
-                category=category,
-                word_count=summary_word_count,
-                original_length=original_length,
-                reduction_ratio=reduction_ratio,
-                provider=request.provider,
-                model=model_used,
-                processing_time=processing_time,
-            )
+            return response
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = _elapsed(start_ns)
             logger.error(f"Summarization failed after {processing_time:.2f}s: {e}")
             raise
 
+    async def summarize_stream(self, request: SummarizeRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Summarize an article, yielding the summary while it is generated.
+
+        Yields ``{"event": "summary", "text": ...}`` for each new piece of
+        the summary section, then one ``{"event": "done", ...}`` carrying the
+        SummarizeResponse fields once the output has been parsed. Cache hits
+        yield only the final event.
+
+        Args:
+            request: Summarization request with article and parameters
+
+        Yields:
+            Summary text events, then the final response event
+
+        Raises:
+            ValueError: If race is requested or the provider is not configured
+        """
+        if request.race:
+            raise ValueError("race is not supported for streaming summaries")
+
+        start_ns = time.perf_counter_ns()
+
+        cached = await summary_cache.get(request)
+        if cached is not None:
+            response = cached.model_copy(update={"processing_time": _elapsed(start_ns)})
+            yield {"event": "done", **response.model_dump(mode="json")}
+            return
+
+        cache_namespace, cache_text = self._cache_key(request)
+        cached = await semantic_cache.get(cache_namespace, cache_text, SummarizeResponse)
+        if cached is not None:
+            response = semantic_cache.hit(cached, _elapsed(start_ns))
+            yield {"event": "done", **response.model_dump(mode="json")}
+            return
+
+        models = {
+            AIProvider.CLAUDE: settings.claude_model,
+            AIProvider.OPENAI: settings.openai_model,
+            AIProvider.GEMINI: settings.gemini_model,
+        }
+        stream = _SummaryStream()
+        async for chunk in self._stream_text(request):
+            text = stream.feed(chunk)
+            if text:
+                yield {"event": "summary", "text": text}
+
+        summary, key_points, category = self._parse_response(
+            stream.text,
+            request.key_points,
+            request.article.title or "",
+            request.article.content,
+        )
+        response = self._build_response(
+            request, summary, key_points, category, models[request.provider], start_ns
+        )
+        await summary_cache.set(request, response)
+        await semantic_cache.set(cache_namespace, cache_text, response)
+
+        yield {"event": "done", **response.model_dump(mode="json")}
+
+    @staticmethod
+    def _cache_key(request: SummarizeRequest) -> Tuple[str, str]:
+        """Semantic cache namespace and text for a request."""
+        provider = "race" if request.race else request.provider.value
+        namespace = (
+            f"summarize:{provider}:{request.length.value}:"
+            f"{request.key_points}:{request.language.value}"
+        )
+        return namespace, f"{request.article.title or ''}\n{request.article.content}"
+
+    def _build_response(
+        self,
+        request: SummarizeRequest,
+        summary: str,
+        key_points: Optional[List[str]],
+        category: Optional[str],
+        model_used: str,
+        start_ns: int,
+        provider: Optional[AIProvider] = None,
+    ) -> SummarizeResponse:
+        """Compute summary metrics and build the response."""
+        original_length = len(request.article.content)
+        summary_word_count = _count_words(summary)
+        original_word_count = _count_words(request.article.content)
+        reduction_ratio = 1 - (summary_word_count / original_word_count) if original_word_count > 0 else 0
+        processing_time = _elapsed(start_ns)
+
+        logger.info(
+            f"Summarization complete: {original_word_count} -> {summary_word_count} words "
+            f"({reduction_ratio:.2%} reduction) in {processing_time:.2f}s, category: {category}"
+        )
+
+        return SummarizeResponse(
+            summary=summary,
+            key_points=key_points,
+            category=category,
+            word_count=summary_word_count,
+            original_length=original_length,
+            reduction_ratio=reduction_ratio,
+            provider=provider or request.provider,
+            model=model_used,
+            processing_time=processing_time,
+        )
+
 
 # Global service instance
 summarizer_service = SummarizerService()
@@ -0,0 +1,60 @@
+"""Two-tier cache for summarization responses."""
+
+import hashlib
+
+from app.core.config import settings
+from app.models.article import AIProvider, SummarizeRequest, SummarizeResponse
+from app.services.response_cache import ResponseCache
+
+
+class SummaryCache(ResponseCache[SummarizeRequest, SummarizeResponse]):
+    """
+    Cache summaries of identical articles in process memory and in Redis.
+
+    Re-scraped articles and retried tasks ask for the same summary with the
+    same options. Entries are kept in Redis for SUMMARY_CACHE_TTL seconds
+    and keyed by the configured model, so they are shared by API workers
+    and Celery tasks alike.
+    """
+
+    KEY_PREFIX = "summary:v1:"
+    response_model = SummarizeResponse
+
+    def __init__(self, capacity: int = 1024, ttl: int = 86400) -> None:
+        """
+        Initialize the summary cache.
+
+        Args:
+            capacity: Maximum entries kept in process memory
+            ttl: Redis entry lifetime in seconds
+        """
+        super().__init__(capacity, ttl, enabled=settings.summary_cache_enabled)
+
+    @staticmethod
+    def _key(request: SummarizeRequest) -> str:
+        """Build the cache key for everything that affects the output."""
+        if request.race:
+            model = "race"
+        else:
+            model = {
+                AIProvider.CLAUDE: settings.claude_model,
+                AIProvider.OPENAI: settings.openai_model,
+                AIProvider.GEMINI: settings.gemini_model,
+            }[request.provider]
+        raw = "|".join((
+            request.article.title or "",
+            request.article.content,
+            request.provider.value,
+            model,
+            request.length.value,
+            str(request.key_points),
+            request.language.value,
+        ))
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Global cache instance
+summary_cache = SummaryCache(
+    capacity=settings.summary_cache_size,
+    ttl=settings.summary_cache_ttl,
+)
@@ -0,0 +1,56 @@
+"""Two-tier cache for translation responses."""
+
+import hashlib
+
+from app.core.config import settings
+from app.models.article import AIProvider, TranslateRequest, TranslateResponse
+from app.services.response_cache import ResponseCache
+
+
+class TranslationCache(ResponseCache[TranslateRequest, TranslateResponse]):
+    """
+    Cache translations in process memory and in Redis.
+
+    Short phrases ("thank you", headlines re-used across feeds) are
+    translated over and over with identical parameters. Entries are kept in
+    Redis for TRANSLATION_CACHE_TTL seconds. Keys include the configured
+    model, so changing models does not serve the previous model's output.
+    """
+
+    KEY_PREFIX = "translate:v2:"
+    response_model = TranslateResponse
+
+    def __init__(self, capacity: int = 2048, ttl: int = 604800) -> None:
+        """
+        Initialize the translation cache.
+
+        Args:
+            capacity: Maximum entries kept in process memory
+            ttl: Redis entry lifetime in seconds
+        """
+        super().__init__(capacity, ttl, enabled=settings.translation_cache_enabled)
+
+    @staticmethod
+    def _key(request: TranslateRequest) -> str:
+        """Build the cache key for everything that affects the output."""
+        source = request.source_language.value if request.source_language else ""
+        model = {
+            AIProvider.CLAUDE: settings.claude_model,
+            AIProvider.OPENAI: settings.openai_model,
+        }.get(request.provider, "")
+        raw = "|".join((
+            request.content,
+            source,
+            request.target_language.value,
+            request.provider.value,
+            model,
+            str(request.preserve_formatting),
+        ))
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Global cache instance
+translation_cache = TranslationCache(
+    capacity=settings.translation_cache_size,
+    ttl=settings.translation_cache_ttl,
+)
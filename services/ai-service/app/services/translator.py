@@ -1,19 +1,18 @@
 """Translation service with Claude and OpenAI integration."""
 
+import asyncio
+import re
 import time
-from typing import Optional
-from anthropic import Anthropic, APIError, APITimeoutError, RateLimitError
-from openai import OpenAI, APIError as OpenAIAPIError
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log,
-)
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from anthropic import AsyncAnthropic, APIError, APITimeoutError, RateLimitError
+from openai import AsyncOpenAI, APIError as OpenAIAPIError
 from loguru import logger
 
 from app.core.config import settings
+from app.core.http import get_http_client
+from app.core.rate_limiter import throttle
+from app.services.language_detector import language_detector
+from app.services.translation_cache import translation_cache
 from app.models.article import (
     TranslateRequest,
     TranslateResponse,
@@ -21,34 +20,109 @@ from app.models.article import (
     AIProvider,
 )
 
+# Detected source languages below this confidence are left to the provider
+DETECTION_MIN_CONFIDENCE = 0.8
+# Items at most this long are combined into multi-segment prompts
+SEGMENT_MAX_CHARS = 2000
+# Maximum segments combined into a single provider call
+SEGMENT_BATCH_SIZE = 20
+
+_SEGMENT_RE = re.compile(r"<<<SEG:(\d+)>>>[ \t]*\n?")
+_SEGMENT_INSTRUCTIONS = """
+
+The input contains several independent segments. Each segment starts with a marker line of the form <<<SEG:n>>>.
+Translate every segment separately and output each translation after its original marker line.
+Keep the exact marker lines and their order, and output nothing else."""
+
+_LANGUAGE_NAMES: Dict[LanguageCode, str] = {
+    LanguageCode.EN: "English",
+    LanguageCode.ES: "Spanish",
+    LanguageCode.FR: "French",
+    LanguageCode.DE: "German",
+    LanguageCode.IT: "Italian",
+    LanguageCode.PT: "Portuguese",
+    LanguageCode.JA: "Japanese",
+    LanguageCode.ZH: "Chinese",
+    LanguageCode.KO: "Korean",
+    LanguageCode.RU: "Russian",
+}
+
+# Detector labels (ISO 639-1 codes) of the supported languages
+_LANGUAGE_CODES: Dict[str, LanguageCode] = {code.value: code for code in LanguageCode}
+
 
 class TranslatorService:
     """Service for text translation using AI models."""
 
     def __init__(self) -> None:
-        """Initialize the translator service with API clients."""
-        self.anthropic_client = Anthropic(api_key=settings.anthropic_api_key) if settings.anthropic_api_key else None
-        self.openai_client = OpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else None
+        """
+        Initialize the translator service with API clients.
+
+        Clients are async and share the process-wide connection pool, so a
+        provider round trip never blocks the event loop. Transient failures
+        (connection errors, 408/409/429 and 5xx responses) are retried by
+        the SDKs themselves with exponential backoff, up to MAX_RETRIES times.
+        """
+        http_client = get_http_client()
+        self.anthropic_client = (
+            AsyncAnthropic(
+                api_key=settings.anthropic_api_key,
+                http_client=http_client,
+                max_retries=settings.max_retries,
+            )
+            if settings.anthropic_api_key else None
+        )
+        self.openai_client = (
+            AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=http_client,
+                max_retries=settings.max_retries,
+            )
+            if settings.openai_api_key else None
+        )
+        # Requests answered without a provider call (source == target)
+        self.passthrough_count = 0
+        # Provider dispatch table: call and model name per provider
+        self._providers: Dict[AIProvider, Tuple[Callable[..., Awaitable[str]], str]] = {
+            AIProvider.CLAUDE: (self._translate_with_claude, settings.claude_model),
+            AIProvider.OPENAI: (self._translate_with_openai, settings.openai_model),
+        }
+        # Prompts depend only on the languages and formatting flag, so every
+        # combination is rendered once up front
+        self._system_prompts: Dict[Tuple[LanguageCode, Optional[LanguageCode], bool], str] = {
+            (target, source, preserve_formatting): self._render_system_prompt(
+                target, source, preserve_formatting
+            )
+            for target in LanguageCode
+            for source in (None, *LanguageCode)
+            for preserve_formatting in (False, True)
+        }
+
+    def _get_provider(self, provider: AIProvider) -> Tuple[Callable[..., Awaitable[str]], str]:
+        """Look up the translation call and model name for a provider."""
+        try:
+            return self._providers[provider]
+        except KeyError:
+            raise ValueError(f"Unsupported provider: {provider}") from None
 
     def _get_language_name(self, code: LanguageCode) -> str:
         """Get full language name from code."""
-        language_names = {
-            LanguageCode.EN: "English",
-            LanguageCode.ES: "Spanish",
-            LanguageCode.FR: "French",
-            LanguageCode.DE: "German",
-            LanguageCode.IT: "Italian",
-            LanguageCode.PT: "Portuguese",
-            LanguageCode.JA: "Japanese",
-            LanguageCode.ZH: "Chinese",
-            LanguageCode.KO: "Korean",
-            LanguageCode.RU: "Russian",
-        }
-        return language_names.get(code, code.value.upper())
+        return _LANGUAGE_NAMES.get(code, code.value.upper())
 
     def _build_system_prompt(self, request: TranslateRequest) -> str:
-        """Build system prompt for translation."""
-        target_lang = self._get_language_name(request.target_language)
+        """Look up the system prompt for a translation request."""
+        return self._system_prompts[
+            (request.target_language, request.source_language, request.preserve_formatting)
+        ]
+
+    def _render_system_prompt(
+        self,
+        target_language: LanguageCode,
+        source_language: Optional[LanguageCode],
+        preserve_formatting: bool,
+    ) -> str:
+        """Render the system prompt for a language pair and formatting flag."""
+        target_lang = self._get_language_name(target_language)
 
         prompt = f"""You are an expert translator with deep knowledge of multiple languages and cultures.
 
@@ -60,38 +134,31 @@ Guidelines:
 - Use appropriate cultural context
 - Keep technical terms accurate"""
 
-        if request.source_language:
-            source_lang = self._get_language_name(request.source_language)
+        if source_language:
+            source_lang = self._get_language_name(source_language)
             prompt += f"\n- Translate from {source_lang} to {target_lang}"
         else:
             prompt += "\n- Automatically detect the source language"
 
-        if request.preserve_formatting:
+        if preserve_formatting:
             prompt += "\n- Preserve the original formatting (line breaks, spacing, etc.)"
 
         prompt += "\n\nProvide ONLY the translated text without any explanations or notes."
 
         return prompt
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((APIError, APITimeoutError, RateLimitError)),
-        before_sleep=before_sleep_log(logger, "WARNING"),
-    )
-    async def _translate_with_claude(self, request: TranslateRequest) -> str:
-        """Translate using Claude API with retry logic."""
+    async def _translate_with_claude(self, request: TranslateRequest, system_prompt: str) -> str:
+        """Translate using Claude API."""
         if not self.anthropic_client:
             raise ValueError("Anthropic API key not configured")
 
-        system_prompt = self._build_system_prompt(request)
-
         try:
             logger.info(
                 f"Calling Claude API for translation to {request.target_language.value}"
             )
 
-            response = self.anthropic_client.messages.create(
+            await throttle(AIProvider.CLAUDE, system_prompt, request.content)
+            response = await self.anthropic_client.messages.create(
                 model=settings.claude_model,
                 max_tokens=settings.max_tokens,
                 temperature=0.3,  # Lower temperature for more consistent translations
@@ -122,25 +189,18 @@ Guidelines:
             logger.error(f"Unexpected error in Claude translation: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(OpenAIAPIError),
-        before_sleep=before_sleep_log(logger, "WARNING"),
-    )
-    async def _translate_with_openai(self, request: TranslateRequest) -> str:
-        """Translate using OpenAI API with retry logic."""
+    async def _translate_with_openai(self, request: TranslateRequest, system_prompt: str) -> str:
+        """Translate using OpenAI API."""
         if not self.openai_client:
             raise ValueError("OpenAI API key not configured")
 
-        system_prompt = self._build_system_prompt(request)
-
         try:
             logger.info(
                 f"Calling OpenAI API for translation to {request.target_language.value}"
             )
 
-            response = self.openai_client.chat.completions.create(
+            await throttle(AIProvider.OPENAI, system_prompt, request.content)
+            response = await self.openai_client.chat.completions.create(
                 model=settings.openai_model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -164,14 +224,44 @@ Guidelines:
             logger.error(f"Unexpected error in OpenAI translation: {e}")
             raise
 
-    def _detect_source_language(self, content: str) -> LanguageCode:
+    async def _detect_source_language(self, content: str) -> Optional[LanguageCode]:
         """
-        Simple heuristic to detect source language.
-        In production, you'd use a proper language detection library.
+        Detect the source language with the local fastText model.
+
+        Returns None when the model is unavailable, the language is not
+        supported, or confidence is below DETECTION_MIN_CONFIDENCE; the
+        provider then detects the language itself.
         """
-        # For now, default to English
-        # In production, use libraries like langdetect or fasttext
-        return LanguageCode.EN
+        code, confidence = await language_detector.detect(content)
+        if confidence < DETECTION_MIN_CONFIDENCE:
+            return None
+        return _LANGUAGE_CODES.get(code)
+
+    async def _resolve_source(self, request: TranslateRequest) -> TranslateRequest:
+        """Fill in a detected source language when the request has none."""
+        if request.source_language is not None:
+            return request
+        source_lang = await self._detect_source_language(request.content)
+        if source_lang is None:
+            return request
+        logger.info(f"Detected source language: {source_lang.value}")
+        return request.model_copy(update={"source_language": source_lang})
+
+    def _passthrough(self, request: TranslateRequest) -> Optional[TranslateResponse]:
+        """Return the content unchanged when source and target languages match."""
+        if request.source_language is None or request.source_language != request.target_language:
+            return None
+        self.passthrough_count += 1
+        logger.debug(f"Translation passthrough: {request.target_language.value}")
+        return TranslateResponse(
+            translated_content=request.content,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            provider=request.provider,
+            model="noop",
+            confidence=1.0,
+            processing_time=0.0,
+        )
 
     async def translate(self, request: TranslateRequest) -> TranslateResponse:
         """
@@ -187,33 +277,34 @@ Guidelines:
             ValueError: If provider is not configured
             APIError: If API call fails after retries
         """
-        start_time = time.time()
+        request = await self._resolve_source(request)
+        passthrough = self._passthrough(request)
+        if passthrough is not None:
+            return passthrough
+
+        start_time = time.perf_counter()
+
+        target = request.target_language.value
+        cached = await translation_cache.get(request)
+        if cached is not None:
+            logger.info(f"Translation cache hit: {target}")
+            return cached.model_copy(update={"processing_time": time.perf_counter() - start_time})
 
         try:
-            # Detect source language if not provided
-            source_lang = request.source_language
-            if not source_lang:
-                source_lang = self._detect_source_language(request.content)
-                logger.info(f"Detected source language: {source_lang.value}")
+            source_lang = request.source_language or LanguageCode.EN
 
             # Perform translation
-            if request.provider == AIProvider.CLAUDE:
-                translated_content = await self._translate_with_claude(request)
-                model_used = settings.claude_model
-            elif request.provider == AIProvider.OPENAI:
-                translated_content = await self._translate_with_openai(request)
-                model_used = settings.openai_model
-            else:
-                raise ValueError(f"Unsupported provider: {request.provider}")
+            call, model_used = self._get_provider(request.provider)
+            translated_content = await call(request, self._build_system_prompt(request))
 
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
 
             logger.info(
-                f"Translation complete: {source_lang.value} -> {request.target_language.value} "
+                f"Translation complete: {source_lang.value} -> {target} "
                 f"in {processing_time:.2f}s"
             )
 
-            return TranslateResponse(
+            response = TranslateResponse(
                 translated_content=translated_content,
                 source_language=source_lang,
                 target_language=request.target_language,
@@ -223,11 +314,272 @@ Guidelines:
                 processing_time=processing_time,
             )
 
+            await translation_cache.set(request, response)
+            return response
+
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             logger.error(f"Translation failed after {processing_time:.2f}s: {e}")
             raise
 
+    async def _stream_text(self, request: TranslateRequest) -> AsyncIterator[str]:
+        """
+        Stream the raw model output for a translation request.
+
+        Streams are not retried: text already passed on cannot be taken back.
+
+        Raises:
+            ValueError: If provider is not configured or unsupported
+        """
+        system_prompt = self._build_system_prompt(request)
+
+        if request.provider == AIProvider.CLAUDE:
+            if not self.anthropic_client:
+                raise ValueError("Anthropic API key not configured")
+
+            await throttle(AIProvider.CLAUDE, system_prompt, request.content)
+            async with self.anthropic_client.messages.stream(
+                model=settings.claude_model,
+                max_tokens=settings.max_tokens,
+                temperature=0.3,
+                system=system_prompt,
+                messages=[{"role": "user", "content": request.content}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        elif request.provider == AIProvider.OPENAI:
+            if not self.openai_client:
+                raise ValueError("OpenAI API key not configured")
+
+            await throttle(AIProvider.OPENAI, system_prompt, request.content)
+            stream = await self.openai_client.chat.completions.create(
+                model=settings.openai_model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": request.content},
+                ],
+                max_tokens=settings.max_tokens,
+                temperature=0.3,
+                stream=True,
+            )
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.close()
+
+        else:
+            raise ValueError(f"Unsupported provider: {request.provider}")
+
+    async def translate_stream(self, request: TranslateRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Translate text, yielding the translation while it is generated.
+
+        Yields ``{"event": "translation", "text": ...}`` for each new piece
+        of the translation, then one ``{"event": "done", ...}`` carrying the
+        TranslateResponse fields. The pieces join up to
+        ``translated_content``. Same-language requests and cache hits yield
+        only the final event.
+
+        Args:
+            request: Translation request with content and parameters
+
+        Yields:
+            Translation text events, then the final response event
+
+        Raises:
+            ValueError: If provider is not configured
+        """
+        start_time = time.perf_counter()
+
+        request = await self._resolve_source(request)
+        response = self._passthrough(request) or await translation_cache.get(request)
+        if response is not None:
+            response = response.model_copy(update={"processing_time": time.perf_counter() - start_time})
+            yield {"event": "done", **response.model_dump(mode="json")}
+            return
+
+        _, model_used = self._get_provider(request.provider)
+        parts: List[str] = []
+        # Whitespace is held back until more text follows, so the pieces
+        # never carry the leading or trailing whitespace stripped from the result
+        pending = ""
+        async for chunk in self._stream_text(request):
+            text = pending + chunk
+            if not parts:
+                text = text.lstrip()
+            body = text.rstrip()
+            pending = text[len(body):]
+            if body:
+                parts.append(body)
+                yield {"event": "translation", "text": body}
+
+        response = TranslateResponse(
+            translated_content="".join(parts),
+            source_language=request.source_language or LanguageCode.EN,
+            target_language=request.target_language,
+            provider=request.provider,
+            model=model_used,
+            confidence=None,
+            processing_time=time.perf_counter() - start_time,
+        )
+        await translation_cache.set(request, response)
+
+        yield {"event": "done", **response.model_dump(mode="json")}
+
+    async def translate_batch(
+        self, requests: List[TranslateRequest], max_concurrency: Optional[int] = None
+    ) -> List[Union[TranslateResponse, Exception]]:
+        """
+        Translate requests concurrently, each with its own provider call.
+
+        Args:
+            requests: Translation requests
+            max_concurrency: Maximum translations in flight
+                (default: MAX_CONCURRENT_LLM)
+
+        Returns:
+            Responses in request order; failed items hold their exception
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.max_concurrent_llm)
+
+        async def translate_one(request: TranslateRequest) -> TranslateResponse:
+            async with semaphore:
+                return await self.translate(request)
+
+        return await asyncio.gather(
+            *(translate_one(request) for request in requests), return_exceptions=True
+        )
+
+    @staticmethod
+    def _split_segments(text: str, count: int) -> Optional[List[str]]:
+        """Split a multi-segment translation; None if markers did not survive."""
+        parts = _SEGMENT_RE.split(text)
+        segments = {int(idx): body.strip() for idx, body in zip(parts[1::2], parts[2::2])}
+        if sorted(segments) != list(range(count)):
+            return None
+        return [segments[i] for i in range(count)]
+
+    async def _translate_group(
+        self, requests: List[TranslateRequest]
+    ) -> Optional[List[TranslateResponse]]:
+        """
+        Translate requests sharing the same options in one provider call.
+
+        Returns None if the segment markers did not survive, so the caller
+        can retry the items individually.
+        """
+        start_time = time.perf_counter()
+        first = requests[0]
+
+        joined = "\n".join(f"<<<SEG:{i}>>>\n{r.content}" for i, r in enumerate(requests))
+        combined = first.model_copy(update={"content": joined})
+        system_prompt = self._build_system_prompt(first) + _SEGMENT_INSTRUCTIONS
+
+        call, model_used = self._get_provider(first.provider)
+        text = await call(combined, system_prompt)
+
+        segments = self._split_segments(text, len(requests))
+        if segments is None:
+            logger.warning(f"Segment markers lost in combined translation, retrying {len(requests)} items individually")
+            return None
+
+        source_lang = first.source_language or LanguageCode.EN
+        processing_time = time.perf_counter() - start_time
+        responses = []
+        for request, translated in zip(requests, segments):
+            response = TranslateResponse(
+                translated_content=translated,
+                source_language=source_lang,
+                target_language=request.target_language,
+                provider=request.provider,
+                model=model_used,
+                confidence=None,
+                processing_time=processing_time,
+            )
+            await translation_cache.set(request, response)
+            responses.append(response)
+        return responses
+
+    async def translate_segments(
+        self, requests: List[TranslateRequest]
+    ) -> List[Union[TranslateResponse, Exception]]:
+        """
+        Translate many requests with as few provider calls as possible.
+
+        Same-language and cached items are served directly. Remaining short items that share
+        source language, target language, provider and formatting are sent
+        together, up to SEGMENT_BATCH_SIZE per call, with marker lines that
+        map each translation back to its item. Long items are translated on
+        their own. Provider calls run concurrently, at most
+        MAX_CONCURRENT_LLM at a time.
+
+        Args:
+            requests: Translation requests
+
+        Returns:
+            Responses in request order; failed items hold their exception
+        """
+        results: List[Union[TranslateResponse, Exception, None]] = [None] * len(requests)
+        groups: Dict[Tuple, List[int]] = {}
+        chunks: List[List[int]] = []
+
+        requests = [await self._resolve_source(request) for request in requests]
+        for idx, request in enumerate(requests):
+            passthrough = self._passthrough(request)
+            if passthrough is not None:
+                results[idx] = passthrough
+                continue
+            cached = await translation_cache.get(request)
+            if cached is not None:
+                results[idx] = cached
+            elif len(request.content) > SEGMENT_MAX_CHARS:
+                chunks.append([idx])
+            else:
+                key = (
+                    request.source_language,
+                    request.target_language,
+                    request.provider,
+                    request.preserve_formatting,
+                )
+                groups.setdefault(key, []).append(idx)
+
+        for indices in groups.values():
+            for start in range(0, len(indices), SEGMENT_BATCH_SIZE):
+                chunks.append(indices[start:start + SEGMENT_BATCH_SIZE])
+
+        semaphore = asyncio.Semaphore(settings.max_concurrent_llm)
+
+        async def translate_one(idx: int) -> TranslateResponse:
+            async with semaphore:
+                return await self.translate(requests[idx])
+
+        async def translate_chunk(chunk: List[int]) -> None:
+            responses = None
+            if len(chunk) > 1:
+                try:
+                    async with semaphore:
+                        responses = await self._translate_group([requests[i] for i in chunk])
+                except Exception as e:
+                    logger.error(f"Segment group of {len(chunk)} failed: {e}")
+                    for idx in chunk:
+                        results[idx] = e
+                    return
+
+            if responses is None:
+                # Single items, and groups whose markers were lost, each get
+                # their own slot and their own result or exception
+                responses = await asyncio.gather(
+                    *(translate_one(idx) for idx in chunk), return_exceptions=True
+                )
+            for idx, response in zip(chunk, responses):
+                results[idx] = response
+
+        await asyncio.gather(*(translate_chunk(chunk) for chunk in chunks))
+        return results
+
 
 # Global service instance
 translator_service = TranslatorService()
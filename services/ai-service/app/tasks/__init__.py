@@ -2,5 +2,6 @@
 
 from app.tasks.celery_app import celery_app
 from app.tasks.summarize_task import process_summarization_task
+from app.tasks.translate_task import batch_translation_task
 
-__all__ = ["celery_app", "process_summarization_task"]
+__all__ = ["celery_app", "process_summarization_task", "batch_translation_task"]
@@ -1,16 +1,21 @@
 """Celery application configuration."""
 
+import asyncio
+from typing import Any, Awaitable, Optional, TypeVar
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from loguru import logger
 
 from app.core.config import settings
 
+T = TypeVar("T")
+
 # Create Celery app
 celery_app = Celery(
     "ai_service",
     broker=settings.celery_broker_url,
     backend=settings.celery_result_backend,
-    include=["app.tasks.summarize_task"],
+    include=["app.tasks.summarize_task", "app.tasks.translate_task"],
 )
 
 # Celery configuration
@@ -18,17 +23,24 @@ celery_app.conf.update(
     # Task routing
     task_routes={
         "app.tasks.summarize_task.*": {"queue": "summarization"},
+        "app.tasks.translate_task.*": {"queue": "translation"},
         "app.tasks.*": {"queue": "default"},
     },
-    # Task serialization
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # Task serialization (msgpack keeps large article payloads compact;
+    # JSON is still accepted from producers that have not switched)
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
+    # Article text and summaries compress well; results sit in Redis for an hour
+    task_compression="gzip",
+    result_compression="gzip",
     # Timezone
     timezone="UTC",
     enable_utc=True,
     # Result backend
     result_expires=3600,  # Results expire after 1 hour
+    result_extended=False,  # Do not store task args/name alongside results
     result_backend_transport_options={
         "master_name": "mymaster",
     },
@@ -53,6 +65,70 @@ celery_app.conf.update(
 logger.info("Celery app initialized")
 
 
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine on the worker process's persistent event loop.
+
+    Tasks share one loop per process, so the shared HTTP connection pool,
+    Redis clients and provider semaphores stay bound to a live loop and
+    connections are reused across tasks instead of being torn down with a
+    per-task loop.
+
+    Args:
+        coro: Coroutine to run to completion
+
+    Returns:
+        The coroutine's result
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
+@worker_process_init.connect
+def init_worker_loop(**kwargs: Any) -> None:
+    """Start each worker process with its own event loop, never a forked one."""
+    global _worker_loop
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+    from app.services.language_detector import language_detector
+    from app.services.summarizer import load_tokenizer
+
+    language_detector.load()
+    load_tokenizer()
+
+
+@worker_process_shutdown.connect
+def close_worker_loop(**kwargs: Any) -> None:
+    """Close pooled connections and the event loop when a worker process exits."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+
+    from app.core.http import close_http_client
+    from app.services.semantic_cache import semantic_cache
+    from app.services.summary_cache import summary_cache
+    from app.services.translation_cache import translation_cache
+
+    async def close_clients() -> None:
+        await close_http_client()
+        await translation_cache.close()
+        await summary_cache.close()
+        await semantic_cache.close()
+
+    try:
+        _worker_loop.run_until_complete(close_clients())
+    finally:
+        _worker_loop.close()
+        _worker_loop = None
+
+
 @celery_app.on_after_configure.connect
 def setup_periodic_tasks(sender, **kwargs):
     """Setup periodic tasks."""
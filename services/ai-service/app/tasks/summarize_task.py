@@ -2,13 +2,17 @@
 
 import asyncio
 from typing import Dict, Any
-from celery import Task
+from celery import Task, chord, group
 from loguru import logger
 
-from app.tasks.celery_app import celery_app
-from app.models.article import SummarizeRequest
+from app.core.config import settings
+from app.tasks.celery_app import celery_app, run_async
+from app.models.article import SummarizeRequest, SummarizeResponse
 from app.services.summarizer import summarizer_service
 
+# Articles per chord member in batch summarization
+BATCH_CHUNK_SIZE = 10
+
 
 class SummarizationTask(Task):
     """Custom task class for summarization with retry logic."""
@@ -64,13 +68,7 @@ def process_summarization_task(self, request_data: Dict[str, Any]) -> Dict[str,
             f"length={request.length.value}"
         )
 
-        # Run async summarization in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            response = loop.run_until_complete(summarizer_service.summarize(request))
-        finally:
-            loop.close()
+        response = run_async(summarizer_service.summarize(request))
 
         # Update progress
         self.update_state(
@@ -81,19 +79,7 @@ def process_summarization_task(self, request_data: Dict[str, Any]) -> Dict[str,
             },
         )
 
-        result = {
-            "task_id": task_id,
-            "status": "completed",
-            "summary": response.summary,
-            "key_points": response.key_points,
-            "word_count": response.word_count,
-            "original_length": response.original_length,
-            "reduction_ratio": response.reduction_ratio,
-            "provider": response.provider.value,
-            "model": response.model,
-            "processing_time": response.processing_time,
-            "created_at": response.created_at.isoformat(),
-        }
+        result = _summary_result(task_id, response)
 
         logger.info(
             f"Task {task_id} completed: {response.word_count} words generated "
@@ -119,6 +105,23 @@ def process_summarization_task(self, request_data: Dict[str, Any]) -> Dict[str,
         raise
 
 
+def _summary_result(task_id: str, response: SummarizeResponse) -> Dict[str, Any]:
+    """Build the task result for a summarization response."""
+    return {
+        "task_id": task_id,
+        "status": "completed",
+        "summary": response.summary,
+        "key_points": response.key_points,
+        "word_count": response.word_count,
+        "original_length": response.original_length,
+        "reduction_ratio": response.reduction_ratio,
+        "provider": response.provider.value,
+        "model": response.model,
+        "processing_time": response.processing_time,
+        "created_at": response.created_at.isoformat(),
+    }
+
+
 @celery_app.task(
     bind=True,
     name="app.tasks.summarize_task.batch_summarization_task",
@@ -128,6 +131,11 @@ def batch_summarization_task(self, requests_data: list[Dict[str, Any]]) -> Dict[
     """
     Process batch summarization task.
 
+    The batch is split into chunks of BATCH_CHUNK_SIZE articles that run as
+    a Celery chord, so every summarization worker can take a share. The
+    task is replaced by the chord, so its result is the merged batch result
+    produced by finalize_batch_summarization.
+
     Args:
         self: Celery task instance
         requests_data: List of serialized SummarizeRequest data
@@ -138,39 +146,91 @@ def batch_summarization_task(self, requests_data: list[Dict[str, Any]]) -> Dict[
     task_id = self.request.id
     logger.info(f"Starting batch summarization task: {task_id} ({len(requests_data)} articles)")
 
+    if not requests_data:
+        return finalize_batch_summarization([], task_id, 0)
+
+    header = group(
+        summarize_batch_chunk.s(requests_data[start:start + BATCH_CHUNK_SIZE], start, task_id)
+        for start in range(0, len(requests_data), BATCH_CHUNK_SIZE)
+    )
+    raise self.replace(chord(header, finalize_batch_summarization.s(task_id, len(requests_data))))
+
+
+@celery_app.task(
+    name="app.tasks.summarize_task.summarize_batch_chunk",
+    queue="summarization",
+)
+def summarize_batch_chunk(
+    requests_data: list[Dict[str, Any]], offset: int, batch_id: str
+) -> Dict[str, Any]:
+    """
+    Summarize one chunk of a batch.
+
+    Articles in the chunk are summarized concurrently, at most
+    MAX_CONCURRENT_LLM at a time. Failures are reported per item rather
+    than raised, so one bad article does not fail the whole chord.
+
+    Args:
+        requests_data: Serialized SummarizeRequest data for this chunk
+        offset: Index of the chunk's first article in the batch
+        batch_id: ID of the batch task, reported in each result
+
+    Returns:
+        Dict with ``results`` and ``errors``, each item carrying its batch index
+    """
+    async def summarize_all() -> list:
+        semaphore = asyncio.Semaphore(settings.max_concurrent_llm)
+
+        async def summarize_one(request_data: Dict[str, Any]) -> SummarizeResponse:
+            async with semaphore:
+                return await summarizer_service.summarize(SummarizeRequest(**request_data))
+
+        return await asyncio.gather(
+            *(summarize_one(request_data) for request_data in requests_data),
+            return_exceptions=True,
+        )
+
     results = []
     failed = []
+    for idx, response in enumerate(run_async(summarize_all()), start=offset):
+        if isinstance(response, Exception):
+            logger.error(f"Batch item {idx} failed: {response}")
+            failed.append({"index": idx, "error": str(response)})
+        else:
+            results.append({"index": idx, **_summary_result(batch_id, response)})
+
+    return {"results": results, "errors": failed}
 
-    for idx, request_data in enumerate(requests_data):
-        try:
-            # Update progress
-            progress = int((idx / len(requests_data)) * 100)
-            self.update_state(
-                state="PROCESSING",
-                meta={
-                    "status": "processing",
-                    "progress": progress,
-                    "current": idx + 1,
-                    "total": len(requests_data),
-                },
-            )
-
-            # Process individual request
-            result = process_summarization_task(request_data)
-            results.append(result)
-
-        except Exception as e:
-            logger.error(f"Batch item {idx} failed: {e}")
-            failed.append({"index": idx, "error": str(e)})
+
+@celery_app.task(
+    name="app.tasks.summarize_task.finalize_batch_summarization",
+    queue="summarization",
+)
+def finalize_batch_summarization(
+    chunks: list[Dict[str, Any]], batch_id: str, total: int
+) -> Dict[str, Any]:
+    """
+    Merge chunk results into the batch result.
+
+    Args:
+        chunks: Results of summarize_batch_chunk, one per chunk
+        batch_id: ID of the batch task
+        total: Number of articles in the batch
+
+    Returns:
+        Dict with batch results in article order
+    """
+    results = sorted((r for chunk in chunks for r in chunk["results"]), key=lambda r: r["index"])
+    failed = sorted((e for chunk in chunks for e in chunk["errors"]), key=lambda e: e["index"])
 
     logger.info(
-        f"Batch task {task_id} completed: {len(results)} succeeded, {len(failed)} failed"
+        f"Batch task {batch_id} completed: {len(results)} succeeded, {len(failed)} failed"
     )
 
     return {
-        "task_id": task_id,
+        "task_id": batch_id,
         "status": "completed",
-        "total": len(requests_data),
+        "total": total,
         "succeeded": len(results),
         "failed": len(failed),
         "results": results,
@@ -0,0 +1,68 @@
+"""Celery task for asynchronous batch translation."""
+
+from typing import Dict, Any
+from loguru import logger
+
+from app.tasks.celery_app import celery_app, run_async
+from app.models.article import TranslateRequest
+from app.services.translator import translator_service
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.translate_task.batch_translation_task",
+    queue="translation",
+)
+def batch_translation_task(self, requests_data: list[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Process batch translation task.
+
+    Short texts sharing the same languages, provider and formatting are
+    translated together in combined provider calls (see
+    TranslatorService.translate_segments).
+
+    Args:
+        self: Celery task instance
+        requests_data: List of serialized TranslateRequest data
+
+    Returns:
+        Dict with batch results
+    """
+    task_id = self.request.id
+    logger.info(f"Starting batch translation task: {task_id} ({len(requests_data)} texts)")
+
+    self.update_state(
+        state="PROCESSING",
+        meta={
+            "status": "processing",
+            "total": len(requests_data),
+        },
+    )
+
+    requests = [TranslateRequest(**request_data) for request_data in requests_data]
+
+    responses = run_async(translator_service.translate_segments(requests))
+
+    results = []
+    failed = []
+
+    for idx, response in enumerate(responses):
+        if isinstance(response, Exception):
+            logger.error(f"Batch item {idx} failed: {response}")
+            failed.append({"index": idx, "error": str(response)})
+        else:
+            results.append({"index": idx, **response.model_dump(mode="json")})
+
+    logger.info(
+        f"Batch task {task_id} completed: {len(results)} succeeded, {len(failed)} failed"
+    )
+
+    return {
+        "task_id": task_id,
+        "status": "completed",
+        "total": len(requests_data),
+        "succeeded": len(results),
+        "failed": len(failed),
+        "results": results,
+        "errors": failed,
+    }
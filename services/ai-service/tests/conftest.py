@@ -6,12 +6,14 @@ import pytest
 import pytest_asyncio
 from typing import AsyncGenerator
 from httpx import AsyncClient, ASGITransport
+from redis.exceptions import ConnectionError as RedisConnectionError
+from app.core.config import Settings
 from app.main import app
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def client() -> AsyncGenerator[AsyncClient, None]:
-    """Create an async HTTP client for testing."""
+    """Create an async HTTP client shared by the whole test session."""
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test"
@@ -19,6 +21,42 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
 
+class FakeRedis:
+    """In-memory stand-in for the async Redis client string commands."""
+
+    def __init__(self):
+        self.data = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise RedisConnectionError("down")
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self._check()
+        self.data[key] = value
+
+    async def delete(self, key):
+        self._check()
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    """In-memory Redis double; set ``fail`` to make every command raise."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def providers_configured(monkeypatch):
+    """Report every provider as having an API key."""
+    monkeypatch.setattr(Settings, "provider_configured", lambda self, provider: True)
+
+
 @pytest.fixture
 def sample_article():
     """Sample article data for testing."""
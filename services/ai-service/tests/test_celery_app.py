@@ -0,0 +1,42 @@
+"""Tests for Celery worker setup."""
+
+import asyncio
+import importlib
+
+# The package re-exports the Celery instance under the module's name
+celery_module = importlib.import_module("app.tasks.celery_app")
+
+
+def test_run_async_reuses_worker_loop(monkeypatch):
+    """Test tasks in one worker process run on the same event loop."""
+    monkeypatch.setattr(celery_module, "_worker_loop", None)
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = celery_module.run_async(current_loop())
+    second = celery_module.run_async(current_loop())
+
+    assert first is second
+    assert not first.is_closed()
+    first.close()
+    asyncio.set_event_loop(None)
+
+
+def test_finalize_batch_summarization_merges_chunks_in_order():
+    """Test chunk results are merged back into article order."""
+    from app.tasks.summarize_task import finalize_batch_summarization
+
+    chunks = [
+        {"results": [{"index": 10, "summary": "k"}], "errors": [{"index": 11, "error": "boom"}]},
+        {"results": [{"index": 0, "summary": "a"}, {"index": 1, "summary": "b"}], "errors": []},
+    ]
+
+    result = finalize_batch_summarization(chunks, "batch-1", 12)
+
+    assert result["task_id"] == "batch-1"
+    assert result["total"] == 12
+    assert result["succeeded"] == 3
+    assert result["failed"] == 1
+    assert [r["index"] for r in result["results"]] == [0, 1, 10]
+    assert result["errors"] == [{"index": 11, "error": "boom"}]
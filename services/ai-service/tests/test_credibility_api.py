@@ -39,7 +39,7 @@ class TestCredibilityAPI:
     async def test_calculate_with_related_articles(self, client: AsyncClient, sample_credibility_request):
         """Test credibility calculation with related articles."""
         # Add a related article
-        sample_credibility_request["related_articles"] = [
+        related_articles = [
             {
                 "id": "related-1",
                 "title": "Related News About Economy",
@@ -51,10 +51,10 @@ class TestCredibilityAPI:
                 "category": "business",
             }
         ]
-        
+
         response = await client.post(
             "/api/v1/credibility/calculate",
-            json=sample_credibility_request
+            json={**sample_credibility_request, "related_articles": related_articles}
         )
         
         assert response.status_code in [200, 500]
@@ -0,0 +1,362 @@
+"""Tests for credibility scorer."""
+
+import asyncio
+import base64
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services import credibility_scorer
+from app.services.credibility_scorer import ArticleCorpus, ArticleMetadata, CredibilityScorer
+
+
+@pytest.fixture
+def scorer():
+    """Create credibility scorer instance."""
+    return CredibilityScorer()
+
+
+def make_article(article_id, embedding, hours_ago=0):
+    """Create article metadata with a fixed embedding."""
+    return ArticleMetadata(
+        id=article_id,
+        title=f"Title {article_id}",
+        content="Content",
+        source_name=f"Source {article_id}",
+        source_type="mainstream",
+        source_bias=None,
+        source_credibility=70.0,
+        published_at=datetime(2026, 1, 18, 12) - timedelta(hours=hours_ago),
+        category="business",
+        embedding=embedding,
+    )
+
+
+def encode_embedding(vector):
+    """Build an embeddings API item with a base64 float32 payload."""
+    return SimpleNamespace(embedding=base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()))
+
+
+def test_similarity_matrix(scorer):
+    """Test pairwise cosine similarities are normalized."""
+    articles = [
+        make_article("a", [2.0, 0.0]),
+        make_article("b", [1.0, 1.0]),
+        make_article("c", [0.0, 0.0]),
+    ]
+
+    similarities = scorer.similarity_matrix(articles)
+
+    assert similarities.shape == (3, 3)
+    assert similarities[0, 0] == pytest.approx(1.0)
+    assert similarities[0, 1] == pytest.approx(np.sqrt(0.5))
+    assert similarities[0, 2] == 0.0
+    assert scorer.similarity_matrix([]).shape == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_find_similar_articles_with_precomputed_similarities(scorer):
+    """Test precomputed similarities respect threshold and time window."""
+    article = make_article("a", None)
+    others = [
+        make_article("b", None),
+        make_article("c", None),
+        make_article("d", None, hours_ago=24 * 5),
+    ]
+
+    similar = await scorer._find_similar_articles(article, others, np.array([0.9, 0.5, 0.99]))
+
+    assert [a.id for a in similar] == ["b"]
+    assert article.embedding is None
+
+
+@pytest.mark.asyncio
+async def test_find_similar_articles_with_embeddings(scorer):
+    """Test stored embeddings are scored in one pass within the time window."""
+    article = make_article("a", [1.0, 0.0])
+    others = [
+        article,
+        make_article("b", [3.0, 0.5]),
+        make_article("c", [0.0, 1.0]),
+        make_article("d", [1.0, 0.0], hours_ago=24 * 5),
+        make_article("e", [0.0, 0.0]),
+    ]
+
+    similar = await scorer._find_similar_articles(article, others)
+
+    assert [a.id for a in similar] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_batch_chunks_requests(scorer, monkeypatch):
+    """Test texts are embedded in order with one request per chunk."""
+    calls = []
+
+    async def fake_create(model, input, encoding_format):
+        calls.append(input)
+        return SimpleNamespace(data=[encode_embedding([float(len(t))]) for t in input])
+
+    monkeypatch.setattr(credibility_scorer, "EMBEDDING_BATCH_SIZE", 2)
+    monkeypatch.setattr(scorer, "openai", SimpleNamespace(embeddings=SimpleNamespace(create=fake_create)))
+
+    vectors = await scorer._get_embeddings_batch(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert len(vectors) == 5
+    assert all(v.dtype == np.float32 and v.tolist() == [1.0] for v in vectors)
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_batch_uses_cache(scorer, monkeypatch):
+    """Test repeated texts are embedded once across and within calls."""
+    calls = []
+
+    async def fake_create(model, input, encoding_format):
+        calls.append(input)
+        return SimpleNamespace(data=[encode_embedding([float(len(t)), 0.0]) for t in input])
+
+    monkeypatch.setattr(scorer, "openai", SimpleNamespace(embeddings=SimpleNamespace(create=fake_create)))
+
+    first = await scorer._get_embeddings_batch(["a", "bb"])
+    vectors = await scorer._get_embeddings_batch(["bb", "ccc", "ccc", "a"])
+
+    assert vectors[0] is first[1]
+    assert vectors[3] is first[0]
+    assert calls == [["a", "bb"], ["ccc"]]
+
+
+def test_normalized_cosine_similarity(scorer):
+    """Test normalized vectors compare with a plain dot product."""
+    v1 = scorer._normalize([3.0, 4.0])
+    v2 = scorer._normalize([4.0, 3.0])
+
+    assert v1.dtype == np.float32
+    assert np.linalg.norm(v1) == pytest.approx(1.0)
+    assert scorer._cosine_similarity(v1, v2) == pytest.approx(0.96)
+    assert scorer._normalize([0.0, 0.0]).tolist() == [0.0, 0.0]
+
+
+def test_window_candidates(scorer):
+    """Test each article gets the indices published within three days of it."""
+    articles = [
+        make_article("a", None, hours_ago=0),
+        make_article("b", None, hours_ago=24 * 5),
+        make_article("c", None, hours_ago=24 * 2),
+        make_article("d", None, hours_ago=24 * 8),
+    ]
+
+    windows = scorer.window_candidates(ArticleCorpus.from_articles(articles))
+
+    assert [w.tolist() for w in windows] == [[0, 2], [1, 2, 3], [0, 1, 2], [1, 3]]
+
+
+@pytest.mark.asyncio
+async def test_calculate_credibility_runs_llm_checks_concurrently(scorer):
+    """Test fact checking and verification overlap instead of running in turn."""
+    fact_started = asyncio.Event()
+    verify_started = asyncio.Event()
+
+    async def fake_fact_check(article, similar):
+        fact_started.set()
+        await verify_started.wait()
+        return 80.0
+
+    async def fake_verification(article, similar):
+        verify_started.set()
+        await fact_started.wait()
+        return {"score": 70.0, "confidence": 0.9, "flags": [], "strengths": []}
+
+    scorer._check_fact_consistency = fake_fact_check
+    scorer._ai_verification = fake_verification
+    article = make_article("a", [1.0, 0.0])
+    others = [make_article("b", [1.0, 0.1])]
+
+    result = await asyncio.wait_for(scorer.calculate_credibility(article, others), timeout=1)
+
+    assert result.fact_consistency == 80.0
+    assert result.factors["ai_verification"] == 70.0
+    assert result.similar_articles == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_calculate_credibility_batch_shares_fact_check_call(scorer):
+    """Test fact checks for several articles are made in one Claude call."""
+    prompts = []
+
+    async def fake_create(model, max_tokens, messages):
+        prompts.append(messages[0]["content"])
+        text = '[{"item": 0, "consistency_score": 90}, {"item": 1, "consistency_score": 60}]'
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    async def fake_verification(article, similar):
+        return {"score": 70.0, "confidence": 0.9, "flags": [], "strengths": []}
+
+    scorer.anthropic = SimpleNamespace(messages=SimpleNamespace(create=fake_create))
+    scorer._ai_verification = fake_verification
+    a, b, c = make_article("a", [1.0, 0.0]), make_article("b", [1.0, 0.1]), make_article("c", [0.0, 1.0])
+
+    results = await scorer.calculate_credibility_batch(
+        [(a, [b, c], None), (b, [a, c], None), (c, [a, b], None)]
+    )
+
+    assert len(prompts) == 1
+    assert [r.fact_consistency for r in results] == [90.0, 60.0, 0.0]
+    assert [r.similar_articles for r in results] == [["b"], ["a"], []]
+
+
+@pytest.mark.asyncio
+async def test_fact_check_batch_accepts_fenced_json(scorer):
+    """Test a batched fact check answer wrapped in a markdown fence is still parsed."""
+    async def fake_create(model, max_tokens, messages):
+        text = '```json\n[{"item": 0, "consistency_score": 90}, {"item": 1, "consistency_score": 60}]\n```'
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    scorer.anthropic = SimpleNamespace(messages=SimpleNamespace(create=fake_create))
+    a, b = make_article("a", [1.0, 0.0]), make_article("b", [1.0, 0.1])
+
+    scores = await scorer._check_fact_consistency_batch([(a, [b]), (b, [a])])
+
+    assert scores == [90.0, 60.0]
+
+
+@pytest.mark.asyncio
+async def test_score_batch_compares_articles_within_window(scorer):
+    """Test batch scoring embeds missing articles and only matches nearby ones."""
+    embedded = []
+
+    async def fake_embeddings_create(model, input, encoding_format):
+        embedded.extend(input)
+        return SimpleNamespace(data=[encode_embedding([0.0, 1.0]) for _ in input])
+
+    async def fake_fact_check_batch(items):
+        return [50.0] * len(items)
+
+    async def fake_verification(article, similar):
+        return {"score": 70.0, "confidence": 0.9, "flags": [], "strengths": []}
+
+    scorer.openai = SimpleNamespace(embeddings=SimpleNamespace(create=fake_embeddings_create))
+    scorer._check_fact_consistency_batch = fake_fact_check_batch
+    scorer._ai_verification = fake_verification
+    articles = [
+        make_article("a", [1.0, 0.0]),
+        make_article("b", [1.0, 0.1], hours_ago=2),
+        make_article("c", [1.0, 0.0], hours_ago=24 * 5),
+        make_article("d", None),
+    ]
+
+    results = await scorer.score_batch(articles)
+
+    assert len(embedded) == 1
+    assert [r.similar_articles for r in results] == [["b"], ["a"], [], []]
+    assert await scorer.score_batch([]) == []
+
+
+@pytest.mark.asyncio
+async def test_llm_results_are_cached(scorer):
+    """Test unchanged inputs reuse parsed Claude results."""
+    calls = []
+
+    async def fake_create(model, max_tokens, messages):
+        calls.append(max_tokens)
+        if max_tokens == 512:
+            text = '{"score": 80, "confidence": 0.8}'
+        else:
+            text = '{"consistency_score": 75}'
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    scorer = CredibilityScorer(anthropic=SimpleNamespace(messages=SimpleNamespace(create=fake_create)))
+    a, b = make_article("a", [1.0, 0.0]), make_article("b", [1.0, 0.1])
+
+    first = await scorer.calculate_credibility(a, [b])
+    second = await scorer.calculate_credibility(a, [b])
+    batch = await scorer._check_fact_consistency_batch([(a, [b])])
+
+    assert len(calls) == 2
+    assert second.score == first.score
+    assert batch == [75.0]
+
+
+def test_source_sub_scores(scorer):
+    """Test cross-coverage, diversity and reputation sub-scores."""
+    article = make_article("a", None)
+    others = [make_article(i, None) for i in "bcdefghij"]
+    others[0].source_type = "independent"
+    others[0].source_bias = "left"
+    others[1].source_credibility = 40.0
+    corpus = ArticleCorpus.from_articles([article, *others])
+
+    assert [scorer._calculate_cross_coverage_score(others[:n]) for n in range(6)] == [
+        40.0, 60.0, 75.0, 85.0, 87.0, 89.0
+    ]
+    assert scorer._calculate_cross_coverage_score(others) == 95.0
+    assert scorer._calculate_source_diversity(corpus, np.array([0])) == pytest.approx(40.0)
+    assert scorer._calculate_source_diversity(corpus, np.array([0, 1])) == pytest.approx(50.0)
+    assert scorer._calculate_source_reputation(corpus, np.array([0, 1, 2])) == pytest.approx(60.0)
+
+
+@pytest.mark.asyncio
+async def test_fact_check_salvages_score_from_fenced_json(scorer):
+    """Test a score is still read when the JSON answer is wrapped in a code fence."""
+    async def fake_create(model, max_tokens, messages):
+        text = '```json\n{"key_facts": ["x"], "consistency_score": 82.5,\n}\n```'
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    scorer.anthropic = SimpleNamespace(messages=SimpleNamespace(create=fake_create))
+
+    score = await scorer._check_fact_consistency(make_article("a", None), [make_article("b", None)])
+
+    assert score == 82.5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embedding_requests_are_coalesced(scorer, monkeypatch):
+    """Test texts from concurrent callers share one embeddings request."""
+    calls = []
+
+    async def fake_create(model, input, encoding_format):
+        calls.append(input)
+        return SimpleNamespace(data=[encode_embedding([float(len(t)), 1.0]) for t in input])
+
+    monkeypatch.setattr(scorer, "openai", SimpleNamespace(embeddings=SimpleNamespace(create=fake_create)))
+
+    first, second = await asyncio.gather(
+        scorer._get_embeddings_batch(["a", "bb"]),
+        scorer._get_embeddings_batch(["bb", "ccc"]),
+    )
+
+    assert calls == [["a", "bb", "ccc"]]
+    assert second[0] is not None and np.allclose(first[1], second[0])
+
+
+@pytest.mark.asyncio
+async def test_failed_embeddings_are_not_stored(scorer, monkeypatch):
+    """Test a failed embeddings request leaves articles unembedded and uncached."""
+    calls = []
+
+    async def failing_create(model, input, encoding_format):
+        calls.append(input)
+        raise RuntimeError("embeddings down")
+
+    monkeypatch.setattr(scorer, "openai", SimpleNamespace(embeddings=SimpleNamespace(create=failing_create)))
+    articles = [make_article("a", None), make_article("b", [1.0, 0.0])]
+
+    await scorer.embed_articles(articles)
+
+    assert len(calls) == 1
+    assert articles[0].embedding is None
+    assert not scorer._emb_cache
+    similarities = scorer.similarity_matrix(articles)
+    assert similarities[0, 1] == 0.0
+    assert await scorer._find_similar_articles(articles[0], articles) == []
+
+
+@pytest.mark.asyncio
+async def test_embeddings_skipped_without_openai(scorer, monkeypatch):
+    """Test no embeddings request is attempted when OpenAI is not configured."""
+    monkeypatch.setattr(scorer, "openai", None)
+
+    vectors = await scorer._get_embeddings_batch(["a"])
+
+    assert not vectors[0].any()
@@ -0,0 +1,58 @@
+"""Tests for language detector."""
+
+import pytest
+
+from app.services.language_detector import LanguageDetector, MAX_DETECTION_WORDS
+
+
+class FakeModel:
+    """Stand-in for a loaded fastText model."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, text, k=1):
+        self.calls.append(text)
+        label = "__label__es" if "hola" in text else "__label__en"
+        return (label,), [0.97]
+
+
+@pytest.fixture
+def detector():
+    """Create a detector with a fake model."""
+    detector = LanguageDetector("unused.ftz", capacity=2)
+    detector._model = FakeModel()
+    return detector
+
+
+@pytest.mark.asyncio
+async def test_detect_maps_label(detector):
+    """Test fastText labels are mapped to language codes."""
+    assert await detector.detect("hola\nmundo") == ("es", pytest.approx(0.97))
+    assert detector._model.calls == ["hola mundo"]
+
+
+@pytest.mark.asyncio
+async def test_detect_memoizes_results(detector):
+    """Test repeated content is classified once."""
+    await detector.detect("hello world")
+    await detector.detect("hello world")
+
+    assert len(detector._model.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_detect_without_model():
+    """Test detection falls back to English when no model is loaded."""
+    detector = LanguageDetector("missing.ftz")
+    detector.load()
+
+    assert await detector.detect("bonjour") == ("en", 0.0)
+
+
+@pytest.mark.asyncio
+async def test_detect_classifies_leading_words_only(detector):
+    """Test long texts are classified on their first words."""
+    await detector.detect("hola " * 1000)
+
+    assert detector._model.calls == [" ".join(["hola"] * MAX_DETECTION_WORDS)]
@@ -0,0 +1,56 @@
+"""Tests for the provider Batch API service."""
+
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.models.article import SummarizeRequest, AIProvider
+from app.services.llm_batch import LLMBatchService
+
+
+def make_request(content: str, key_points: bool = True) -> SummarizeRequest:
+    """Build a summarization request."""
+    return SummarizeRequest(
+        article={"content": content}, provider="claude", key_points=key_points
+    )
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_submitted_once_and_expanded_on_retrieve(fake_redis):
+    """Test identical requests share a batch entry and get a result each."""
+    submitted = []
+
+    async def fake_post(path, body, cast_to):
+        submitted.extend(body["requests"])
+        return httpx.Response(200, json={"id": "batch-1"})
+
+    async def fake_get(path, cast_to):
+        if path.endswith("/results"):
+            lines = [
+                {
+                    "custom_id": entry["custom_id"],
+                    "result": {
+                        "type": "succeeded",
+                        "message": {"content": [{"text": "[SUMMARY]\nDone\n\n[KEY POINTS]\n- A useful point"}]},
+                    },
+                }
+                for entry in submitted
+            ]
+            return httpx.Response(200, text="\n".join(json.dumps(line) for line in lines))
+        return httpx.Response(200, json={"processing_status": "ended"})
+
+    service = LLMBatchService()
+    service.anthropic_client = SimpleNamespace(post=fake_post, get=fake_get)
+    service._redis = fake_redis
+    first, second = make_request("First article"), make_request("Second article", key_points=False)
+
+    batch_id = await service.submit_summaries([first, second, first], AIProvider.CLAUDE)
+    result = await service.retrieve(batch_id, AIProvider.CLAUDE)
+
+    assert [entry["custom_id"] for entry in submitted] == ["0", "1"]
+    assert [item["index"] for item in result["results"]] == [0, 1, 2]
+    assert [item["custom_id"] for item in result["results"]] == ["0", "1", "0"]
+    assert result["results"][0]["key_points"] == ["A useful point"]
+    assert result["results"][1]["key_points"] is None
@@ -1,20 +1,17 @@
 """Tests for main application."""
 
+import asyncio
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
-from app.main import app
+from app.main import value_error_handler, general_exception_handler
+from app.models.article import ErrorResponse
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-def test_health_check(client):
+@pytest.mark.asyncio
+async def test_health_check(client: AsyncClient):
     """Test health check endpoint."""
-    response = client.get("/health")
+    response = await client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
@@ -22,18 +19,20 @@ def test_health_check(client):
     assert "providers" in data
 
 
-def test_readiness_check(client):
+@pytest.mark.asyncio
+async def test_readiness_check(client: AsyncClient):
     """Test readiness check endpoint."""
-    response = client.get("/ready")
+    response = await client.get("/ready")
     assert response.status_code == 200
     data = response.json()
     assert "ready" in data
     assert "checks" in data
 
 
-def test_root_endpoint(client):
+@pytest.mark.asyncio
+async def test_root_endpoint(client: AsyncClient):
     """Test root endpoint."""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert "service" in data
@@ -41,11 +40,36 @@ def test_root_endpoint(client):
     assert "api" in data
 
 
-def test_openapi_schema(client):
+@pytest.mark.asyncio
+async def test_process_time_header(client: AsyncClient):
+    """Test API responses are timed and probe responses are not."""
+    response = await client.get("/api/v1/translate/languages")
+    assert float(response.headers["X-Process-Time"]) >= 0
+
+    response = await client.get("/health")
+    assert "X-Process-Time" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_openapi_schema(client: AsyncClient):
     """Test OpenAPI schema generation."""
-    response = client.get("/api/v1/openapi.json")
+    response = await client.get("/api/v1/openapi.json")
     assert response.status_code == 200
     schema = response.json()
     assert "openapi" in schema
     assert "info" in schema
     assert "paths" in schema
+
+
+def test_error_handlers_match_error_response():
+    """Test pre-serialized error bodies validate as ErrorResponse."""
+    response = asyncio.run(value_error_handler(None, ValueError('bad "input"')))
+    assert response.status_code == 400
+    error = ErrorResponse.model_validate_json(response.body)
+    assert error.code == "VALIDATION_ERROR"
+    assert error.detail == 'bad "input"'
+
+    response = asyncio.run(general_exception_handler(None, RuntimeError("boom")))
+    assert response.status_code == 500
+    error = ErrorResponse.model_validate_json(response.body)
+    assert error.code == "INTERNAL_ERROR"
@@ -5,23 +5,43 @@ Tests:
 - POST /api/v1/moderate (moderate content)
 """
 
+from unittest.mock import patch
 import pytest
 from httpx import AsyncClient
 
+from app.agents.moderator import ModeratorAgent
+from app.core.config import Settings
+from app.models.article import ModerationResponse, AIProvider
+
+
+async def fake_moderate(request):
+    """Return a safe verdict instead of calling a provider."""
+    return ModerationResponse(
+        is_safe=True,
+        results=[],
+        overall_risk_score=0.0,
+        recommended_action="allow",
+        provider=AIProvider.CLAUDE,
+        processing_time=0.01,
+    )
+
 
 @pytest.mark.asyncio
 class TestModerateAPI:
     """Tests for content moderation endpoints."""
 
-    async def test_moderate_endpoint_exists(self, client: AsyncClient, sample_moderate_request):
+    async def test_moderate_endpoint_exists(
+        self, client: AsyncClient, sample_moderate_request, providers_configured
+    ):
         """Test moderate endpoint is accessible."""
-        response = await client.post(
-            "/api/v1/moderate",
-            json=sample_moderate_request
-        )
-        
-        # May return 200 or 500 depending on API key config
-        assert response.status_code in [200, 500, 422]
+        with patch.object(ModeratorAgent, "moderate", side_effect=fake_moderate) as mock_moderate:
+            response = await client.post(
+                "/api/v1/moderate",
+                json=sample_moderate_request
+            )
+
+        assert response.status_code == 200
+        mock_moderate.assert_called_once()
 
     async def test_moderate_missing_content(self, client: AsyncClient):
         """Test error when content is missing."""
@@ -45,50 +65,77 @@ class TestModerateAPI:
         )
         
         # Should handle empty content gracefully
-        assert response.status_code in [200, 400, 422, 500]
-
-    async def test_moderate_strict_mode(self, client: AsyncClient, sample_moderate_request):
-        """Test moderation with strict mode enabled."""
-        sample_moderate_request["strict_mode"] = True
-        
-        response = await client.post(
-            "/api/v1/moderate",
-            json=sample_moderate_request
-        )
-        
-        assert response.status_code in [200, 500]
+        assert response.status_code in [200, 400, 422]
 
-    async def test_moderate_safe_content(self, client: AsyncClient):
-        """Test moderation of clearly safe content."""
+    async def test_moderate_whitespace_content(self, client: AsyncClient):
+        """Test whitespace-only content is allowed without calling the provider."""
         response = await client.post(
             "/api/v1/moderate",
             json={
-                "content": "Nepal has beautiful mountains and friendly people. The weather is pleasant in spring.",
-                "strict_mode": False,
+                "content": "   \n ",
+                "strict_mode": True,
             }
         )
-        
-        assert response.status_code in [200, 500]
-        
-        if response.status_code == 200:
-            data = response.json()
-            assert "is_safe" in data
-            # Safe content should pass moderation
-            assert data.get("is_safe", True) is True
 
-    async def test_moderate_long_content(self, client: AsyncClient):
+        assert response.status_code == 200
+        data = response.json()
+        assert data["is_safe"] is True
+        assert data["recommended_action"] == "allow"
+
+    async def test_moderate_unconfigured_provider(self, client: AsyncClient, sample_moderate_request, monkeypatch):
+        """Test content that needs the provider is rejected when it has no API key."""
+        monkeypatch.setattr(Settings, "provider_configured", lambda self, provider: False)
+
+        response = await client.post("/api/v1/moderate", json=sample_moderate_request)
+        short = await client.post("/api/v1/moderate", json={"content": "  ", "strict_mode": False})
+
+        assert response.status_code == 503
+        assert short.status_code == 200
+
+    async def test_moderate_strict_mode(
+        self, client: AsyncClient, sample_moderate_request, providers_configured
+    ):
+        """Test moderation with strict mode enabled."""
+        with patch.object(ModeratorAgent, "moderate", side_effect=fake_moderate) as mock_moderate:
+            response = await client.post(
+                "/api/v1/moderate",
+                json={**sample_moderate_request, "strict_mode": True}
+            )
+
+        assert response.status_code == 200
+        assert mock_moderate.call_args.args[0].strict_mode is True
+
+    async def test_moderate_safe_content(self, client: AsyncClient, providers_configured):
+        """Test moderation of clearly safe content."""
+        with patch.object(ModeratorAgent, "moderate", side_effect=fake_moderate):
+            response = await client.post(
+                "/api/v1/moderate",
+                json={
+                    "content": "Nepal has beautiful mountains and friendly people. The weather is pleasant in spring.",
+                    "strict_mode": False,
+                }
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["is_safe"] is True
+        assert data["recommended_action"] == "allow"
+
+    async def test_moderate_long_content(self, client: AsyncClient, providers_configured):
         """Test moderation of longer content."""
         long_content = "This is a test sentence. " * 100  # ~2500 characters
-        
-        response = await client.post(
-            "/api/v1/moderate",
-            json={
-                "content": long_content,
-                "strict_mode": False,
-            }
-        )
-        
-        assert response.status_code in [200, 500]
+
+        with patch.object(ModeratorAgent, "moderate", side_effect=fake_moderate) as mock_moderate:
+            response = await client.post(
+                "/api/v1/moderate",
+                json={
+                    "content": long_content,
+                    "strict_mode": False,
+                }
+            )
+
+        assert response.status_code == 200
+        assert mock_moderate.call_args.args[0].content == long_content
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,118 @@
+"""Tests for moderator agent."""
+
+import pytest
+
+from app.agents.moderator import ModeratorAgent
+from app.models.article import ModerationRequest
+
+
+@pytest.fixture
+def moderator():
+    """Create moderator agent instance."""
+    return ModeratorAgent()
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        '{"overall_risk_score": 0.1}',
+        '```json\n{"overall_risk_score": 0.1}\n```',
+        '   ```json\n{"overall_risk_score": 0.1}\n```   ',
+        '```\n{"overall_risk_score": 0.1}\n```',
+        '```json\n{"overall_risk_score": 0.1}',
+    ],
+)
+def test_parse_moderation_response_fences(moderator, response):
+    """Test JSON is extracted with or without markdown fences."""
+    data = moderator._parse_moderation_response(response, False)
+    assert data["overall_risk_score"] == 0.1
+
+
+def test_parse_moderation_response_fallback(moderator):
+    """Test unparseable responses fall back to review."""
+    data = moderator._parse_moderation_response("not json", False)
+    assert data["recommended_action"] == "review"
+    assert "safe" not in data["categories"]
+    assert len(data["categories"]) == 7
+
+
+@pytest.mark.parametrize(
+    "risk_score,strict_mode,expected",
+    [
+        (0.0, False, "allow"),
+        (0.2, False, "allow"),
+        (0.3, False, "review"),
+        (0.5, False, "review"),
+        (0.6, False, "block"),
+        (0.1, True, "allow"),
+        (0.2, True, "review"),
+        (0.3, True, "review"),
+        (0.4, True, "block"),
+    ],
+)
+def test_determine_action(moderator, risk_score, strict_mode, expected):
+    """Test action thresholds for normal and strict mode."""
+    assert moderator._determine_action(risk_score, strict_mode) == expected
+
+
+def test_calculate_overall_risk(moderator):
+    """Test risk averages confidence of flagged categories."""
+    categories = {
+        "violence": {"flagged": True, "confidence": 0.8},
+        "spam": {"flagged": True, "confidence": 0.4},
+        "harassment": {"flagged": False, "confidence": 0.9},
+        "self_harm": {"flagged": False, "confidence": 0.9},
+    }
+    assert moderator._calculate_overall_risk(categories) == pytest.approx(0.3)
+    assert moderator._calculate_overall_risk({}) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_moderate_stops_streaming_after_json(moderator):
+    """Test moderation stops consuming the stream once the JSON is complete."""
+    consumed = []
+
+    async def fake_stream(user_message, context=None):
+        for chunk in ['```json\n{"categories": {"spam": ', '{"flagged": true, "confidence": 0.7, ',
+                      '"explanation": "a } in text"}}}', '\n```\nTrailing commentary', " more"]:
+            consumed.append(chunk)
+            yield chunk
+
+    moderator.execute_stream = fake_stream
+
+    response = await moderator.moderate(ModerationRequest(content="Buy now!!!"))
+
+    assert len(consumed) == 3
+    assert response.overall_risk_score == pytest.approx(0.7)
+    assert response.results[0].explanation == "a } in text"
+
+
+@pytest.mark.asyncio
+async def test_moderate_does_not_cache_fallback(moderator, monkeypatch):
+    """Test an unparseable verdict is not cached, while a parsed one is cached for exact repeats."""
+    from app.agents import moderator as moderator_module
+
+    stored = []
+
+    async def fake_get(namespace, text, model=None, exact=False):
+        return None
+
+    async def fake_set(namespace, text, value, exact=False):
+        stored.append(exact)
+
+    monkeypatch.setattr(moderator_module.semantic_cache, "get", fake_get)
+    monkeypatch.setattr(moderator_module.semantic_cache, "set", fake_set)
+
+    async def unparseable_stream(user_message, context=None):
+        yield "I cannot produce JSON for this."
+
+    moderator.execute_stream = unparseable_stream
+    await moderator.moderate(ModerationRequest(content="Buy now!!!"))
+    assert stored == []
+
+    async def parsed_stream(user_message, context=None):
+        yield '{"categories": {"spam": {"flagged": false, "confidence": 0.9}}}'
+
+    moderator.execute_stream = parsed_stream
+    await moderator.moderate(ModerationRequest(content="Buy now!!!"))
+    assert stored == [True]
@@ -0,0 +1,46 @@
+"""Tests for provider rate limiting."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core import rate_limiter
+from app.core.rate_limiter import AsyncTokenBucket, throttle
+from app.models.article import AIProvider
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_waits_for_refill():
+    """Test a full bucket serves its capacity at once, then paces callers."""
+    bucket = AsyncTokenBucket(rate_per_minute=6000, capacity=10)
+
+    start = time.monotonic()
+    await bucket.acquire(10)
+    burst = time.monotonic() - start
+    await bucket.acquire(5)
+    waited = time.monotonic() - start
+
+    assert burst < 0.02
+    assert waited == pytest.approx(0.05, abs=0.03)
+
+
+@pytest.mark.asyncio
+async def test_bucket_caps_oversized_requests():
+    """Test a request above capacity waits for a full bucket instead of forever."""
+    bucket = AsyncTokenBucket(rate_per_minute=60000, capacity=10)
+    await bucket.acquire(10)
+
+    await asyncio.wait_for(bucket.acquire(1000), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_throttle_estimates_prompt_tokens(monkeypatch):
+    """Test throttling takes tokens from the provider bucket and skips unlimited providers."""
+    bucket = AsyncTokenBucket(rate_per_minute=60, capacity=100)
+    monkeypatch.setattr(rate_limiter, "_provider_buckets", {AIProvider.CLAUDE: bucket})
+
+    await throttle(AIProvider.CLAUDE, "x" * 200, "y" * 40)
+    await throttle(AIProvider.OPENAI, "x" * 10000)
+
+    assert bucket._tokens == pytest.approx(40, abs=1)
@@ -0,0 +1,203 @@
+"""Tests for semantic response cache."""
+
+import numpy as np
+import pytest
+
+from app.models.article import ErrorResponse
+from app.services.semantic_cache import SemanticCache
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client hash and sorted set commands."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+        self.ttls = {}
+
+    async def hget(self, name, key):
+        return self.hashes.get(name, {}).get(key)
+
+    async def zrevrange(self, name, start, end):
+        members = sorted(self.zsets.get(name, {}).items(), key=lambda item: item[1], reverse=True)
+        return [member.encode() for member, _ in members[start:end + 1]]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline that applies queued commands on execute."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hset(self, name, mapping):
+        self.commands.append(lambda: self.redis.hashes.setdefault(name, {}).update(mapping))
+
+    def hmget(self, name, *keys):
+        self.commands.append(lambda: [self.redis.hashes.get(name, {}).get(key) for key in keys])
+
+    def expire(self, name, ttl):
+        self.commands.append(lambda: self.redis.ttls.__setitem__(name, ttl))
+
+    def zadd(self, name, mapping):
+        self.commands.append(lambda: self.redis.zsets.setdefault(name, {}).update(mapping))
+
+    def zremrangebyscore(self, name, low, high):
+        def remove():
+            zset = self.redis.zsets.get(name, {})
+            for member in [m for m, score in zset.items() if score <= high]:
+                del zset[member]
+        self.commands.append(remove)
+
+    def zremrangebyrank(self, name, start, end):
+        def remove():
+            zset = self.redis.zsets.get(name, {})
+            ranked = sorted(zset, key=zset.get)
+            for member in ranked[start:len(ranked) + end + 1]:
+                del zset[member]
+        self.commands.append(remove)
+
+    async def execute(self):
+        return [command() for command in self.commands]
+
+
+def make_cache(redis):
+    """Create an enabled cache with a stubbed embedder."""
+    cache = SemanticCache(threshold=0.95, capacity=2, dimensions=2, ttl=60)
+    cache.enabled = True
+    cache._redis = redis
+    vectors = {
+        "nepal economy grows": [1.0, 0.0],
+        "nepal economy grows strongly": [0.99, 0.05],
+        "football match result": [0.0, 1.0],
+    }
+
+    async def embed(key, text):
+        vector = np.asarray(vectors[text], dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    cache._embed = embed
+    return cache
+
+
+@pytest.fixture
+def redis():
+    """Create a shared fake Redis."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def cache(redis):
+    """Create an enabled cache backed by the fake Redis."""
+    return make_cache(redis)
+
+
+@pytest.mark.asyncio
+async def test_exact_hit(cache):
+    """Test identical content is served from cache."""
+    value = ErrorResponse(error="cached")
+    await cache.set("ns", "nepal economy grows", value)
+
+    assert await cache.get("ns", "nepal economy grows") is value
+
+
+@pytest.mark.asyncio
+async def test_semantic_hit_and_miss(cache):
+    """Test near-duplicates hit and unrelated content misses."""
+    value = ErrorResponse(error="cached")
+    await cache.set("ns", "nepal economy grows", value)
+
+    assert await cache.get("ns", "nepal economy grows strongly") is value
+    assert await cache.get("ns", "football match result") is None
+
+
+@pytest.mark.asyncio
+async def test_namespaces_are_isolated(cache):
+    """Test entries are only reused within the same namespace."""
+    await cache.set("ns", "nepal economy grows", ErrorResponse(error="cached"))
+
+    assert await cache.get("other", "nepal economy grows") is None
+
+
+@pytest.mark.asyncio
+async def test_eviction(cache):
+    """Test oldest entry is evicted once capacity is reached."""
+    await cache.set("ns", "nepal economy grows", ErrorResponse(error="first"))
+    await cache.set("ns", "football match result", ErrorResponse(error="second"))
+    await cache.set("ns", "nepal economy grows strongly", ErrorResponse(error="third"))
+
+    assert (await cache.get("ns", "nepal economy grows")).error == "third"
+    assert (await cache.get("ns", "football match result")).error == "second"
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_is_noop(cache):
+    """Test disabled cache never stores or returns entries."""
+    cache.enabled = False
+    await cache.set("ns", "nepal economy grows", ErrorResponse(error="cached"))
+
+    assert await cache.get("ns", "nepal economy grows") is None
+
+
+@pytest.mark.asyncio
+async def test_entries_are_shared_through_redis(cache, redis):
+    """Test another process serves exact and near-duplicate hits from Redis."""
+    await cache.set("ns", "nepal economy grows", ErrorResponse(error="cached"))
+    assert set(redis.ttls.values()) == {60}
+
+    exact = make_cache(redis)
+    assert (await exact.get("ns", "nepal economy grows", ErrorResponse)).error == "cached"
+
+    near = make_cache(redis)
+    assert (await near.get("ns", "nepal economy grows strongly", ErrorResponse)).error == "cached"
+    assert await near.get("ns", "football match result", ErrorResponse) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_index_keeps_newest_entries(cache, redis):
+    """Test the shared index is capped and a new process loads the newest entries."""
+    await cache.set("ns", "nepal economy grows", ErrorResponse(error="first"))
+    await cache.set("ns", "football match result", ErrorResponse(error="second"))
+    await cache.set("ns", "nepal economy grows strongly", ErrorResponse(error="third"))
+
+    assert len(redis.zsets["semcache:v2:ns:index"]) == 2
+
+    fresh = make_cache(redis)
+    await fresh._load("ns", ErrorResponse)
+    loaded = {value.error for value in fresh._namespaces["ns"].values if value is not None}
+    assert loaded == {"second", "third"}
+
+
+@pytest.mark.asyncio
+async def test_stale_redis_entry_is_a_miss(cache, redis):
+    """Test an entry that no longer validates is ignored instead of raising."""
+    await cache.set("ns", "nepal economy grows", ErrorResponse(error="cached"))
+    for entry in redis.hashes.values():
+        entry["value"] = b'{"unexpected": true}'
+
+    fresh = make_cache(redis)
+    fresh._loaded.add("ns")
+    assert await fresh.get("ns", "nepal economy grows", ErrorResponse) is None
+
+
+@pytest.mark.asyncio
+async def test_exact_lookup_ignores_near_duplicates(cache, redis):
+    """Test exact-only entries are served for identical content but not near-duplicates."""
+    value = ErrorResponse(error="cached")
+    await cache.set("ns", "nepal economy grows", value, exact=True)
+
+    assert await cache.get("ns", "nepal economy grows", exact=True) is value
+    assert await cache.get("ns", "nepal economy grows strongly", exact=True) is None
+
+    shared = make_cache(redis)
+    assert (await shared.get("ns", "nepal economy grows", ErrorResponse, exact=True)).error == "cached"
+    assert "ns" not in shared._loaded
@@ -1,20 +1,59 @@
 """Tests for summarizer service."""
 
+import asyncio
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock
 
 from app.models.article import (
     SummarizeRequest,
     ArticleInput,
     SummaryLength,
+    LanguageCode,
     AIProvider,
 )
-from app.services.summarizer import SummarizerService
+from app.core.config import settings
+from app.services import summarizer as summarizer_module
+from app.services.summarizer import STOP_SEQUENCES, SummarizerService
+from app.services.summary_cache import SummaryCache
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+# Canned Claude reply shared by the stub client
+FAKE_MESSAGE = SimpleNamespace(
+    content=[SimpleNamespace(text="Summary text")],
+    usage=SimpleNamespace(input_tokens=100, output_tokens=50, cache_read_input_tokens=None),
+)
+
+
+class FakeAnthropic:
+    """Stand-in for the async Anthropic client returning FAKE_MESSAGE."""
+
+    def __init__(self):
+        self.messages = self
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return FAKE_MESSAGE
 
 
 @pytest.fixture
-def summarizer():
-    """Create summarizer service instance."""
+def summarizer(monkeypatch):
+    """Create summarizer service instance with the summary cache disabled."""
+    monkeypatch.setattr("app.services.summarizer.summary_cache.enabled", False)
     return SummarizerService()
 
 
@@ -46,6 +85,59 @@ def test_build_system_prompt(summarizer, sample_request):
     assert "key points" in prompt.lower()
 
 
+def test_output_limits(summarizer, sample_request):
+    """Test prompts end with the stop marker and English output is capped."""
+    short = sample_request.model_copy(update={"length": SummaryLength.SHORT, "key_points": False})
+    nepali = sample_request.model_copy(update={"language": LanguageCode.NE})
+
+    assert summarizer._build_system_prompt(sample_request).endswith(STOP_SEQUENCES[0])
+    assert summarizer._max_output_tokens(short) == 340
+    assert summarizer._max_output_tokens(sample_request) == 940
+    assert summarizer._max_output_tokens(nepali) == settings.max_tokens
+
+
+def test_system_prompts_are_shared(summarizer, sample_request):
+    """Test requests with the same options get the same prompt object."""
+    nepali = sample_request.model_copy(update={"language": LanguageCode.NE})
+
+    assert summarizer._build_system_prompt(sample_request) is summarizer._build_system_prompt(
+        sample_request.model_copy()
+    )
+    assert summarizer._build_system_prompt(nepali) is summarizer._build_system_prompt(nepali)
+    assert "NE language" in summarizer._build_system_prompt(nepali)
+
+
+def test_detect_category_from_keywords(summarizer, monkeypatch):
+    """Test the keyword automaton scores categories like a plain substring scan."""
+    samples = [
+        ("Prime Minister meets party leaders", "The government announced a new policy."),
+        ("", "Team wins the cricket match; stock market loss for the company."),
+        ("नेपाल सरकार", "प्रधानमन्त्री र मन्त्री संसदमा।"),
+        ("Weather", "Sunny skies expected."),
+    ]
+
+    detected = [summarizer._detect_category_from_keywords(t, c) for t, c in samples]
+    monkeypatch.setattr("app.services.summarizer._KEYWORD_AUTOMATON", None)
+    scanned = [summarizer._detect_category_from_keywords(t, c) for t, c in samples]
+
+    assert detected == scanned
+    assert detected[0] == "politics"
+    assert detected[2] == "politics"
+    assert detected[3] == "general"
+
+
+def test_detect_category_stops_once_a_category_dominates(summarizer):
+    """Test later content is not scanned after an early, clear lead."""
+    lead = "Election: the government and parliament debate the new policy. "
+    filler = "Nothing of note happened here today. " * 200
+    business = "The stock market, bank profit and trade investment rose. " * 3
+    boundary = "x" * (4096 - 4) + "cricket"
+
+    assert summarizer._detect_category_from_keywords("", lead + filler + business) == "politics"
+    assert summarizer._detect_category_from_keywords("", "Election day. " + filler + business) == "business"
+    assert summarizer._detect_category_from_keywords("", boundary) == "sports"
+
+
 def test_parse_response_with_markers(summarizer):
     """Test response parsing with markers."""
     content = """[SUMMARY]
@@ -66,6 +158,31 @@ Politics"""
     assert category == "politics"
 
 
+def test_parse_response_category_labels(summarizer):
+    """Test inline category labels are recognized and the marker takes priority."""
+    assert summarizer._parse_response("Text.\n**Category**: Sports", False)[2] == "sports"
+    assert summarizer._parse_response("Text.\ncategory - Health", False)[2] == "health"
+    content = "Category: Unknown\nCategory: Business\n[CATEGORY]\nTechnology"
+    assert summarizer._parse_response(content, False)[2] == "technology"
+
+
+def test_parse_response_bullet_styles(summarizer):
+    """Test key points parse from mixed bullet styles, with or without a summary marker."""
+    content = "Summary first.\r\n[KEY POINTS]\r\n• First point\r\n  * Second point\r\n-short\r\nNot a bullet\r\n"
+    summary, key_points, _ = summarizer._parse_response(content, True)
+    assert summary == "Summary first."
+    assert key_points == ["First point", "Second point"]
+
+
+def test_parse_response_summary_only(summarizer):
+    """Test a summary section without key points stops at the category marker."""
+    content = "Preamble\n[SUMMARY]\nOnly a summary.\n[CATEGORY]\nSports"
+    summary, key_points, category = summarizer._parse_response(content, True)
+    assert summary == "Only a summary."
+    assert key_points is None
+    assert category == "sports"
+
+
 def test_parse_response_without_markers(summarizer):
     """Test response parsing without markers."""
     content = "This is just the summary text."
@@ -76,31 +193,168 @@ def test_parse_response_without_markers(summarizer):
     assert category == "general"
 
 
+def test_truncate_content_keeps_head_and_tail(monkeypatch):
+    """Test content over the token budget keeps its beginning and end."""
+    monkeypatch.setattr(summarizer_module, "_get_encoding", lambda: None)
+    content = "a" * 4000 + "b" * 4000
+
+    truncated = summarizer_module._truncate_content(content, 1000)
+
+    assert summarizer_module._truncate_content("short article", 1000) == "short article"
+    assert summarizer_module._truncate_content(content, 0) == content
+    assert truncated.startswith("a" * 3000 + "\n...[truncated]...\n")
+    assert truncated.endswith("b" * 1000)
+    assert len(truncated) < 4100
+
+
+@pytest.mark.asyncio
+async def test_summarize_with_mock(monkeypatch):
+    """Test summarization with a stubbed API client."""
+    monkeypatch.setattr("app.services.summarizer.summary_cache.enabled", False)
+    client = FakeAnthropic()
+    service = SummarizerService(anthropic_client=client)
+
+    request = SummarizeRequest(
+        article=ArticleInput(content="Test article content"),
+        provider=AIProvider.CLAUDE,
+    )
+
+    response = await service.summarize(request)
+
+    assert response.summary == "Summary text"
+    assert response.provider == AIProvider.CLAUDE
+    assert len(client.calls) == 1
+    assert client.calls[0]["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_provider_call(summarizer, sample_request):
+    """Test identical in-flight requests are coalesced into one provider call."""
+    calls = []
+    release = asyncio.Event()
+
+    async def fake_claude(request):
+        calls.append(request)
+        await release.wait()
+        return "Summary text", None, "business"
+
+    summarizer._summarize_with_claude = fake_claude
+    other = sample_request.model_copy(update={"length": SummaryLength.SHORT})
+
+    pending = asyncio.gather(
+        summarizer.summarize(sample_request),
+        summarizer.summarize(sample_request),
+        summarizer.summarize(other),
+    )
+    await asyncio.sleep(0)
+    release.set()
+    first, second, third = await pending
+
+    assert len(calls) == 2
+    assert first is second
+    assert third.summary == "Summary text"
+    assert summarizer._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_yields_summary_before_done(summarizer, sample_request):
+    """Test streamed summary pieces join up to the parsed summary."""
+    output = "[SUMMARY]\nGrowth beat forecasts.\nExports rose.\n\n[KEY POINTS]\n- Tourism recovered fully\n\n[CATEGORY]\nBusiness"
+
+    async def fake_stream(request):
+        for start in range(0, len(output), 7):
+            yield output[start:start + 7]
+
+    summarizer._stream_text = fake_stream
+
+    events = [event async for event in summarizer.summarize_stream(sample_request)]
+
+    pieces = [event["text"] for event in events[:-1]]
+    assert all(event["event"] == "summary" for event in events[:-1])
+    assert len(pieces) > 1
+    assert "".join(pieces) == events[-1]["summary"] == "Growth beat forecasts.\nExports rose."
+    assert events[-1]["event"] == "done"
+    assert events[-1]["key_points"] == ["Tourism recovered fully"]
+    assert events[-1]["category"] == "business"
+
+
 @pytest.mark.asyncio
-async def test_summarize_with_mock():
-    """Test summarization with mocked API."""
-    with patch("app.services.summarizer.Anthropic") as mock_anthropic:
-        # Setup mock
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.content = [Mock(text="Summary text")]
-        mock_response.usage = Mock(input_tokens=100, output_tokens=50)
-        mock_client.messages.create = Mock(return_value=mock_response)
-        mock_anthropic.return_value = mock_client
-
-        # Create service and request
-        service = SummarizerService()
-        service.anthropic_client = mock_client
-
-        request = SummarizeRequest(
-            article=ArticleInput(content="Test article content"),
-            provider=AIProvider.CLAUDE,
-        )
-
-        # Execute
-        response = await service.summarize(request)
-
-        # Verify
-        assert response.summary == "Summary text"
-        assert response.provider == AIProvider.CLAUDE
-        assert mock_client.messages.create.called
+async def test_race_uses_first_successful_provider(summarizer, sample_request):
+    """Test racing providers returns the fastest success and cancels the rest."""
+    cancelled = asyncio.Event()
+
+    async def slow_claude(request):
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cancelled.set()
+
+    async def failing_gemini(request):
+        raise RuntimeError("rate limited")
+
+    async def fast_openai(request):
+        await asyncio.sleep(0)
+        return "OpenAI summary", None, "business"
+
+    summarizer.anthropic_client = summarizer.openai_client = summarizer.gemini_client = Mock()
+    summarizer._summarize_with_claude = slow_claude
+    summarizer._summarize_with_openai = fast_openai
+    summarizer._summarize_with_gemini = failing_gemini
+
+    response = await summarizer.summarize(sample_request.model_copy(update={"race": True}))
+    await asyncio.sleep(0)
+
+    assert response.summary == "OpenAI summary"
+    assert response.provider == AIProvider.OPENAI
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_provider_calls_are_limited(summarizer, sample_request):
+    """Test calls beyond the provider limit wait for a free slot."""
+    active = []
+    peak = []
+
+    async def fake_create(**kwargs):
+        active.append(1)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        return FAKE_MESSAGE
+
+    summarizer.anthropic_client = FakeAnthropic()
+    summarizer.anthropic_client.create = fake_create
+    summarizer._provider_limits[AIProvider.CLAUDE] = asyncio.Semaphore(2)
+    requests = [
+        sample_request.model_copy(update={"article": ArticleInput(content=f"Article number {i} " * 10)})
+        for i in range(5)
+    ]
+
+    await asyncio.gather(*(summarizer._summarize_with_claude(r) for r in requests))
+
+    assert len(peak) == 5
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_summary_cache_hit_skips_provider(summarizer, sample_request, monkeypatch):
+    """Test a repeated article is served from the summary cache."""
+    calls = []
+
+    async def fake_claude(request):
+        calls.append(request)
+        return "Summary text", None, "business"
+
+    cache = SummaryCache()
+    cache.enabled = True
+    cache._redis = FakeRedis()
+    monkeypatch.setattr(summarizer_module, "summary_cache", cache)
+    summarizer._summarize_with_claude = fake_claude
+
+    first = await summarizer.summarize(sample_request)
+    second = await summarizer.summarize(sample_request)
+    other = await summarizer.summarize(sample_request.model_copy(update={"length": SummaryLength.SHORT}))
+
+    assert len(calls) == 2
+    assert second.summary == first.summary
+    assert other.summary == "Summary text"
@@ -0,0 +1,93 @@
+"""Tests for translation cache."""
+
+import pytest
+
+from app.models.article import TranslateRequest, TranslateResponse, LanguageCode, AIProvider
+from app.services.response_cache import ResponseCache
+from app.services.translation_cache import TranslationCache
+
+
+def make_request(**overrides) -> TranslateRequest:
+    """Build a translation request."""
+    fields = {"content": "Thank you", "target_language": "es", "provider": "claude"}
+    fields.update(overrides)
+    return TranslateRequest(**fields)
+
+
+def make_response(text: str = "Gracias") -> TranslateResponse:
+    """Build a translation response."""
+    return TranslateResponse(
+        translated_content=text,
+        source_language=LanguageCode.EN,
+        target_language=LanguageCode.ES,
+        provider=AIProvider.CLAUDE,
+        model="test",
+        processing_time=0.5,
+    )
+
+
+@pytest.fixture
+def cache(fake_redis):
+    """Create an enabled cache backed by a fake Redis."""
+    cache = TranslationCache(capacity=2)
+    cache.enabled = True
+    cache._redis = fake_redis
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_local_hit(cache):
+    """Test a stored translation is served from process memory."""
+    response = make_response()
+    await cache.set(make_request(), response)
+
+    assert await cache.get(make_request()) is response
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_after_local_eviction(cache):
+    """Test evicted entries are recovered from Redis."""
+    await cache.set(make_request(), make_response())
+    await cache.set(make_request(content="Hello"), make_response("Hola"))
+    await cache.set(make_request(content="Goodbye"), make_response("Adiós"))
+
+    cached = await cache.get(make_request())
+    assert cached.translated_content == "Gracias"
+
+
+@pytest.mark.asyncio
+async def test_key_covers_request_options(cache):
+    """Test requests differing in options do not share entries."""
+    await cache.set(make_request(), make_response())
+
+    assert await cache.get(make_request(target_language="fr")) is None
+    assert await cache.get(make_request(provider="openai")) is None
+    assert await cache.get(make_request(preserve_formatting=False)) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_degrades_to_miss(cache):
+    """Test Redis errors are treated as cache misses."""
+    cache._redis.fail = True
+    await cache.set(make_request(), make_response())
+    cache._local.clear()
+
+    assert await cache.get(make_request()) is None
+
+
+@pytest.mark.asyncio
+async def test_stale_redis_entry_is_deleted(cache):
+    """Test an entry that no longer validates is dropped and treated as a miss."""
+    await cache.set(make_request(), make_response())
+    cache._local.clear()
+    for key in cache._redis.data:
+        cache._redis.data[key] = b'{"unexpected": true}'
+
+    assert await cache.get(make_request()) is None
+    assert cache._redis.data == {}
+
+
+def test_base_cache_requires_key():
+    """Test the base cache cannot be used without a key builder."""
+    with pytest.raises(TypeError):
+        ResponseCache(capacity=1, ttl=1)
@@ -0,0 +1,205 @@
+"""Tests for translator service."""
+
+import asyncio
+import re
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.models.article import TranslateRequest, LanguageCode, AIProvider
+from app.services.translator import TranslatorService, SEGMENT_MAX_CHARS
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    """Create translator service with the translation cache disabled."""
+    monkeypatch.setattr("app.services.translator.translation_cache.enabled", False)
+    return TranslatorService()
+
+
+def make_request(content: str, target: str = "es", source: str = None) -> TranslateRequest:
+    """Build a translation request."""
+    return TranslateRequest(
+        content=content, source_language=source, target_language=target, provider="claude"
+    )
+
+
+def test_split_segments(translator):
+    """Test multi-segment output is mapped back by marker index."""
+    text = "<<<SEG:1>>>\nAdiós\n<<<SEG:0>>>\nHola\n"
+    assert translator._split_segments(text, 2) == ["Hola", "Adiós"]
+    assert translator._split_segments("<<<SEG:0>>>\nHola", 2) is None
+    assert translator._split_segments("Hola", 1) is None
+
+
+def test_system_prompts_are_shared(translator):
+    """Test requests with the same languages and formatting share one prompt."""
+    first = translator._build_system_prompt(make_request("Hello", source="en"))
+    second = translator._build_system_prompt(make_request("Goodbye", source="en"))
+    detected = translator._build_system_prompt(make_request("Hello"))
+
+    assert first is second
+    assert "Translate from English to Spanish" in first
+    assert "Automatically detect the source language" in detected
+
+
+@pytest.mark.asyncio
+async def test_translate_segments_groups_calls(translator):
+    """Test short items with the same options share one provider call."""
+    calls = []
+
+    async def fake_claude(request, system_prompt):
+        calls.append(request.target_language)
+        if "<<<SEG:" not in request.content:
+            return f"[{request.target_language.value}] {request.content}"
+        segments = re.findall(r"<<<SEG:(\d+)>>>\n(.*)", request.content)
+        return "\n".join(f"<<<SEG:{i}>>>\n[{request.target_language.value}] {text}" for i, text in segments)
+
+    translator._providers[AIProvider.CLAUDE] = (fake_claude, "claude-test")
+    requests = [
+        make_request("Hello"),
+        make_request("Thank you"),
+        make_request("Welcome", target="fr"),
+        make_request("x" * (SEGMENT_MAX_CHARS + 1)),
+        make_request("Goodbye"),
+    ]
+
+    results = await translator.translate_segments(requests)
+
+    assert [r.translated_content for r in results[:3]] == ["[es] Hello", "[es] Thank you", "[fr] Welcome"]
+    assert results[4].translated_content == "[es] Goodbye"
+    assert results[3].target_language == LanguageCode.ES
+    # One combined call for es, one single call for fr, one for the long item
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_translate_segments_falls_back_when_markers_lost(translator):
+    """Test items are retried individually if the model drops markers."""
+    async def fake_claude(request, system_prompt):
+        return "garbled" if "<<<SEG:" in request.content else f"ok: {request.content}"
+
+    translator._providers[AIProvider.CLAUDE] = (fake_claude, "claude-test")
+
+    results = await translator.translate_segments([make_request("Hello"), make_request("Bye")])
+
+    assert [r.translated_content for r in results] == ["ok: Hello", "ok: Bye"]
+
+
+@pytest.mark.asyncio
+async def test_translate_segments_fallback_keeps_per_item_results(translator):
+    """Test one failing retry does not replace the other items' translations."""
+    async def fake_claude(request, system_prompt):
+        if "<<<SEG:" in request.content:
+            return "garbled"
+        if request.content == "Bye":
+            raise RuntimeError("provider error")
+        return f"ok: {request.content}"
+
+    translator._providers[AIProvider.CLAUDE] = (fake_claude, "claude-test")
+
+    results = await translator.translate_segments(
+        [make_request("Hello"), make_request("Bye"), make_request("Thanks")]
+    )
+
+    assert results[0].translated_content == "ok: Hello"
+    assert isinstance(results[1], Exception)
+    assert results[2].translated_content == "ok: Thanks"
+
+
+@pytest.mark.asyncio
+async def test_translate_same_language_skips_provider(translator):
+    """Test identity translations return the content without a provider call."""
+    async def fail_claude(request, system_prompt):
+        raise AssertionError("provider should not be called")
+
+    translator._providers[AIProvider.CLAUDE] = (fail_claude, "claude-test")
+
+    response = await translator.translate(make_request("Hola", target="es", source="es"))
+    results = await translator.translate_segments([make_request("Adiós", target="es", source="es")])
+
+    assert response.translated_content == "Hola"
+    assert response.model == "noop"
+    assert results[0].translated_content == "Adiós"
+    assert translator.passthrough_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_with_claude_awaits_async_client(translator):
+    """Test the Claude call is awaited on the async client."""
+    response = Mock(content=[Mock(text=" Hola ")], usage=Mock(input_tokens=10, output_tokens=5))
+    translator.anthropic_client = Mock()
+    translator.anthropic_client.messages.create = AsyncMock(return_value=response)
+
+    result = await translator.translate(make_request("Hello"))
+
+    assert result.translated_content == "Hola"
+    translator.anthropic_client.messages.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_translate_batch_bounds_concurrency(translator):
+    """Test batch items run concurrently up to the limit and failures are kept."""
+    in_flight = []
+    peak = []
+
+    async def fake_claude(request, system_prompt):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        if request.content == "fail":
+            raise ValueError("boom")
+        return f"ok: {request.content}"
+
+    translator._providers[AIProvider.CLAUDE] = (fake_claude, "claude-test")
+    requests = [make_request(text) for text in ["a", "b", "fail", "c", "d"]]
+
+    results = await translator.translate_batch(requests, max_concurrency=2)
+
+    assert max(peak) == 2
+    assert [r.translated_content for r in results if not isinstance(r, Exception)] == [
+        "ok: a", "ok: b", "ok: c", "ok: d"
+    ]
+    assert isinstance(results[2], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_translate_stream_yields_text_before_done(translator):
+    """Test streamed pieces join up to the final stripped translation."""
+    async def fake_stream(request):
+        for chunk in ["  Hola", " ", "mundo", "\n"]:
+            yield chunk
+
+    translator._stream_text = fake_stream
+
+    events = [event async for event in translator.translate_stream(make_request("Hello world"))]
+
+    assert [event["event"] for event in events] == ["translation", "translation", "done"]
+    assert "".join(event["text"] for event in events[:-1]) == events[-1]["translated_content"] == "Hola mundo"
+
+
+def test_detected_source_matching_target_skips_provider(translator, monkeypatch):
+    """Test content already in the target language is returned untranslated."""
+    monkeypatch.setattr(
+        "app.services.translator.language_detector.detect", AsyncMock(return_value=("es", 0.97))
+    )
+    fake_claude = AsyncMock()
+    translator._providers[AIProvider.CLAUDE] = (fake_claude, "claude-test")
+
+    response = asyncio.run(translator.translate(make_request("Hola, ¿cómo estás?")))
+
+    assert response.translated_content == "Hola, ¿cómo estás?"
+    assert response.source_language == LanguageCode.ES
+    fake_claude.assert_not_called()
+
+
+def test_low_confidence_detection_is_left_to_provider(translator, monkeypatch):
+    """Test uncertain detections do not set the source language."""
+    monkeypatch.setattr(
+        "app.services.translator.language_detector.detect", AsyncMock(return_value=("es", 0.4))
+    )
+
+    request = asyncio.run(translator._resolve_source(make_request("Hola")))
+
+    assert request.source_language is None